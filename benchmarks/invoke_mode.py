@@ -0,0 +1,163 @@
+"""
+Compare non-streaming invoke modes on deep, message-heavy graphs.
+
+Run it from the repository root::
+
+    uv run python -m benchmarks.invoke_mode --depth 50 --history 500
+
+Each graph chains ``--depth`` nodes, nested in ``--nesting`` subgraph levels,
+over a pydantic message state seeded with ``--history`` messages. Every node
+appends one message and emits one custom event, so ``InvokeMode.VALUES`` has to
+coerce and yield the full state after every superstep.
+
+The modes alternate over ``--rounds`` rounds of ``--repeat`` calls each, so load
+on the machine reaches both alike. The report gives each mode's median latency
+over all calls and the median and range of the per-round speedups; a range that
+spans 1.00x means the modes are not told apart on this graph.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Annotated, Any
+
+from langchain_core.messages import AIMessage, AnyMessage
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from pydantic import BaseModel
+
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.graph.graph_registry import (
+    GraphConfig,
+    GraphRegistry,
+    InvokeMode,
+)
+from langgraph_openai_serve.graph.runner import run_langgraph
+
+_MODEL = "deep"
+
+
+class DeepState(BaseModel):
+    """Message state coerced to a model on every ``values`` event."""
+
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+def build_deep_graph(depth: int, nesting: int) -> Any:
+    """Build a chain of ``depth`` nodes nested in ``nesting`` subgraph levels."""
+
+    def step(index: int) -> Any:
+        def node(_state: DeepState) -> dict[str, Any]:
+            get_stream_writer()({"type": "status", "data": {"step": index}})
+            return {"messages": [AIMessage(content=f"step {index}")]}
+
+        return node
+
+    builder = StateGraph(DeepState)
+    for index in range(depth):
+        builder.add_node(f"step_{index}", step(index))
+        if index:
+            builder.add_edge(f"step_{index - 1}", f"step_{index}")
+    graph = builder.set_entry_point("step_0").set_finish_point(f"step_{depth - 1}")
+
+    compiled = graph.compile()
+    for _ in range(nesting):
+        compiled = (
+            StateGraph(DeepState)
+            .add_node("nested", compiled)
+            .set_entry_point("nested")
+            .set_finish_point("nested")
+            .compile()
+        )
+    return compiled
+
+
+def build_request(history: int) -> ChatCompletionRequest:
+    """Build a request whose history alternates user and assistant messages."""
+    messages = [
+        {"role": "user" if index % 2 == 0 else "assistant", "content": f"m{index}"}
+        for index in range(history)
+    ]
+    messages.append({"role": "user", "content": "question"})
+    return ChatCompletionRequest(model=_MODEL, messages=messages)
+
+
+def _registry(mode: InvokeMode, graph: Any) -> GraphRegistry:
+    return GraphRegistry(
+        registry={
+            _MODEL: GraphConfig(
+                graph=graph,
+                description="Deep benchmark graph",
+                output_to_text=lambda output: str(output.messages[-1].content),
+                invoke_mode=mode,
+            )
+        }
+    )
+
+
+async def measure(
+    graph_registry: GraphRegistry,
+    request: ChatCompletionRequest,
+    repeat: int,
+) -> list[float]:
+    """Return the wall time in seconds of ``repeat`` invocations."""
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await run_langgraph(_MODEL, request.messages, graph_registry, request)
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    """Print each mode's latency and the spread of the per-round speedups."""
+    graph = build_deep_graph(arguments.depth, arguments.nesting)
+    request = build_request(arguments.history)
+    registries = {mode: _registry(mode, graph) for mode in InvokeMode}
+    print(
+        f"depth={arguments.depth} nesting={arguments.nesting} "
+        f"history={arguments.history} rounds={arguments.rounds} "
+        f"repeat={arguments.repeat}"
+    )
+
+    # One warm-up call per mode keeps first-use imports out of the measurements.
+    for graph_registry in registries.values():
+        await run_langgraph(_MODEL, request.messages, graph_registry, request)
+
+    timings: dict[InvokeMode, list[float]] = {mode: [] for mode in InvokeMode}
+    speedups = []
+    for round_index in range(arguments.rounds):
+        # Alternate which mode goes first so neither always runs on a warm heap.
+        modes = list(InvokeMode) if round_index % 2 == 0 else list(InvokeMode)[::-1]
+        medians = {}
+        for mode in modes:
+            round_timings = await measure(registries[mode], request, arguments.repeat)
+            timings[mode].extend(round_timings)
+            medians[mode] = statistics.median(round_timings)
+        speedups.append(medians[InvokeMode.VALUES] / medians[InvokeMode.FINAL])
+
+    for mode in InvokeMode:
+        print(
+            f"{mode.value:>6}: median {statistics.median(timings[mode]) * 1000:8.2f} ms"
+        )
+    print(
+        f"speedup: median {statistics.median(speedups):.2f}x "
+        f"(rounds {min(speedups):.2f}x to {max(speedups):.2f}x)"
+    )
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse benchmark dimensions from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--nesting", type=int, default=2)
+    parser.add_argument("--history", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
@@ -0,0 +1,439 @@
+"""
+Load-test the OpenAI API in-process with fake streaming graphs.
+
+Run it from the repository root::
+
+    uv run python -m benchmarks.load --requests 500 --concurrency 32
+
+The harness mounts ``LanggraphOpenaiServe`` on a host app and drives it over
+ASGI without sockets or network access, so releases can be compared on the same
+hardware. Each request runs a chain of ``--depth`` nodes, nested in
+``--nesting`` subgraph levels, whose last node streams ``--tokens`` words from
+the fake model in ``utils.fake_llm``. The model streams words and whitespace as
+separate chunks, paced at ``--token-rate`` chunks per second, and emits a
+progress client event every ``--event-every`` chunks.
+
+``--stream-ratio`` of the requests stream and the rest do not. Time to first
+token (TTFT) and inter-token latency (ITL) are measured on the ASGI messages of
+streamed requests, latency on every request. CPU per token divides the CPU time
+of this process, which also runs the client, by the completion tokens the
+responses report.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from typing import Annotated, Any, TypedDict
+
+from fastapi import FastAPI
+from langchain_core.messages import AIMessage, AnyMessage
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+
+from langgraph_openai_serve import (
+    GraphConfig,
+    GraphFeature,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+    client_event,
+)
+from langgraph_openai_serve.utils.fake_llm import stream_fake_chat_response
+
+_MODEL = "load"
+_PATH = "/v1/chat/completions"
+_STREAM_EVENTS_METADATA = {"langgraph_stream_events": "v1"}
+
+
+class LoadState(TypedDict):
+    """Message state of the synthetic load graph."""
+
+    messages: Annotated[list[AnyMessage], add_messages]
+
+
+@dataclass(frozen=True)
+class GraphShape:
+    """Dimensions of the synthetic graph every request runs."""
+
+    tokens: int
+    token_rate: float
+    depth: int
+    nesting: int
+    event_every: int
+
+
+def build_load_graph(shape: GraphShape) -> Any:
+    """Build a chain of pass-through nodes ending in a streaming fake model."""
+    response = " ".join(f"token{index}" for index in range(shape.tokens))
+    chunk_delay = 1 / shape.token_rate if shape.token_rate else 0.0
+
+    async def generate(state: LoadState) -> dict[str, Any]:
+        on_chunk = None
+        if shape.event_every:
+            write = get_stream_writer()
+
+            def on_chunk(index: int) -> None:
+                if index % shape.event_every == 0:
+                    write(client_event("progress", {"chunk": index}))
+
+        answer = await stream_fake_chat_response(
+            response,
+            str(state["messages"][-1].content),
+            chunk_delay=chunk_delay,
+            on_chunk=on_chunk,
+        )
+        return {"messages": [AIMessage(content=answer)]}
+
+    def step(_state: LoadState) -> dict[str, Any]:
+        return {}
+
+    builder = StateGraph(LoadState)
+    previous = None
+    for index in range(shape.depth):
+        builder.add_node(f"step_{index}", step)
+        if previous is not None:
+            builder.add_edge(previous, f"step_{index}")
+        previous = f"step_{index}"
+    builder.add_node("generate", generate)
+    if previous is not None:
+        builder.add_edge(previous, "generate")
+    builder.set_entry_point("step_0" if shape.depth else "generate")
+
+    compiled = builder.set_finish_point("generate").compile()
+    for _ in range(shape.nesting):
+        compiled = (
+            StateGraph(LoadState)
+            .add_node("nested", compiled)
+            .set_entry_point("nested")
+            .set_finish_point("nested")
+            .compile()
+        )
+    return compiled
+
+
+def build_app(shape: GraphShape) -> FastAPI:
+    """Mount the OpenAI API for the synthetic graph on a new host app."""
+    registry = GraphRegistry(
+        registry={
+            _MODEL: GraphConfig(
+                graph=build_load_graph(shape),
+                description="Synthetic load graph",
+                streamable_node_names=["generate"],
+                features=[GraphFeature.CLIENT_EVENTS],
+            )
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+@dataclass
+class RequestTrace:
+    """When one response started, streamed content and finished."""
+
+    stream: bool
+    status_code: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: float = 0.0
+    token_times: list[float] = field(default_factory=list)
+    completion_tokens: int = 0
+
+    @property
+    def latency(self) -> float:
+        """Seconds from sending the request to the end of its response."""
+        return self.finished - self.started
+
+
+def _read_events(body: bytes, trace: RequestTrace) -> None:
+    received = time.perf_counter()
+    for line in body.splitlines():
+        if not line.startswith(b"data: {"):
+            continue
+        chunk = json.loads(line.removeprefix(b"data: "))
+        for choice in chunk["choices"]:
+            if choice.get("delta", {}).get("content"):
+                trace.token_times.append(received)
+        if chunk.get("usage"):
+            trace.completion_tokens = chunk["usage"]["completion_tokens"]
+
+
+async def send_completion(
+    app: FastAPI,
+    payload: dict[str, Any],
+) -> RequestTrace:
+    """Send one chat completion over ASGI and time its response messages."""
+    trace = RequestTrace(stream=bool(payload.get("stream")))
+    body = json.dumps(payload).encode()
+    response_complete = asyncio.Event()
+    request_sent = False
+    buffered = bytearray()
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:  # ruff: ignore[unused-async]
+        if message["type"] == "http.response.start":
+            trace.status_code = message["status"]
+            return
+        chunk = message.get("body", b"")
+        if trace.stream:
+            _read_events(chunk, trace)
+        else:
+            buffered.extend(chunk)
+        if not message.get("more_body"):
+            trace.finished = time.perf_counter()
+            response_complete.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": _PATH,
+        "raw_path": _PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"benchmark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+        "state": {},
+    }
+    await app(scope, receive, send)
+    if not trace.stream and trace.status_code == HTTPStatus.OK:
+        trace.completion_tokens = json.loads(buffered)["usage"]["completion_tokens"]
+    return trace
+
+
+def build_payloads(
+    requests: int,
+    stream_ratio: float,
+    *,
+    client_events: bool,
+    seed: int,
+) -> list[dict[str, Any]]:
+    """Build a reproducible mix of streaming and non-streaming requests."""
+    rng = random.Random(seed)  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+    payloads = []
+    for index in range(requests):
+        payload: dict[str, Any] = {
+            "model": _MODEL,
+            "messages": [{"role": "user", "content": f"request {index}"}],
+        }
+        if rng.random() < stream_ratio:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+            if client_events:
+                payload["metadata"] = _STREAM_EVENTS_METADATA
+        payloads.append(payload)
+    return payloads
+
+
+async def drive(
+    app: FastAPI,
+    payloads: Iterable[dict[str, Any]],
+    concurrency: int,
+) -> list[RequestTrace]:
+    """Send every payload from ``concurrency`` concurrent clients."""
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+    traces: list[RequestTrace] = []
+
+    async def client() -> None:
+        while not queue.empty():
+            traces.append(await send_completion(app, queue.get_nowait()))
+
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(concurrency):
+            task_group.create_task(client())
+    return traces
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return the p50, p90 and p99 of ``samples`` in milliseconds."""
+    if not samples:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0}
+    if len(samples) == 1:
+        cuts = samples * 99
+    else:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p90": round(cuts[89] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+    }
+
+
+@dataclass
+class LoadReport:
+    """Throughput, latency and resource use of one load run."""
+
+    requests: int
+    failures: int
+    streamed: int
+    seconds: float
+    requests_per_second: float
+    tokens: int
+    latency_ms: dict[str, float]
+    ttft_ms: dict[str, float]
+    itl_ms: dict[str, float]
+    cpu_us_per_token: float
+    peak_rss_mib: float
+
+
+def summarize(
+    traces: list[RequestTrace],
+    seconds: float,
+    cpu_seconds: float,
+) -> LoadReport:
+    """Combine request traces into a load report."""
+    streamed = [trace for trace in traces if trace.stream and trace.token_times]
+    tokens = sum(trace.completion_tokens for trace in traces)
+    gaps = [
+        later - earlier
+        for trace in streamed
+        for earlier, later in zip(
+            trace.token_times, trace.token_times[1:], strict=False
+        )
+    ]
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mib = peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return LoadReport(
+        requests=len(traces),
+        failures=sum(trace.status_code != HTTPStatus.OK for trace in traces),
+        streamed=len(streamed),
+        seconds=round(seconds, 3),
+        requests_per_second=round(len(traces) / seconds, 2),
+        tokens=tokens,
+        latency_ms=percentiles([trace.latency for trace in traces]),
+        ttft_ms=percentiles(
+            [trace.token_times[0] - trace.started for trace in streamed]
+        ),
+        itl_ms=percentiles(gaps),
+        cpu_us_per_token=round(cpu_seconds / max(tokens, 1) * 1_000_000, 2),
+        peak_rss_mib=round(peak_rss_mib, 1),
+    )
+
+
+async def run_load(
+    shape: GraphShape,
+    payloads: list[dict[str, Any]],
+    *,
+    concurrency: int,
+    warmup: int,
+) -> LoadReport:
+    """Run the host lifespan, warm the server up and measure the payloads."""
+    app = build_app(shape)
+    async with app.router.lifespan_context(app):
+        # Warm-up requests keep first-use imports and graph compilation out of
+        # the measurements.
+        await drive(app, payloads[:warmup], concurrency)
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        traces = await drive(app, payloads, concurrency)
+        seconds = time.perf_counter() - started
+        cpu_seconds = time.process_time() - cpu_started
+    return summarize(traces, seconds, cpu_seconds)
+
+
+def print_report(report: LoadReport, write: Callable[[str], object] = print) -> None:
+    """Print a load report as aligned text."""
+    write(
+        f"requests {report.requests} ({report.streamed} streamed, "
+        f"{report.failures} failed) in {report.seconds:.2f} s: "
+        f"{report.requests_per_second:.1f} req/s"
+    )
+    for name, values in (
+        ("latency", report.latency_ms),
+        ("ttft", report.ttft_ms),
+        ("itl", report.itl_ms),
+    ):
+        write(
+            f"{name:>8}: "
+            + "  ".join(f"{cut} {value:9.3f} ms" for cut, value in values.items())
+        )
+    write(
+        f"     cpu: {report.cpu_us_per_token:.2f} us/token over {report.tokens} tokens"
+    )
+    write(f"     rss: {report.peak_rss_mib:.1f} MiB peak")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    """Run the load test and print its report."""
+    shape = GraphShape(
+        tokens=arguments.tokens,
+        token_rate=arguments.token_rate,
+        depth=arguments.depth,
+        nesting=arguments.nesting,
+        event_every=arguments.event_every,
+    )
+    payloads = build_payloads(
+        arguments.requests,
+        arguments.stream_ratio,
+        client_events=bool(arguments.event_every),
+        seed=arguments.seed,
+    )
+    report = await run_load(
+        shape,
+        payloads,
+        concurrency=arguments.concurrency,
+        warmup=arguments.warmup,
+    )
+    if arguments.json:
+        print(json.dumps({"shape": asdict(shape), **asdict(report)}, indent=2))
+    else:
+        print(
+            f"tokens={shape.tokens} token_rate={shape.token_rate} "
+            f"depth={shape.depth} nesting={shape.nesting} "
+            f"event_every={shape.event_every} concurrency={arguments.concurrency}"
+        )
+        print_report(report)
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse load and graph dimensions from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stream-ratio", type=float, default=0.5)
+    parser.add_argument("--tokens", type=int, default=64)
+    parser.add_argument(
+        "--token-rate",
+        type=float,
+        default=0.0,
+        help="fake model chunks per second; 0 streams them unpaced",
+    )
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--nesting", type=int, default=0)
+    parser.add_argument(
+        "--event-every",
+        type=int,
+        default=0,
+        help="emit a client event every N chunks; 0 emits none",
+    )
+    parser.add_argument("--warmup", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
@@ -0,0 +1,432 @@
+"""
+Time hot request helpers and compare them with a locally stored baseline.
+
+Run it from the repository root::
+
+    uv run python -m benchmarks.micro run
+    uv run python -m benchmarks.micro run --output benchmarks/baselines/micro.json
+    uv run python -m benchmarks.micro compare benchmarks/baselines/micro.json
+
+Every case is timed like ``timeit``: the iteration count is calibrated so one
+round takes at least ``--min-time`` seconds, and the median of ``--rounds``
+rounds is kept as the per-call time. The garbage collector is paused while a
+round runs. ``compare`` times the cases ``--repeats`` times, or reads a second
+results file, and exits with status 1 when a case's median is more than
+``--threshold`` slower than its baseline in every repeat, so a single noisy
+repeat does not fail it. Baselines are only comparable on the same hardware and
+Python, so they are not committed: store one with ``run --output`` on the
+commit you compare against.
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from pathlib import Path
+from typing import Any, TypedDict
+
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import StateGraph
+
+from langgraph_openai_serve import ClientSettings, client_event
+from langgraph_openai_serve.api.chat.schemas import (
+    ChatCompletionRequest,
+    ChatCompletionRequestMessage,
+)
+from langgraph_openai_serve.api.chat.utils.interrupts import (
+    INTERRUPT_TOOL_NAME,
+    interrupt_arguments,
+    interrupt_tool_call_id,
+    parse_resume_request,
+)
+from langgraph_openai_serve.api.chat.utils.responses import (
+    ChatCompletionStreamResponseBuilder,
+)
+from langgraph_openai_serve.graph.client_settings import (
+    RUNTIME_SETTINGS_METADATA_KEY,
+)
+from langgraph_openai_serve.graph.events import client_event_extension
+from langgraph_openai_serve.graph.interrupt.state import checkpoint_state_token
+from langgraph_openai_serve.utils.message import convert_to_lc_messages
+
+BASELINE_SCHEMA_VERSION = 1
+CHECKPOINT_TUPLE_COUNTS = (10, 100, 1000)
+_THREAD_ID = "benchmark"
+
+Case = Callable[[], object] | Callable[[], Awaitable[object]]
+CASES: dict[str, Callable[[], Case]] = {}
+
+
+def case(name: str) -> Callable[[Callable[[], Case]], Callable[[], Case]]:
+    """Register a setup function that returns the call to time."""
+
+    def register(setup: Callable[[], Case]) -> Callable[[], Case]:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@case("stream_builder.text")
+def _stream_text() -> Case:
+    builder = ChatCompletionStreamResponseBuilder("benchmark")
+    return lambda: builder.text("Streamed tokens are mostly short words, ", 0)
+
+
+@case("stream_builder.client_event")
+def _stream_client_event() -> Case:
+    builder = ChatCompletionStreamResponseBuilder("benchmark")
+    extension = client_event_extension(_progress_event())
+    if extension is None:
+        msg = "The benchmark progress event is not a client event."
+        raise RuntimeError(msg)
+    return lambda: builder.client_event(extension, 0)
+
+
+@case("stream_builder.finish")
+def _stream_finish() -> Case:
+    builder = ChatCompletionStreamResponseBuilder("benchmark")
+    return lambda: builder.finish("stop", index=0)
+
+
+@case("convert_to_lc_messages.tool_history_200")
+def _convert_tool_history() -> Case:
+    messages = _tool_history(50)
+    return lambda: convert_to_lc_messages(messages)
+
+
+@case("parse_resume_request.three_interrupts")
+def _parse_resume() -> Case:
+    messages = [*_tool_history(10), *_resume_exchange(3)]
+    return lambda: parse_resume_request(messages)
+
+
+class _BenchmarkSettings(ClientSettings):
+    temperature: float = 0.2
+    max_steps: int = 8
+    style: str = "concise"
+    tags: tuple[str, ...] = ()
+
+
+@case("client_settings.validate_request")
+def _validate_client_settings() -> Case:
+    request = ChatCompletionRequest(
+        model="benchmark",
+        messages=[{"role": "user", "content": "hello"}],
+        metadata={
+            RUNTIME_SETTINGS_METADATA_KEY: json.dumps(
+                {"temperature": 0.7, "tags": ["a", "b"]}
+            )
+        },
+    )
+    return lambda: _BenchmarkSettings.validate_request(request)
+
+
+@case("client_event_extension.progress")
+def _client_event_extension() -> Case:
+    event = _progress_event()
+    return lambda: client_event_extension(event)
+
+
+def _checkpoint_state_token_case(tuples: int) -> Callable[[], Case]:
+    def setup() -> Case:
+        graph = _checkpointed_graph(tuples)
+        config = {"configurable": {"thread_id": _THREAD_ID}}
+        return lambda: checkpoint_state_token(graph, config)
+
+    return setup
+
+
+for _tuples in CHECKPOINT_TUPLE_COUNTS:
+    case(f"checkpoint_state_token.in_memory_{_tuples}")(
+        _checkpoint_state_token_case(_tuples)
+    )
+
+
+def _progress_event() -> dict[str, object]:
+    return client_event(
+        "progress",
+        {"stage": "retrieval", "completed": 2, "total": 5},
+        namespace=("research",),
+    )
+
+
+def _tool_history(turns: int) -> list[ChatCompletionRequestMessage]:
+    """Build ``turns`` user, tool-calling assistant, tool and answer messages."""
+    messages = []
+    for turn in range(turns):
+        call_id = f"call_{turn}"
+        messages.extend(
+            [
+                {"role": "user", "content": f"Look up item {turn}."},
+                {
+                    "role": "assistant",
+                    "tool_calls": [
+                        {
+                            "id": call_id,
+                            "type": "function",
+                            "function": {
+                                "name": "lookup",
+                                "arguments": json.dumps({"item": turn}),
+                            },
+                        }
+                    ],
+                },
+                {
+                    "role": "tool",
+                    "tool_call_id": call_id,
+                    "content": json.dumps({"item": turn, "found": True}),
+                },
+                {"role": "assistant", "content": f"Item {turn} was found."},
+            ]
+        )
+    return [ChatCompletionRequestMessage.model_validate(item) for item in messages]
+
+
+def _resume_exchange(interrupts: int) -> list[ChatCompletionRequestMessage]:
+    call_ids = [
+        interrupt_tool_call_id(f"interrupt-{index}") for index in range(interrupts)
+    ]
+    arguments = interrupt_arguments(
+        run_id="run-benchmark",
+        state_token="state-benchmark",  # ruff: ignore[hardcoded-password-func-arg]
+        payload={"question": "Approve?"},
+    )
+    messages = [
+        {
+            "role": "assistant",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": INTERRUPT_TOOL_NAME, "arguments": arguments},
+                }
+                for call_id in call_ids
+            ],
+        },
+        *[
+            {
+                "role": "tool",
+                "tool_call_id": call_id,
+                "content": json.dumps({"resume": "yes"}),
+            }
+            for call_id in call_ids
+        ],
+    ]
+    return [ChatCompletionRequestMessage.model_validate(item) for item in messages]
+
+
+class _EmptyState(TypedDict):
+    value: int
+
+
+def _checkpointed_graph(tuples: int) -> Any:
+    """Compile a graph over an in-memory saver holding ``tuples`` checkpoints."""
+    saver = InMemorySaver()
+    namespaces = ("", "child:1", "child:1|grandchild:2", "sibling:3")
+    for index in range(tuples):
+        namespace = namespaces[index % len(namespaces)]
+        saver.put(
+            {"configurable": {"thread_id": _THREAD_ID, "checkpoint_ns": namespace}},
+            empty_checkpoint(),
+            {"source": "loop", "step": index, "parents": {}},
+            {},
+        )
+    return (
+        StateGraph(_EmptyState)
+        .add_node("noop", lambda _state: {})
+        .set_entry_point("noop")
+        .set_finish_point("noop")
+        .compile(checkpointer=saver)
+    )
+
+
+async def _time_calls(call: Case, iterations: int, *, is_async: bool) -> float:
+    # Like timeit, keep collector pauses out of the timings.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        if is_async:
+            for _ in range(iterations):
+                await call()
+        else:
+            for _ in range(iterations):
+                call()
+        return time.perf_counter() - started
+    finally:
+        if collecting:
+            gc.enable()
+
+
+async def time_case(call: Case, *, rounds: int, min_time: float) -> dict[str, Any]:
+    """Calibrate and time one case, returning per-call statistics."""
+    # The first call warms caches and tells synchronous and async cases apart.
+    first = call()
+    is_async = inspect.isawaitable(first)
+    if is_async:
+        await first
+    timed = partial(_time_calls, call, is_async=is_async)
+
+    iterations = 1
+    while (elapsed := await timed(iterations)) < min_time:
+        iterations *= 10 if elapsed < min_time / 10 else 2
+    per_call = [await timed(iterations) / iterations for _ in range(rounds)]
+    return {
+        "min_us": round(min(per_call) * 1_000_000, 3),
+        "median_us": round(statistics.median(per_call) * 1_000_000, 3),
+        "iterations": iterations,
+        "rounds": rounds,
+    }
+
+
+async def run_cases(
+    *,
+    selected: str | None,
+    rounds: int,
+    min_time: float,
+    write: Callable[[str], object] = print,
+) -> dict[str, Any]:
+    """Time every registered case whose name contains ``selected``."""
+    results = {}
+    for name, setup in CASES.items():
+        if selected and selected not in name:
+            continue
+        results[name] = await time_case(setup(), rounds=rounds, min_time=min_time)
+        write(f"{name:<48} {results[name]['median_us']:>12.3f} us")
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: list[dict[str, Any]],
+    *,
+    threshold: float,
+    write: Callable[[str], object] = print,
+) -> list[str]:
+    """
+    Print per-case changes and return the cases that regressed.
+
+    ``current`` holds one results mapping per repeat. A case regresses only when
+    its median is more than ``threshold`` slower in every repeat; the printed
+    change is the smallest one seen.
+    """
+    regressions = []
+    for name in current[0]["results"]:
+        before = baseline["results"].get(name)
+        if before is None:
+            write(f"{name:<48} {'new':>12}")
+            continue
+        after = min(repeat["results"][name]["median_us"] for repeat in current)
+        change = after / before["median_us"] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        write(
+            f"{name:<48} {before['median_us']:>12.3f} -> {after:>12.3f} us "
+            f"{change:+8.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def _load(path: Path) -> dict[str, Any]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        msg = (
+            f"{path} does not exist. Store a baseline on the commit to compare "
+            f"against with `python -m benchmarks.micro run --output {path}`."
+        )
+        raise SystemExit(msg) from None
+    results = json.loads(text)
+    if results.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        msg = f"{path} is not a version {BASELINE_SCHEMA_VERSION} results file."
+        raise SystemExit(msg)
+    return results
+
+
+def _run(
+    arguments: argparse.Namespace, *, write: Callable[[str], object]
+) -> Awaitable[dict[str, Any]]:
+    return run_cases(
+        selected=arguments.filter,
+        rounds=arguments.rounds,
+        min_time=arguments.min_time,
+        write=write,
+    )
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    """Run or compare the micro-benchmarks and return the exit status."""
+    if arguments.command == "run":
+        current = await _run(arguments, write=print)
+        if arguments.output is not None:
+            arguments.output.parent.mkdir(parents=True, exist_ok=True)
+            arguments.output.write_text(
+                json.dumps(current, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+        return 0
+
+    baseline = _load(arguments.baseline)
+    if arguments.current is not None:
+        repeats = [_load(arguments.current)]
+    else:
+        repeats = [
+            await _run(arguments, write=lambda _line: None)
+            for _ in range(arguments.repeats)
+        ]
+    regressions = compare_results(baseline, repeats, threshold=arguments.threshold)
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed by more than "
+            f"{arguments.threshold:.0%} in every repeat"
+        )
+        return 1
+    return 0
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the ``run`` or ``compare`` command from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="time the cases")
+    run.add_argument("--output", type=Path, help="write results to this JSON file")
+    compare = commands.add_parser("compare", help="compare with a baseline")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument(
+        "current",
+        type=Path,
+        nargs="?",
+        help="results file to compare; times the cases again when omitted",
+    )
+    compare.add_argument("--threshold", type=float, default=0.5)
+    compare.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="times to time the cases; a regression must show in every repeat",
+    )
+    for command in (run, compare):
+        command.add_argument("--filter", help="only cases whose name contains this")
+        command.add_argument("--rounds", type=int, default=7)
+        command.add_argument("--min-time", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_arguments())))
@@ -0,0 +1,127 @@
+"""
+Compare run lease acquire latency of the PostgreSQL coordinators.
+
+Run it from the repository root against a disposable database::
+
+    uv run python -m benchmarks.postgres_leases postgresql://localhost/lgos
+
+``--concurrency`` runs each hold a lease on a distinct key for ``--hold``
+seconds. ``PostgresRunCoordinator`` checks out one pool connection per lease,
+so leases beyond its pool size are rejected as busy. The multiplexed
+coordinator takes every lock on ``--lock-connections`` dedicated sessions.
+Acquire latency is measured from entering the lease to its body starting.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, cast
+
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from langgraph_openai_serve.graph.interrupt import RunBusyError
+from langgraph_openai_serve.integrations.postgres import (
+    MultiplexedPostgresRunCoordinator,
+    PostgresRunCoordinator,
+)
+
+Coordinator = Callable[[str], AbstractAsyncContextManager[None]]
+
+
+async def measure(
+    coordinator: Coordinator,
+    concurrency: int,
+    hold: float,
+) -> tuple[list[float], int]:
+    """Return acquire latencies and the number of leases rejected as busy."""
+    latencies: list[float] = []
+    rejected = 0
+    prefix = uuid.uuid4().hex
+
+    async def lease(index: int) -> None:
+        nonlocal rejected
+        started = time.perf_counter()
+        try:
+            async with coordinator(f"{prefix}-{index}"):
+                latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(hold)
+        except RunBusyError:
+            rejected += 1
+
+    async with asyncio.TaskGroup() as task_group:
+        for index in range(concurrency):
+            task_group.create_task(lease(index))
+    return latencies, rejected
+
+
+def report(name: str, latencies: list[float], rejected: int) -> None:
+    """Print acquire latency percentiles in milliseconds."""
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = latencies[0] if latencies else 0.0
+    print(
+        f"{name:>12}: {len(latencies):6d} held {rejected:6d} busy  "
+        f"p50 {p50 * 1000:8.2f} ms  p99 {p99 * 1000:8.2f} ms"
+    )
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    """Measure both coordinators at the requested concurrency."""
+    print(
+        f"concurrency={arguments.concurrency} hold={arguments.hold} "
+        f"pool_size={arguments.pool_size} "
+        f"lock_connections={arguments.lock_connections}"
+    )
+    pool = cast(
+        "AsyncConnectionPool[Any]",
+        AsyncConnectionPool(
+            conninfo=arguments.postgres_uri,
+            kwargs={"autocommit": True, "row_factory": dict_row},
+            min_size=arguments.pool_size,
+            max_size=arguments.pool_size,
+            open=False,
+        ),
+    )
+    async with pool:
+        await pool.wait()
+        pooled = PostgresRunCoordinator(
+            pool,
+            max_concurrent_leases=arguments.pool_size,
+        )
+        report("pooled", *await measure(pooled, arguments.concurrency, arguments.hold))
+
+    multiplexed = MultiplexedPostgresRunCoordinator(
+        arguments.postgres_uri,
+        lock_connections=arguments.lock_connections,
+    )
+    try:
+        # A warm-up round opens the sessions so connecting is not measured.
+        await measure(multiplexed, arguments.lock_connections * 8, 0)
+        report(
+            "multiplexed",
+            *await measure(multiplexed, arguments.concurrency, arguments.hold),
+        )
+    finally:
+        await multiplexed.aclose()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse the database and load shape from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("postgres_uri")
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--hold", type=float, default=1.0)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--lock-connections", type=int, default=2)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
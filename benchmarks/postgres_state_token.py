@@ -0,0 +1,143 @@
+"""
+Compare interrupt state token cost as the checkpoint history grows.
+
+Run it from the repository root against a disposable database::
+
+    uv run python -m benchmarks.postgres_state_token postgresql://localhost/lgos
+
+For every ``--history`` size, one thread receives that many checkpoints spread
+over four namespaces. ``checkpoint_state_token`` is then timed ``--rounds``
+times through ``AsyncPostgresSaver``, which scans the whole history, and through
+``PostgresCheckpointSaver``, which reads each namespace head by index. The
+scan grows linearly with the history; the indexed read should stay flat.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any, TypedDict, cast
+
+from langgraph.checkpoint.base import BaseCheckpointSaver, empty_checkpoint
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph import StateGraph
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from langgraph_openai_serve.graph.interrupt.state import checkpoint_state_token
+from langgraph_openai_serve.integrations.postgres import (
+    PostgresCheckpointSaver,
+    setup_postgres_schema,
+)
+
+NAMESPACES = ("", "child:1", "child:1|grandchild:2", "sibling:3")
+
+
+class _EmptyState(TypedDict, total=False):
+    pass
+
+
+def compile_graph(checkpointer: BaseCheckpointSaver) -> Any:
+    """Compile a one-node graph that only carries ``checkpointer``."""
+    return (
+        StateGraph(_EmptyState)
+        .add_node("noop", lambda _state: {})
+        .set_entry_point("noop")
+        .set_finish_point("noop")
+        .compile(checkpointer=checkpointer)
+    )
+
+
+async def write_history(
+    saver: BaseCheckpointSaver,
+    thread_id: str,
+    checkpoints: int,
+) -> None:
+    """Store ``checkpoints`` empty checkpoints across ``NAMESPACES``."""
+    for index in range(checkpoints):
+        await saver.aput(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": NAMESPACES[index % len(NAMESPACES)],
+                }
+            },
+            empty_checkpoint(),
+            {"source": "loop", "step": index, "parents": {}},
+            {},
+        )
+
+
+async def measure(graph: Any, thread_id: str, rounds: int) -> tuple[float, str]:
+    """Return the median token time in seconds and the token itself."""
+    config = {"configurable": {"thread_id": thread_id}}
+    durations = []
+    token = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        token = await checkpoint_state_token(graph, config)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), cast("str", token)
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    """Time both savers for every requested history size."""
+    await setup_postgres_schema(arguments.postgres_uri)
+    pool = cast(
+        "AsyncConnectionPool[Any]",
+        AsyncConnectionPool(
+            conninfo=arguments.postgres_uri,
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+            min_size=1,
+            max_size=1,
+            open=False,
+        ),
+    )
+    async with pool:
+        await pool.wait()
+        scanning = compile_graph(AsyncPostgresSaver(pool))
+        indexed_saver = PostgresCheckpointSaver(pool)
+        indexed = compile_graph(indexed_saver)
+        print(f"{'checkpoints':>12} {'scan ms':>10} {'indexed ms':>11}")
+        for checkpoints in arguments.history:
+            thread_id = f"benchmark-{uuid.uuid4().hex}"
+            await write_history(indexed_saver, thread_id, checkpoints)
+            try:
+                scan_time, scan_token = await measure(
+                    scanning, thread_id, arguments.rounds
+                )
+                indexed_time, indexed_token = await measure(
+                    indexed, thread_id, arguments.rounds
+                )
+            finally:
+                await indexed_saver.adelete_thread(thread_id)
+            if scan_token != indexed_token:
+                msg = f"State tokens differ at {checkpoints} checkpoints."
+                raise RuntimeError(msg)
+            print(
+                f"{checkpoints:12d} {scan_time * 1000:10.2f} "
+                f"{indexed_time * 1000:11.2f}"
+            )
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse the database and history sizes from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("postgres_uri")
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 10000],
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_arguments()))
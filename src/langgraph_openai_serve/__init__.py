@@ -1,31 +1,92 @@
-"""langgraph-openai-serve package."""
-
-from importlib.metadata import version
-
-from langgraph_openai_serve.graph.client_settings import ClientSettings
-from langgraph_openai_serve.graph.events import (
-    citation_event,
-    citation_slice,
-    client_event,
-    status_event,
-)
-from langgraph_openai_serve.graph.features import GraphFeature
-from langgraph_openai_serve.graph.graph_registry import (
-    GraphConfig,
-    GraphRegistry,
-)
-from langgraph_openai_serve.openai_server import LanggraphOpenaiServe
-
-__version__ = version("langgraph_openai_serve")
+"""
+langgraph-openai-serve package.
+
+Public names are imported on first access, so tools that only need a graph
+configuration or event helper do not load the server and its web stack.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langgraph_openai_serve.graph.client_settings import ClientSettings
+    from langgraph_openai_serve.graph.events import (
+        citation_event,
+        citation_slice,
+        client_event,
+        status_event,
+    )
+    from langgraph_openai_serve.graph.features import GraphFeature
+    from langgraph_openai_serve.graph.graph_registry import (
+        AdmissionPolicy,
+        ExecutionBudget,
+        FairnessKey,
+        GraphCachePolicy,
+        GraphConfig,
+        GraphRegistry,
+        InvokeMode,
+        ResponseCachePolicy,
+        StreamCoalescing,
+    )
+    from langgraph_openai_serve.graph.lifecycle import GraphWarmup
+    from langgraph_openai_serve.openai_server import LanggraphOpenaiServe
+
+_EXPORTS = {  # ruff: ignore[non-empty-init-module]
+    "AdmissionPolicy": "langgraph_openai_serve.graph.graph_registry",
+    "ClientSettings": "langgraph_openai_serve.graph.client_settings",
+    "ExecutionBudget": "langgraph_openai_serve.graph.graph_registry",
+    "FairnessKey": "langgraph_openai_serve.graph.graph_registry",
+    "GraphCachePolicy": "langgraph_openai_serve.graph.graph_registry",
+    "GraphConfig": "langgraph_openai_serve.graph.graph_registry",
+    "GraphFeature": "langgraph_openai_serve.graph.features",
+    "GraphRegistry": "langgraph_openai_serve.graph.graph_registry",
+    "GraphWarmup": "langgraph_openai_serve.graph.lifecycle",
+    "InvokeMode": "langgraph_openai_serve.graph.graph_registry",
+    "LanggraphOpenaiServe": "langgraph_openai_serve.openai_server",
+    "ResponseCachePolicy": "langgraph_openai_serve.graph.graph_registry",
+    "StreamCoalescing": "langgraph_openai_serve.graph.graph_registry",
+    "citation_event": "langgraph_openai_serve.graph.events",
+    "citation_slice": "langgraph_openai_serve.graph.events",
+    "client_event": "langgraph_openai_serve.graph.events",
+    "status_event": "langgraph_openai_serve.graph.events",
+}
 
 __all__ = [
+    "AdmissionPolicy",
     "ClientSettings",
+    "ExecutionBudget",
+    "FairnessKey",
+    "GraphCachePolicy",
     "GraphConfig",
     "GraphFeature",
     "GraphRegistry",
+    "GraphWarmup",
+    "InvokeMode",
     "LanggraphOpenaiServe",
+    "ResponseCachePolicy",
+    "StreamCoalescing",
     "citation_event",
     "citation_slice",
     "client_event",
     "status_event",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name, or the package version, on first access."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("langgraph_openai_serve")
+    elif name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the attributes already loaded."""
+    return sorted({*globals(), *__all__, "__version__"})
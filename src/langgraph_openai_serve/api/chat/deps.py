@@ -5,6 +5,10 @@ from collections.abc import AsyncIterator
 
 from fastapi import Request
 
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.api.chat.utils.decoding import (
+    decode_chat_completion_request,
+)
 from langgraph_openai_serve.api.chat.utils.streaming import _StreamOwner
 
 
@@ -29,3 +33,13 @@ async def checkpoint_scope_dependency(request: Request) -> str:
     if inspect.isawaitable(value):
         value = await value
     return value
+
+
+async def chat_completion_request_dependency(
+    request: Request,
+) -> ChatCompletionRequest:
+    """Read and validate the chat completion request body."""
+    return decode_chat_completion_request(
+        await request.body(),
+        request.headers.get("content-type"),
+    )
@@ -0,0 +1,34 @@
+"""Non-streaming chat completion response models that embed OpenAI types."""
+
+from openai.types.chat.chat_completion_message import Annotation
+from pydantic import BaseModel
+
+from langgraph_openai_serve.api.chat.schemas import Role, ToolCall, UsageInfo
+
+
+class ChatCompletionResponseMessage(BaseModel):
+    """Model for a chat completion response message."""
+
+    role: Role
+    content: str | None = None
+    annotations: list[Annotation] | None = None
+    tool_calls: list[ToolCall] | None = None
+
+
+class ChatCompletionResponseChoice(BaseModel):
+    """Model for a chat completion response choice."""
+
+    index: int
+    message: ChatCompletionResponseMessage
+    finish_reason: str | None = None
+
+
+class ChatCompletionResponse(BaseModel):
+    """Model for a chat completion response."""
+
+    id: str
+    object: str = "chat.completion"
+    created: int
+    model: str
+    choices: list[ChatCompletionResponseChoice]
+    usage: UsageInfo | None = None
@@ -2,23 +2,34 @@
 Pydantic models for the OpenAI API.
 
 This module defines Pydantic models that match the OpenAI API request and response formats.
+Non-streaming response models embed OpenAI's citation type, whose package takes
+about a second to import, so they are loaded from ``response_schemas`` on first
+access.
 """
 
 from enum import StrEnum
-from typing import Annotated, Any, Literal
+from importlib import import_module
+from typing import TYPE_CHECKING, Annotated, Any, Literal, NoReturn
 
-from openai.types.chat.chat_completion_message import Annotation
 from pydantic import (
+    AfterValidator,
     BaseModel,
     Field,
     StringConstraints,
-    ValidationError,
-    model_validator,
 )
+from pydantic.json_schema import SkipJsonSchema
+
+if TYPE_CHECKING:
+    from langgraph_openai_serve.api.chat.response_schemas import (  # ruff: ignore[unused-import]
+        ChatCompletionResponse,
+        ChatCompletionResponseChoice,
+        ChatCompletionResponseMessage,
+    )
 
 OPENAI_METADATA_MAX_PAIRS = 16
 OPENAI_METADATA_KEY_MAX_LENGTH = 64
 OPENAI_METADATA_VALUE_MAX_LENGTH = 512
+OPENAI_MAX_CHOICES = 128
 
 MetadataKey = Annotated[
     str,
@@ -30,32 +41,20 @@ MetadataValue = Annotated[
 ]
 
 
-def _reject_legacy_fields(
-    data: Any,
-    replacements: dict[str, str],
-    *,
-    title: str,
-) -> Any:
-    if not isinstance(data, dict):
-        return data
-
-    for field, replacement in replacements.items():
-        if field in data:
-            error = ValueError(
-                f"'{field}' is not supported; use '{replacement}' instead."
-            )
-            raise ValidationError.from_exception_data(
-                title,
-                [
-                    {
-                        "type": "value_error",
-                        "loc": (field,),
-                        "input": data[field],
-                        "ctx": {"error": error},
-                    }
-                ],
-            )
-    return data
+def _reject_legacy_field(name: str, replacement: str) -> AfterValidator:
+    """
+    Reject a removed Chat Completions field whenever a request sends it.
+
+    Removed fields are declared only under their wire names, so pydantic-core
+    reports them while validating the JSON body instead of calling a Python
+    validator for every message. They are hidden from schemas, dumps and reprs.
+    """
+
+    def reject(_value: Any) -> NoReturn:
+        msg = f"'{name}' is not supported; use '{replacement}' instead."
+        raise ValueError(msg)
+
+    return AfterValidator(reject)
 
 
 class Role(StrEnum):
@@ -85,22 +84,17 @@ class ToolCall(BaseModel):
 class ChatCompletionRequestMessage(BaseModel):
     """Model for a chat completion request message."""
 
+    # Declared first so a legacy field is the first reported error.
+    legacy_function_call: Annotated[
+        SkipJsonSchema[Any],
+        _reject_legacy_field("function_call", "tool_calls"),
+    ] = Field(default=None, alias="function_call", exclude=True, repr=False)
     role: Role
     content: str | None = None
     name: str | None = None
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def reject_legacy_fields(cls, data: Any) -> Any:
-        """Reject the deprecated singular Chat Completions function call."""
-        return _reject_legacy_fields(
-            data,
-            {"function_call": "tool_calls"},
-            title=cls.__name__,
-        )
-
 
 class FunctionDefinition(BaseModel):
     """Model for a function definition."""
@@ -123,15 +117,31 @@ class Tool(BaseModel):
     function: FunctionDefinition
 
 
+class StreamOptions(BaseModel):
+    """Model for streaming response options."""
+
+    include_usage: bool | None = None
+
+
 class ChatCompletionRequest(BaseModel):
     """Model for a chat completion request."""
 
+    # Declared first so a legacy field is the first reported error.
+    legacy_function_call: Annotated[
+        SkipJsonSchema[Any],
+        _reject_legacy_field("function_call", "tool_choice"),
+    ] = Field(default=None, alias="function_call", exclude=True, repr=False)
+    legacy_functions: Annotated[
+        SkipJsonSchema[Any],
+        _reject_legacy_field("functions", "tools"),
+    ] = Field(default=None, alias="functions", exclude=True, repr=False)
     model: str
     messages: list[ChatCompletionRequestMessage] = Field(min_length=1)
     temperature: float | None = 0.7
     top_p: float | None = 1.0
-    n: int | None = 1
+    n: Annotated[int, Field(ge=1, le=OPENAI_MAX_CHOICES)] | None = 1
     stream: bool | None = False
+    stream_options: StreamOptions | None = None
     stop: str | list[str] | None = None
     max_tokens: int | None = None
     presence_penalty: float | None = 0.0
@@ -145,28 +155,6 @@ class ChatCompletionRequest(BaseModel):
         max_length=OPENAI_METADATA_MAX_PAIRS,
     )
 
-    @model_validator(mode="before")
-    @classmethod
-    def reject_legacy_fields(cls, data: Any) -> Any:
-        """Reject deprecated Chat Completions function parameters."""
-        return _reject_legacy_fields(
-            data,
-            {
-                "function_call": "tool_choice",
-                "functions": "tools",
-            },
-            title=cls.__name__,
-        )
-
-
-class ChatCompletionResponseMessage(BaseModel):
-    """Model for a chat completion response message."""
-
-    role: Role
-    content: str | None = None
-    annotations: list[Annotation] | None = None
-    tool_calls: list[ToolCall] | None = None
-
 
 class UsageInfo(BaseModel):
     """Model for usage information."""
@@ -176,25 +164,6 @@ class UsageInfo(BaseModel):
     total_tokens: int
 
 
-class ChatCompletionResponseChoice(BaseModel):
-    """Model for a chat completion response choice."""
-
-    index: int
-    message: ChatCompletionResponseMessage
-    finish_reason: str | None = None
-
-
-class ChatCompletionResponse(BaseModel):
-    """Model for a chat completion response."""
-
-    id: str
-    object: str = "chat.completion"
-    created: int
-    model: str
-    choices: list[ChatCompletionResponseChoice]
-    usage: UsageInfo | None = None
-
-
 class ChatCompletionStreamToolCallFunction(BaseModel):
     """Model for a streaming tool call function delta."""
 
@@ -235,3 +204,25 @@ class ChatCompletionStreamResponse(BaseModel):
     created: int
     model: str
     choices: list[ChatCompletionStreamResponseChoice]
+    usage: UsageInfo | None = None
+
+
+_LAZY_RESPONSE_MODELS = frozenset(
+    {
+        "ChatCompletionResponse",
+        "ChatCompletionResponseChoice",
+        "ChatCompletionResponseMessage",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a non-streaming response model on first access."""
+    if name not in _LAZY_RESPONSE_MODELS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(
+        import_module("langgraph_openai_serve.api.chat.response_schemas"), name
+    )
+    globals()[name] = value
+    return value
@@ -1,13 +1,24 @@
 """Functions for generating chat completions."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 from contextlib import aclosing
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, cast
+
+from anyio import CancelScope
 
 from langgraph_openai_serve.api.chat.schemas import (
     ChatCompletionRequest,
     ChatCompletionResponse,
 )
+from langgraph_openai_serve.api.chat.utils.caching import (
+    ResponseCacheLookup,
+    merge_text,
+    response_cache_key,
+)
+from langgraph_openai_serve.api.chat.utils.coalescing import coalesce_text_events
 from langgraph_openai_serve.api.chat.utils.events import (
     annotation_from_custom_event,
     client_event_extension_from_custom_event,
@@ -16,100 +27,614 @@ from langgraph_openai_serve.api.chat.utils.events import (
 from langgraph_openai_serve.api.chat.utils.responses import (
     ChatCompletionStreamResponseBuilder,
     chat_completion_response,
+    response_choice,
+)
+from langgraph_openai_serve.api.chat.utils.timing import (
+    ServerTiming,
+    server_timing_requested,
 )
 from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.metrics import request_elapsed, serving_metrics
+from langgraph_openai_serve.core.settings import settings
+from langgraph_openai_serve.graph.budget import RunBudgetExceededError
 from langgraph_openai_serve.graph.features import GraphFeature
+from langgraph_openai_serve.graph.graph_registry import GraphConfig, StreamCoalescing
 from langgraph_openai_serve.graph.interrupt import LangGraphInterruptBatch
+from langgraph_openai_serve.graph.response_cache import CachedCompletion
 from langgraph_openai_serve.graph.runner import (
+    LangGraphInvocation,
+    LangGraphOutput,
+    LangGraphStreamEvent,
     invoke_run,
     stream_run,
-    usage_for,
 )
+from langgraph_openai_serve.graph.timing import RunTimings
+from langgraph_openai_serve.graph.usage import TokenUsage, estimate_usage
 from langgraph_openai_serve.graph.utils import GraphRun
 
 if TYPE_CHECKING:
     from langgraph.types import CustomStreamPart
 
+    from langgraph_openai_serve.graph.single_flight import SingleFlight
+
 logger = get_logger(__name__)
 
+# A choice event of None marks the end of that choice's graph stream, and a
+# RunBudgetExceededError a stream cut short by the run's budget. A choice's
+# RunTimings come first and are complete once its stream ends.
+_ChoiceEvent = tuple[
+    int,
+    LangGraphStreamEvent | RunTimings | RunBudgetExceededError | None,
+]
+
+
+@dataclass
+class _StreamChoice:
+    content_parts: list[str] = field(default_factory=list)
+    custom_events: "list[CustomStreamPart]" = field(default_factory=list)
+    usage: TokenUsage | None = None
+    timings: RunTimings | None = None
+
+
+@dataclass(frozen=True)
+class _ChoiceFailure:
+    error: Exception
+
 
 async def generate_completion(
-    chat_request: ChatCompletionRequest, run: GraphRun
+    chat_request: ChatCompletionRequest,
+    runs: Sequence[GraphRun],
+    *,
+    response_cache: ResponseCacheLookup | None = None,
+    server_timing: ServerTiming | None = None,
 ) -> ChatCompletionResponse:
-    """Generate a chat completion."""
-    invocation = await invoke_run(run)
-    completion = invocation.output
-    tokens_used = usage_for(completion, chat_request.messages)
-    annotations = (
-        [
-            annotation
-            for event in invocation.custom_events
-            if (annotation := annotation_from_custom_event(event, completion))
-            is not None
-        ]
-        if isinstance(completion, str)
-        else []
+    """
+    Generate a chat completion with one choice per prepared run.
+
+    A ``response_cache`` miss stores the completed text and custom events, and
+    ``server_timing`` receives the phase timings of the runs.
+    """
+    invocations = await _invoke_choices(runs)
+    if response_cache is not None and len(invocations) == 1:
+        _store_invocation(response_cache, invocations[0])
+    if server_timing is not None:
+        server_timing.finish(run.timings for run in runs)
+    return _completion_response(chat_request, invocations)
+
+
+async def generate_shared_completion(  # ruff: ignore[too-many-arguments]
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    prepare_run: Callable[[], Awaitable[GraphRun]],
+    *,
+    checkpoint_scope: str,
+    response_cache: ResponseCacheLookup | None = None,
+    server_timing: ServerTiming | None = None,
+) -> ChatCompletionResponse:
+    """
+    Generate a single-choice completion from a run shared by identical requests.
+
+    Requests that match an in-flight request of the same ``checkpoint_scope``
+    receive its ``LangGraphInvocation`` instead of preparing and invoking their
+    own run, and report its timings.
+    """
+
+    async def invoke() -> LangGraphInvocation:
+        return await invoke_run(await prepare_run())
+
+    in_flight = cast("SingleFlight", graph_config.in_flight)
+    invocation = await in_flight.call(
+        response_cache_key(chat_request, graph_config, checkpoint_scope),
+        invoke,
+    )
+    if response_cache is not None:
+        _store_invocation(response_cache, invocation)
+    if server_timing is not None and invocation.timings is not None:
+        server_timing.finish([invocation.timings])
+    return _completion_response(chat_request, [invocation])
+
+
+def _store_invocation(
+    response_cache: ResponseCacheLookup,
+    invocation: LangGraphInvocation,
+) -> None:
+    # Interrupts are tied to durable run state and are never cached.
+    if isinstance(invocation.output, str):
+        response_cache.store(merge_text((*invocation.custom_events, invocation.output)))
+
+
+def cached_completion(
+    chat_request: ChatCompletionRequest,
+    completion: CachedCompletion,
+) -> ChatCompletionResponse:
+    """Build a chat completion from a cached response."""
+    invocation = LangGraphInvocation(
+        output="".join(event for event in completion if isinstance(event, str)),
+        custom_events=tuple(
+            event for event in completion if not isinstance(event, str)
+        ),
     )
+    return _completion_response(chat_request, [invocation])
 
+
+def _completion_response(
+    chat_request: ChatCompletionRequest,
+    invocations: Sequence[LangGraphInvocation],
+) -> ChatCompletionResponse:
+    choices = []
+    for index, invocation in enumerate(invocations):
+        completion = invocation.output
+        annotations = (
+            [
+                annotation
+                for event in invocation.custom_events
+                if (annotation := annotation_from_custom_event(event, completion))
+                is not None
+            ]
+            if isinstance(completion, str)
+            else []
+        )
+        choices.append(response_choice(index, completion, annotations))
+
+    usage = _request_usage(
+        chat_request,
+        [(invocation.output, invocation.usage) for invocation in invocations],
+    )
     return chat_completion_response(
         model=chat_request.model,
-        completion=completion,
-        annotations=annotations,
-        usage=tokens_used,
+        choices=choices,
+        usage=usage.as_dict(),
     )
 
 
-async def stream_completion(
-    chat_request: ChatCompletionRequest, run: GraphRun
+def _request_usage(
+    chat_request: ChatCompletionRequest,
+    choices: Sequence[tuple[LangGraphOutput, TokenUsage | None]],
+) -> TokenUsage:
+    """
+    Sum the usage reported by the models of every choice.
+
+    Choices whose models reported none are estimated, counting their shared
+    prompt once as OpenAI does for ``n > 1``.
+    """
+    usage = TokenUsage()
+    prompt_estimated = False
+    for output, reported in choices:
+        if reported is not None:
+            usage += reported
+            continue
+        estimate = estimate_usage(
+            output if isinstance(output, str) else None,
+            chat_request.messages,
+        )
+        if prompt_estimated:
+            estimate = replace(estimate, prompt_tokens=0)
+        usage += estimate
+        prompt_estimated = True
+    return usage
+
+
+async def _invoke_choices(runs: Sequence[GraphRun]) -> list[LangGraphInvocation]:
+    if len(runs) == 1:
+        return [await invoke_run(runs[0])]
+
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_CHOICES)
+
+    async def invoke(run: GraphRun) -> LangGraphInvocation:
+        async with semaphore:
+            return await invoke_run(run)
+
+    # Like _stream_choices, choices are asyncio tasks rather than a task group,
+    # so the first failure reaches the view as itself, not in an exception group.
+    tasks = [
+        asyncio.create_task(invoke(run), name=f"chat-completion-choice-{index}")
+        for index, run in enumerate(runs)
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task.done() and not task.cancelled() and (error := task.exception()):
+                raise error
+        return [task.result() for task in tasks]
+    finally:
+        with CancelScope(shield=True):
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Runs cancelled before they started were never finalized by invoke_run.
+            for run in runs:
+                await run.aclose()
+
+
+def stream_completion(
+    chat_request: ChatCompletionRequest,
+    runs: Sequence[GraphRun],
+    *,
+    coalescing: StreamCoalescing | None = None,
+    response_cache: ResponseCacheLookup | None = None,
 ) -> AsyncGenerator[str, None]:
     """
-    Stream a chat completion response.
+    Stream a chat completion response with one choice per prepared run.
 
-    Yields:
+    With a ``coalescing`` policy, consecutive text deltas of a choice are merged
+    into fewer chunks. A ``response_cache`` miss stores the streamed text and
+    custom events once the choice finishes.
+
+    Returns:
         String chunks representing Server-Sent Events.
 
     """
+    return _stream_chunks(
+        chat_request,
+        _stream_choices(runs),
+        choice_count=len(runs),
+        graph_config=runs[0].config,
+        coalescing=coalescing,
+        response_cache=response_cache,
+    )
+
+
+async def stream_shared_completion(  # ruff: ignore[too-many-arguments]
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    prepare_run: Callable[[], Awaitable[GraphRun]],
+    *,
+    checkpoint_scope: str,
+    coalescing: StreamCoalescing | None = None,
+    response_cache: ResponseCacheLookup | None = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Stream a single-choice completion from a run shared by identical requests.
+
+    Requests that match an in-flight request of the same ``checkpoint_scope``
+    subscribe to its graph events from the start instead of preparing and
+    streaming their own run. Returns once the shared run is prepared, so
+    preparation errors are raised before streaming.
+
+    Returns:
+        String chunks representing Server-Sent Events.
+
+    """
+
+    async def start() -> AsyncGenerator[LangGraphStreamEvent | RunTimings, None]:
+        return _timed_run_events(await prepare_run())
+
+    in_flight = cast("SingleFlight", graph_config.in_flight)
+    events = await in_flight.stream(
+        response_cache_key(chat_request, graph_config, checkpoint_scope),
+        start,
+    )
+    return _stream_chunks(
+        chat_request,
+        _single_choice(events),
+        choice_count=1,
+        graph_config=graph_config,
+        coalescing=coalescing,
+        response_cache=response_cache,
+    )
+
+
+def stream_cached_completion(
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    completion: CachedCompletion,
+) -> AsyncGenerator[str, None]:
+    """
+    Replay a cached response as a chat completion stream.
+
+    Returns:
+        String chunks representing Server-Sent Events.
+
+    """
+    return _stream_chunks(
+        chat_request,
+        _replay_choice(completion),
+        choice_count=1,
+        graph_config=graph_config,
+    )
+
+
+async def _stream_chunks(  # ruff: ignore[too-many-arguments]
+    chat_request: ChatCompletionRequest,
+    choice_events: AsyncGenerator[_ChoiceEvent, None],
+    *,
+    choice_count: int,
+    graph_config: GraphConfig,
+    coalescing: StreamCoalescing | None = None,
+    response_cache: ResponseCacheLookup | None = None,
+) -> AsyncGenerator[str, None]:
     response_builder = ChatCompletionStreamResponseBuilder(chat_request.model)
-    custom_events: list[CustomStreamPart] = []
-    content_parts: list[str] = []
-    include_client_events = run.config.supports(
+    choices = [_StreamChoice() for _ in range(choice_count)]
+    include_client_events = graph_config.supports(
         GraphFeature.CLIENT_EVENTS
     ) and stream_events_requested(chat_request.metadata)
 
-    try:  # ruff: ignore[too-many-nested-blocks, too-many-statements-in-try-clause]
-        yield response_builder.role()
+    try:  # ruff: ignore[too-many-statements-in-try-clause]
+        for index in range(choice_count):
+            yield response_builder.role(index)
 
-        run_stream = stream_run(run)
-        # Closing the HTTP response must also close the nested graph stream.
-        async with aclosing(run_stream):
-            async for event in run_stream:
+        choice_events = _wrap_choice_events(
+            choice_events,
+            model=chat_request.model,
+            coalescing=coalescing,
+            response_cache=response_cache,
+        )
+        # Closing the HTTP response must also close the nested graph streams.
+        async with aclosing(choice_events):
+            async for index, event in choice_events:
                 if isinstance(event, LangGraphInterruptBatch):
+                    # An interrupt ends the whole response.
                     yield response_builder.interrupt(event)
                     yield response_builder.finish("tool_calls")
-                    yield response_builder.done()
-                    return
-
-                if not isinstance(event, str):
-                    custom_events.append(event)
-                    if include_client_events:
-                        extension = client_event_extension_from_custom_event(event)
-                        if extension is not None:
-                            yield response_builder.client_event(extension)
-                    continue
-
-                content_parts.append(event)
-                yield response_builder.text(event)
-
-        content = "".join(content_parts)
-        annotations = [
-            annotation
-            for event in custom_events
-            if (annotation := annotation_from_custom_event(event, content)) is not None
-        ]
-        yield response_builder.finish("stop", annotations=annotations)
+                    break
+
+                chunk = _event_chunk(
+                    response_builder,
+                    choices[index],
+                    index,
+                    event,
+                    include_client_events=include_client_events,
+                )
+                if chunk is not None:
+                    yield chunk
+
+        for chunk in _closing_chunks(response_builder, chat_request, choices):
+            yield chunk
         yield response_builder.done()
 
     except Exception:
         logger.exception("chat_completion.stream_failed")
         yield response_builder.error("Internal server error")
         yield response_builder.done()
+
+
+def _wrap_choice_events(
+    choice_events: AsyncGenerator[_ChoiceEvent, None],
+    *,
+    model: str,
+    coalescing: StreamCoalescing | None,
+    response_cache: ResponseCacheLookup | None,
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    if response_cache is not None:
+        choice_events = _record_completion(choice_events, response_cache)
+    if coalescing is not None:
+        choice_events = cast(
+            "AsyncGenerator[_ChoiceEvent, None]",
+            coalesce_text_events(choice_events, coalescing),
+        )
+    if serving_metrics().enabled:
+        choice_events = _measure_text_chunks(choice_events, model)
+    return choice_events
+
+
+async def _measure_text_chunks(
+    choice_events: AsyncGenerator[_ChoiceEvent, None],
+    model: str,
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    """
+    Time the text chunks sent to the client once coalescing has merged them.
+
+    Yields:
+        The choice events unchanged.
+
+    """
+    metrics = serving_metrics()
+    last_text_at: dict[int, float] = {}
+    chunks = 0
+    async with aclosing(choice_events):
+        async for index, event in choice_events:
+            if isinstance(event, str):
+                now = time.monotonic()
+                if index in last_text_at:
+                    metrics.inter_token(model, now - last_text_at[index])
+                elif not last_text_at and (elapsed := request_elapsed()) is not None:
+                    metrics.first_token(model, elapsed)
+                last_text_at[index] = now
+                chunks += 1
+            yield index, event
+    metrics.stream_finished(model, chunks)
+
+
+async def _record_completion(
+    choice_events: AsyncGenerator[_ChoiceEvent, None],
+    response_cache: ResponseCacheLookup,
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    """
+    Store the events of a single choice once it finishes.
+
+    Yields:
+        The choice events unchanged.
+
+    """
+    recorded: list[str | CustomStreamPart] = []
+    async with aclosing(choice_events):
+        async for index, event in choice_events:
+            # An interrupt ends the response before its choice finishes, so
+            # interrupts are never stored.
+            if event is None:
+                response_cache.store(merge_text(recorded))
+            elif not isinstance(event, (TokenUsage, RunTimings)):
+                recorded.append(cast("str | CustomStreamPart", event))
+            yield index, event
+
+
+def _event_chunk(
+    response_builder: ChatCompletionStreamResponseBuilder,
+    choice: _StreamChoice,
+    index: int,
+    event: LangGraphStreamEvent | RunTimings | RunBudgetExceededError | None,
+    *,
+    include_client_events: bool,
+) -> str | None:
+    """Record one choice event and build the chunk it sends, if any."""
+    if event is None:
+        return _finish_chunk(response_builder, choice, index)
+    if isinstance(event, RunBudgetExceededError):
+        return _finish_chunk(response_builder, choice, index, "length")
+    if isinstance(event, TokenUsage | RunTimings):
+        # Run reports are sent, if requested, once the stream ends.
+        if isinstance(event, TokenUsage):
+            choice.usage = event
+        else:
+            choice.timings = event
+        return None
+    if isinstance(event, str):
+        choice.content_parts.append(event)
+        return response_builder.text(event, index)
+
+    event = cast("CustomStreamPart", event)
+    choice.custom_events.append(event)
+    if not include_client_events:
+        return None
+    extension = client_event_extension_from_custom_event(event)
+    return (
+        response_builder.client_event(extension, index)
+        if extension is not None
+        else None
+    )
+
+
+def _closing_chunks(
+    response_builder: ChatCompletionStreamResponseBuilder,
+    chat_request: ChatCompletionRequest,
+    choices: Sequence[_StreamChoice],
+) -> list[str]:
+    """Build the opt-in usage and timing chunks a finished stream ends with."""
+    chunks = []
+    if chat_request.stream_options and chat_request.stream_options.include_usage:
+        chunks.append(_usage_chunk(response_builder, chat_request, choices))
+    server_timing = ServerTiming()
+    server_timing.finish(
+        choice.timings for choice in choices if choice.timings is not None
+    )
+    if server_timing_requested(chat_request.metadata) and server_timing.milliseconds:
+        chunks.append(response_builder.server_timing(server_timing.milliseconds))
+    return chunks
+
+
+def _usage_chunk(
+    response_builder: ChatCompletionStreamResponseBuilder,
+    chat_request: ChatCompletionRequest,
+    choices: Sequence[_StreamChoice],
+) -> str:
+    usage = _request_usage(
+        chat_request,
+        [("".join(choice.content_parts), choice.usage) for choice in choices],
+    )
+    return response_builder.usage(usage.as_dict())
+
+
+def _finish_chunk(
+    response_builder: ChatCompletionStreamResponseBuilder,
+    choice: _StreamChoice,
+    index: int,
+    finish_reason: str = "stop",
+) -> str:
+    content = "".join(choice.content_parts)
+    return response_builder.finish(
+        finish_reason,
+        annotations=[
+            annotation
+            for custom_event in choice.custom_events
+            if (annotation := annotation_from_custom_event(custom_event, content))
+            is not None
+        ],
+        index=index,
+    )
+
+
+async def _replay_choice(  # ruff: ignore[unused-async]
+    completion: CachedCompletion,
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    for event in completion:
+        yield 0, event
+    yield 0, None
+
+
+async def _timed_run_events(
+    run: GraphRun,
+) -> AsyncGenerator[LangGraphStreamEvent | RunTimings, None]:
+    """
+    Stream a run shared by several requests, starting with its timings.
+
+    Yields:
+        The run's timings, then its graph stream events.
+
+    """
+    yield run.timings
+    events = stream_run(run)
+    async with aclosing(events):
+        async for event in events:
+            yield event
+
+
+async def _single_choice(
+    events: AsyncGenerator[LangGraphStreamEvent | RunTimings, None],
+    index: int = 0,
+    timings: RunTimings | None = None,
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    if timings is not None:
+        yield index, timings
+    try:
+        async with aclosing(events):
+            async for event in events:
+                yield index, event
+    except RunBudgetExceededError as exc:
+        # The text streamed so far is kept and finished as a truncated choice.
+        yield index, exc
+        return
+    yield index, None
+
+
+async def _stream_choices(
+    runs: Sequence[GraphRun],
+) -> AsyncGenerator[_ChoiceEvent, None]:
+    """
+    Interleave the graph streams of every choice in arrival order.
+
+    Yields:
+        The choice index with its next event, then ``None`` when it finishes or
+        the ``RunBudgetExceededError`` that cut it short.
+
+    """
+    if len(runs) == 1:
+        choice_events = _single_choice(stream_run(runs[0]), timings=runs[0].timings)
+        async with aclosing(choice_events):
+            async for choice_event in choice_events:
+                yield choice_event
+        return
+
+    # A one-slot handoff keeps response backpressure on every choice producer.
+    queue: asyncio.Queue[_ChoiceEvent | _ChoiceFailure] = asyncio.Queue(maxsize=1)
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_CHOICES)
+
+    async def produce(index: int, run: GraphRun) -> None:
+        try:
+            async with semaphore:
+                choice_events = _single_choice(stream_run(run), index, run.timings)
+                async with aclosing(choice_events):
+                    async for choice_event in choice_events:
+                        await queue.put(choice_event)
+        except Exception as exc:  # ruff: ignore[blind-except]
+            # The consumer re-raises it so the response reports one stream error.
+            await queue.put(_ChoiceFailure(exc))
+
+    # Like the stream owner's producer, choices stay asyncio tasks so LangGraph
+    # teardown sees a single cancellation.
+    producers = [
+        asyncio.create_task(produce(index, run), name=f"chat-completion-choice-{index}")
+        for index, run in enumerate(runs)
+    ]
+    try:
+        remaining = len(producers)
+        while remaining:
+            item = await queue.get()
+            if isinstance(item, _ChoiceFailure):
+                raise item.error
+            if item[1] is None or isinstance(item[1], RunBudgetExceededError):
+                remaining -= 1
+            yield item
+    finally:
+        for producer in producers:
+            producer.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
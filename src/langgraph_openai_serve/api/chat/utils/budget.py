@@ -0,0 +1,75 @@
+"""Read a request's deadline and recursion limit overrides."""
+
+import math
+
+from langgraph_openai_serve.graph.budget import RunBudget, start_run_budget
+from langgraph_openai_serve.graph.graph_registry import ExecutionBudget
+
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+TIMEOUT_METADATA_KEY = "langgraph_timeout"
+RECURSION_LIMIT_METADATA_KEY = "langgraph_recursion_limit"
+
+
+class InvalidRunBudgetError(ValueError):
+    """Raised when a request asks for an unusable deadline or recursion limit."""
+
+    def __init__(self, message: str, *, param: str | None) -> None:
+        super().__init__(message)
+        self.param = param
+
+
+def requested_run_budget(
+    metadata: dict[str, str] | None,
+    request_timeout: str | None,
+    default: ExecutionBudget | None,
+) -> RunBudget:
+    """
+    Apply a request's overrides to the graph's execution budget.
+
+    ``metadata.langgraph_timeout`` and the ``X-Request-Timeout`` header are
+    deadlines in seconds; with both, the earlier one applies.
+    ``metadata.langgraph_recursion_limit`` is a whole number of supersteps.
+    """
+    metadata = metadata or {}
+    timeouts = [
+        timeout
+        for timeout in (
+            _seconds(
+                metadata.get(TIMEOUT_METADATA_KEY),
+                param=f"metadata.{TIMEOUT_METADATA_KEY}",
+            ),
+            _seconds(request_timeout, param=None),
+        )
+        if timeout is not None
+    ]
+    recursion_limit = metadata.get(RECURSION_LIMIT_METADATA_KEY)
+    if recursion_limit is not None and not (
+        recursion_limit.isascii()
+        and recursion_limit.isdigit()
+        and int(recursion_limit) > 0
+    ):
+        msg = f"'{RECURSION_LIMIT_METADATA_KEY}' must be a positive whole number."
+        raise InvalidRunBudgetError(
+            msg,
+            param=f"metadata.{RECURSION_LIMIT_METADATA_KEY}",
+        )
+
+    return start_run_budget(
+        default,
+        timeout=min(timeouts, default=None),
+        recursion_limit=int(recursion_limit) if recursion_limit is not None else None,
+    )
+
+
+def _seconds(value: str | None, *, param: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = 0.0
+    if not (math.isfinite(seconds) and seconds > 0):
+        name = param or REQUEST_TIMEOUT_HEADER
+        msg = f"'{name}' must be a positive number of seconds."
+        raise InvalidRunBudgetError(msg, param=param)
+    return seconds
@@ -0,0 +1,135 @@
+"""Look up and store chat completions in a graph's response cache."""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from langgraph.types import CustomStreamPart
+from pydantic_core import to_json
+
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.graph.graph_registry import GraphConfig
+from langgraph_openai_serve.graph.response_cache import (
+    CachedCompletion,
+    ResponseCache,
+)
+
+RESPONSE_CACHE_METADATA_KEY = "langgraph_response_cache"
+RESPONSE_CACHE_BYPASS = "bypass"
+RESPONSE_CACHE_STATUS_HEADER = "X-LGOS-Cache"
+
+
+class ResponseCacheStatus(StrEnum):
+    """How a request used its graph's response cache."""
+
+    HIT = "hit"
+    MISS = "miss"
+    BYPASS = "bypass"
+
+
+class InvalidResponseCacheError(ValueError):
+    """Raised when a request sends an unsupported response cache directive."""
+
+    param = f"metadata.{RESPONSE_CACHE_METADATA_KEY}"
+
+
+@dataclass(frozen=True)
+class ResponseCacheLookup:
+    """The cache outcome of one request, and where to store a missed response."""
+
+    status: ResponseCacheStatus
+    completion: CachedCompletion | None = None
+    _cache: ResponseCache | None = None
+    _key: bytes = b""
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Response headers reporting the cache status."""
+        return {RESPONSE_CACHE_STATUS_HEADER: self.status}
+
+    def store(self, completion: CachedCompletion) -> None:
+        """Keep a completed response for later identical requests."""
+        if self._cache is not None:
+            self._cache.put(self._key, completion)
+
+
+def lookup_response_cache(
+    request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    checkpoint_scope: str,
+) -> ResponseCacheLookup | None:
+    """
+    Find a cached response for a request to a graph with a response cache.
+
+    ``metadata.langgraph_response_cache`` set to ``"bypass"`` neither reads nor
+    stores the response. Requests for several choices are always bypassed.
+    """
+    cache = graph_config.response_store
+    if cache is None:
+        return None
+
+    directive = (request.metadata or {}).get(RESPONSE_CACHE_METADATA_KEY)
+    if directive not in {None, RESPONSE_CACHE_BYPASS}:
+        msg = (
+            f"'{RESPONSE_CACHE_METADATA_KEY}' must be '{RESPONSE_CACHE_BYPASS}' "
+            "when set."
+        )
+        raise InvalidResponseCacheError(msg)
+    if directive == RESPONSE_CACHE_BYPASS or (request.n or 1) > 1:
+        return ResponseCacheLookup(ResponseCacheStatus.BYPASS)
+
+    key = response_cache_key(request, graph_config, checkpoint_scope)
+    completion = cache.get(key)
+    if completion is not None:
+        return ResponseCacheLookup(ResponseCacheStatus.HIT, completion)
+    return ResponseCacheLookup(ResponseCacheStatus.MISS, _cache=cache, _key=key)
+
+
+def response_cache_key(
+    request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    checkpoint_scope: str,
+) -> bytes:
+    """
+    Digest the request fields that select a cached or shared response.
+
+    The server-resolved ``checkpoint_scope`` and the request's ``user`` are part
+    of the key, so responses are never cached or shared across the tenants and
+    principals they separate, including through a graph's ``context_factory``.
+    """
+    settings = (
+        graph_config.client_settings.validate_request(request)
+        if graph_config.client_settings is not None
+        else None
+    )
+    # Validated models serialize canonically, so formatting and key order in the
+    # request body do not matter.
+    payload = to_json(
+        [
+            checkpoint_scope,
+            request.user,
+            request.model,
+            bool(request.stream),
+            request.messages,
+            settings,
+        ],
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def merge_text(events: Iterable[str | CustomStreamPart]) -> CachedCompletion:
+    """Join adjacent text deltas so a replay sends fewer chunks."""
+    merged: list[str | CustomStreamPart] = []
+    text: list[str] = []
+    for event in events:
+        if isinstance(event, str):
+            text.append(event)
+            continue
+        if text:
+            merged.append("".join(text))
+            text.clear()
+        merged.append(event)
+    if text:
+        merged.append("".join(text))
+    return tuple(merged)
@@ -0,0 +1,167 @@
+"""Merge streamed text deltas before they become Chat Completions chunks."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from dataclasses import dataclass
+
+from langgraph_openai_serve.graph.graph_registry import StreamCoalescing
+
+STREAM_COALESCE_METADATA_KEY = "langgraph_stream_coalesce"
+STREAM_COALESCE_OFF = "off"
+STREAM_COALESCE_MAX_WINDOW_MS = 1000
+
+# Each event belongs to one choice index; str events are assistant text deltas.
+ChoiceEvent = tuple[int, object]
+
+
+class InvalidStreamCoalescingError(ValueError):
+    """Raised when a request asks for an unsupported coalescing window."""
+
+    param = f"metadata.{STREAM_COALESCE_METADATA_KEY}"
+
+
+def requested_stream_coalescing(
+    metadata: dict[str, str] | None,
+    default: StreamCoalescing | None,
+) -> StreamCoalescing | None:
+    """
+    Apply a request's coalescing override to the graph's policy.
+
+    ``metadata.langgraph_stream_coalesce`` is ``"off"`` or a window in whole
+    milliseconds. A window keeps the graph's other limits, or the defaults when
+    the graph does not coalesce.
+    """
+    value = (metadata or {}).get(STREAM_COALESCE_METADATA_KEY)
+    if value is None:
+        return default
+    if value == STREAM_COALESCE_OFF:
+        return None
+
+    window_ms = int(value) if value.isascii() and value.isdigit() else 0
+    if not 0 < window_ms <= STREAM_COALESCE_MAX_WINDOW_MS:
+        msg = (
+            f"'{STREAM_COALESCE_METADATA_KEY}' must be '{STREAM_COALESCE_OFF}' or "
+            f"a window from 1 to {STREAM_COALESCE_MAX_WINDOW_MS} milliseconds."
+        )
+        raise InvalidStreamCoalescingError(msg)
+
+    return (default or StreamCoalescing()).model_copy(
+        update={"window": window_ms / 1000}
+    )
+
+
+class _TextCoalescer:
+    """Hold text deltas per choice and release them within the policy limits."""
+
+    def __init__(self, coalescing: StreamCoalescing) -> None:
+        self._coalescing = coalescing
+        self._held: dict[int, list[str]] = {}
+        self._held_bytes: dict[int, int] = {}
+        self._held_since = 0.0
+        self._started: set[int] = set()
+
+    def timeout(self) -> float | None:
+        """Return how long to wait for the next event before releasing text."""
+        if not self._held:
+            return None
+        remaining = self._held_since + self._coalescing.window - time.monotonic()
+        return max(min(self._coalescing.idle, remaining), 0)
+
+    def add(self, index: int, text: str) -> list[ChoiceEvent]:
+        """Hold one text delta and return the events ready to send."""
+        if index not in self._started:
+            # The first delta is never delayed, so coalescing keeps TTFT.
+            self._started.add(index)
+            return [(index, text)]
+
+        if not self._held:
+            self._held_since = time.monotonic()
+        self._held.setdefault(index, []).append(text)
+        self._held_bytes[index] = self._held_bytes.get(index, 0) + len(text.encode())
+        if self._held_bytes[index] >= self._coalescing.max_bytes:
+            del self._held_bytes[index]
+            return [(index, "".join(self._held.pop(index)))]
+        if time.monotonic() - self._held_since >= self._coalescing.window:
+            return self.release()
+        return []
+
+    def release(self) -> list[ChoiceEvent]:
+        """Return every held delta, joined per choice."""
+        released: list[ChoiceEvent] = [
+            (index, "".join(parts)) for index, parts in self._held.items()
+        ]
+        self._held.clear()
+        self._held_bytes.clear()
+        return released
+
+
+@dataclass(frozen=True)
+class _SourceFailure:
+    error: Exception
+
+
+async def _pump(
+    events: AsyncGenerator[ChoiceEvent, None],
+    queue: asyncio.Queue[ChoiceEvent | _SourceFailure | None],
+) -> None:
+    try:
+        async with aclosing(events):
+            async for event in events:
+                await queue.put(event)
+    except Exception as exc:  # ruff: ignore[blind-except]
+        # The consumer re-raises it after sending the text already held.
+        await queue.put(_SourceFailure(exc))
+        return
+    await queue.put(None)
+
+
+async def coalesce_text_events(
+    events: AsyncGenerator[ChoiceEvent, None],
+    coalescing: StreamCoalescing,
+) -> AsyncGenerator[ChoiceEvent, None]:
+    """
+    Merge consecutive text deltas of each choice within the coalescing limits.
+
+    Yields:
+        The source events, with held text deltas joined into one event.
+
+    """
+    # A one-slot handoff keeps response backpressure on the source, and waiting on
+    # the queue can time out without cancelling the graph stream itself. None
+    # marks the end of the source.
+    queue: asyncio.Queue[ChoiceEvent | _SourceFailure | None] = asyncio.Queue(maxsize=1)
+
+    # Like the choice producers, the source stays in an asyncio task so LangGraph
+    # teardown sees a single cancellation.
+    pump_task = asyncio.create_task(
+        _pump(events, queue),
+        name="chat-completion-coalescing",
+    )
+    coalescer = _TextCoalescer(coalescing)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), coalescer.timeout())
+            except TimeoutError:
+                released = coalescer.release()
+            else:
+                if item is None or isinstance(item, _SourceFailure):
+                    for event in coalescer.release():
+                        yield event
+                    if item is None:
+                        return
+                    raise item.error
+
+                index, event = item
+                released = (
+                    coalescer.add(index, event)
+                    if isinstance(event, str)
+                    else [*coalescer.release(), item]
+                )
+            for event in released:
+                yield event
+    finally:
+        pump_task.cancel()
+        await asyncio.gather(pump_task, return_exceptions=True)
@@ -0,0 +1,97 @@
+"""Decode Chat Completions request bodies."""
+
+import email.message
+import json
+from typing import Any
+
+from fastapi import HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+
+_BODY_LOCATION = ("body",)
+
+
+def decode_chat_completion_request(
+    body: bytes,
+    content_type: str | None,
+) -> ChatCompletionRequest:
+    """
+    Parse and validate a Chat Completions request body in one pass.
+
+    JSON bodies are validated by pydantic-core straight from bytes, without
+    building an intermediate Python object tree. Bodies it rejects are decoded
+    again the way FastAPI decodes a request model, so clients see the same
+    ``RequestValidationError`` either way.
+    """
+    if body and _is_json_content_type(content_type):
+        try:
+            return ChatCompletionRequest.model_validate_json(body)
+        except ValidationError:
+            pass
+    return _decode_like_fastapi(body, content_type)
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    # FastAPI's strict content-type check leaves other bodies undecoded.
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def _decode_like_fastapi(
+    body: bytes,
+    content_type: str | None,
+) -> ChatCompletionRequest:
+    data: Any = body or None
+    if body and _is_json_content_type(content_type):
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "json_invalid",
+                        "loc": (*_BODY_LOCATION, e.pos),
+                        "msg": "JSON decode error",
+                        "input": {},
+                        "ctx": {"error": e.msg},
+                    }
+                ],
+                body=e.doc,
+            ) from e
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="There was an error parsing the body",
+            ) from e
+
+    if data is None:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": _BODY_LOCATION,
+                    "msg": "Field required",
+                    "input": None,
+                }
+            ],
+            body=data,
+        )
+
+    try:
+        return ChatCompletionRequest.model_validate(data, from_attributes=True)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": (*_BODY_LOCATION, *error["loc"])}
+                for error in e.errors(include_url=False)
+            ],
+            body=data,
+        ) from e
@@ -3,6 +3,7 @@
 import json
 import time
 import uuid
+from json.encoder import encode_basestring_ascii
 
 from langgraph.types import Interrupt
 from openai.types.chat.chat_completion_message import Annotation
@@ -35,23 +36,15 @@ from langgraph_openai_serve.graph.runner import LangGraphOutput
 def chat_completion_response(
     *,
     model: str,
-    completion: LangGraphOutput,
-    annotations: list[Annotation] | None = None,
+    choices: list[ChatCompletionResponseChoice],
     usage: dict[str, int],
 ) -> ChatCompletionResponse:
     """Build a non-streaming OpenAI-compatible chat completion response."""
-    message, finish_reason = response_message(completion, annotations)
     return ChatCompletionResponse(
         id=f"chatcmpl-{uuid.uuid4()}",
         created=int(time.time()),
         model=model,
-        choices=[
-            ChatCompletionResponseChoice(
-                index=0,
-                message=message,
-                finish_reason=finish_reason,
-            )
-        ],
+        choices=choices,
         usage=UsageInfo(
             prompt_tokens=usage["prompt_tokens"],
             completion_tokens=usage["completion_tokens"],
@@ -60,6 +53,20 @@ def chat_completion_response(
     )
 
 
+def response_choice(
+    index: int,
+    completion: LangGraphOutput,
+    annotations: list[Annotation] | None = None,
+) -> ChatCompletionResponseChoice:
+    """Format one response choice."""
+    message, finish_reason = response_message(completion, annotations)
+    return ChatCompletionResponseChoice(
+        index=index,
+        message=message,
+        finish_reason=finish_reason,
+    )
+
+
 def response_message(
     completion: LangGraphOutput,
     annotations: list[Annotation] | None = None,
@@ -116,26 +123,46 @@ def interrupt_tool_arguments(
 
 
 class ChatCompletionStreamResponseBuilder:
-    """Build OpenAI-compatible chat completion SSE chunks."""
+    """
+    Build OpenAI-compatible chat completion SSE chunks.
+
+    Role, text, client event and plain finish chunks are spliced into an envelope
+    encoded once per response, because ``id``, ``created`` and ``model`` never
+    change within it. Their bytes match ``json.dumps`` of the validated response
+    models; interrupts and annotated finishes still go through those models.
+    """
 
     def __init__(self, model: str) -> None:
         self.response_id = f"chatcmpl-{uuid.uuid4()}"
         self.created = int(time.time())
         self.model = model
+        self._choice_prefix = (
+            f'data: {{"id": {json.dumps(self.response_id)}, '
+            f'"object": "chat.completion.chunk", "created": {self.created}, '
+            f'"model": {json.dumps(model)}, "choices": [{{"index": '
+        )
 
-    def role(self) -> str:
+    def role(self, index: int = 0) -> str:
         """Stream role."""
-        return self._chunk(ChatCompletionStreamResponseDelta(role=Role.ASSISTANT))
+        return (
+            f'{self._choice_prefix}{index}, "delta": {{"role": "{Role.ASSISTANT}"}}}}]}}'
+            "\n\n"
+        )
 
-    def text(self, content: str) -> str:
+    def text(self, content: str, index: int = 0) -> str:
         """Stream text content."""
-        return self._chunk(ChatCompletionStreamResponseDelta(content=content))
+        return (
+            f'{self._choice_prefix}{index}, "delta": '
+            f'{{"content": {encode_basestring_ascii(content)}}}}}]}}\n\n'
+        )
 
-    def client_event(self, extension: dict[str, object]) -> str:
+    def client_event(self, extension: dict[str, object], index: int = 0) -> str:
         """Build an empty-delta chunk carrying the opt-in event extension."""
-        return self._chunk(
-            ChatCompletionStreamResponseDelta(),
-            client_event_extension=extension,
+        # Event extensions remain complete Chat Completions chunks; their empty
+        # delta keeps extension data separate from assistant text.
+        return (
+            f'{self._choice_prefix}{index}, "delta": {{}}}}], '
+            f'"langgraph_openai_serve": {json.dumps(extension)}}}\n\n'
         )
 
     def interrupt(self, batch: LangGraphInterruptBatch) -> str:
@@ -162,14 +189,46 @@ class ChatCompletionStreamResponseBuilder:
         finish_reason: str,
         *,
         annotations: list[Annotation] | None = None,
+        index: int = 0,
     ) -> str:
         """Stream finish."""
+        if not annotations:
+            return (
+                f'{self._choice_prefix}{index}, "delta": {{}}, '
+                f'"finish_reason": {encode_basestring_ascii(finish_reason)}}}]}}\n\n'
+            )
         return self._chunk(
             ChatCompletionStreamResponseDelta(),
+            index=index,
             finish_reason=finish_reason,
             annotations=annotations,
         )
 
+    def usage(self, usage: dict[str, int]) -> str:
+        """Stream the final usage chunk, which has no choices."""
+        return self._format_data(
+            ChatCompletionStreamResponse(
+                id=self.response_id,
+                created=self.created,
+                model=self.model,
+                choices=[],
+                usage=UsageInfo(**usage),
+            ).model_dump(mode="json", exclude_none=True)
+        )
+
+    def server_timing(self, milliseconds: dict[str, float]) -> str:
+        """Stream the opt-in timing chunk, which has no choices."""
+        return self._format_data(
+            {
+                "id": self.response_id,
+                "object": "chat.completion.chunk",
+                "created": self.created,
+                "model": self.model,
+                "choices": [],
+                "langgraph_openai_serve": {"server_timing": milliseconds},
+            }
+        )
+
     def error(self, message: str) -> str:
         """Stream error."""
         return self._format_data(
@@ -183,9 +242,10 @@ class ChatCompletionStreamResponseBuilder:
     def _chunk(
         self,
         delta: ChatCompletionStreamResponseDelta,
+        *,
+        index: int = 0,
         finish_reason: str | None = None,
         annotations: list[Annotation] | None = None,
-        client_event_extension: dict[str, object] | None = None,
     ) -> str:
         response = ChatCompletionStreamResponse(
             id=self.response_id,
@@ -193,7 +253,7 @@ class ChatCompletionStreamResponseBuilder:
             model=self.model,
             choices=[
                 ChatCompletionStreamResponseChoice(
-                    index=0,
+                    index=index,
                     delta=delta,
                     finish_reason=finish_reason,
                 )
@@ -210,11 +270,6 @@ class ChatCompletionStreamResponseBuilder:
                 annotation.model_dump(mode="json", exclude_none=True)
                 for annotation in annotations
             ]
-        if client_event_extension is not None:
-            # Event extensions remain complete Chat Completions chunks; their
-            # empty delta keeps extension data separate from assistant text.
-            data["choices"][0]["delta"] = {}
-            data["langgraph_openai_serve"] = client_event_extension
         return self._format_data(data)
 
     def _format_data(self, data: dict) -> str:  # ruff: ignore[no-self-use]
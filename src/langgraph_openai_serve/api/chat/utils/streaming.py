@@ -5,7 +5,7 @@ Starlette owns response consumption, not the nested graph producer, so a client
 disconnect may leave graph and provider work running. The request dependency
 creates a ``_StreamOwner``; the route passes ``start()``'s receive stream to
 ``StreamingResponse``, and dependency cleanup cancels the producer and releases
-its ``GraphRun``.
+its ``GraphRun`` values.
 
 AnyIO still provides the channel and cleanup shield, but its task-group level
 cancellation can repeatedly interrupt LangGraph's asyncio-native teardown. The
@@ -14,13 +14,14 @@ at the stream boundary.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import aclosing
 
 from anyio import CancelScope, create_memory_object_stream
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.metrics import serving_metrics
 from langgraph_openai_serve.graph.utils import GraphRun
 
 logger = get_logger(__name__)
@@ -31,15 +32,18 @@ class _StreamOwner:
 
     def __init__(self) -> None:
         self._started = False
+        self._model: str | None = None
         self._producer: asyncio.Task[None] | None = None
-        self._run: GraphRun | None = None
+        self._runs: Sequence[GraphRun] = ()
         self._send_stream: MemoryObjectSendStream[str] | None = None
         self._receive_stream: MemoryObjectReceiveStream[str] | None = None
 
     def start(
         self,
         source: AsyncGenerator[str, None],
-        run: GraphRun,
+        runs: Sequence[GraphRun],
+        *,
+        model: str,
     ) -> MemoryObjectReceiveStream[str]:
         if self._started:
             msg = "A stream owner can only start one producer."
@@ -52,12 +56,14 @@ class _StreamOwner:
         )
 
         async def produce() -> None:
-            async with aclosing(source), send_stream:
-                async for chunk in source:
-                    await send_stream.send(chunk)
+            with serving_metrics().track_run(model):
+                async with aclosing(source), send_stream:
+                    async for chunk in source:
+                        await send_stream.send(chunk)
 
         self._started = True
-        self._run = run
+        self._model = model
+        self._runs = tuple(runs)
         self._send_stream = send_stream
         self._receive_stream = receive_stream
         self._producer = asyncio.create_task(produce(), name="chat-completion-stream")
@@ -65,8 +71,8 @@ class _StreamOwner:
 
     async def aclose(self) -> None:
         producer = self._producer
-        run = self._run
-        if run is None:
+        runs = self._runs
+        if producer is None and not runs:
             return
 
         # Cleanup may run inside the request's cancelled scope, so shield nested
@@ -74,22 +80,24 @@ class _StreamOwner:
         with CancelScope(shield=True):
             primary_error: BaseException | None = None
             try:
-                await self._stop_producer(producer)
+                if await self._stop_producer(producer) and self._model is not None:
+                    serving_metrics().stream_cancelled(self._model)
             except BaseException as exc:
                 primary_error = exc
                 raise
             finally:
                 try:
-                    await self._close_run(run, primary_error)
+                    await self._close_runs(runs, primary_error)
                 finally:
                     self._reset()
 
     @staticmethod
     async def _stop_producer(
         producer: asyncio.Task[None] | None,
-    ) -> None:
+    ) -> bool:
+        """Stop the producer, returning whether it was cancelled unfinished."""
         if producer is None:
-            return
+            return False
 
         cancel_requested = False
         if not producer.done():
@@ -100,18 +108,25 @@ class _StreamOwner:
         except asyncio.CancelledError:
             if not cancel_requested:
                 raise
+        return cancel_requested
 
     @staticmethod
-    async def _close_run(
-        run: GraphRun,
+    async def _close_runs(
+        runs: Sequence[GraphRun],
         primary_error: BaseException | None,
     ) -> None:
-        try:
-            await run.aclose()
-        except Exception:
-            if primary_error is None:
-                raise
-            logger.exception("chat_completion.stream_cleanup_failed")
+        # Close every run before reporting the first cleanup failure.
+        cleanup_error: Exception | None = None
+        for run in runs:
+            try:
+                await run.aclose()
+            except Exception as exc:
+                if primary_error is not None or cleanup_error is not None:
+                    logger.exception("chat_completion.stream_cleanup_failed")
+                else:
+                    cleanup_error = exc
+        if cleanup_error is not None:
+            raise cleanup_error
 
     def _reset(self) -> None:
         if self._send_stream is not None:
@@ -119,6 +134,7 @@ class _StreamOwner:
         if self._receive_stream is not None:
             self._receive_stream.close()
         self._producer = None
-        self._run = None
+        self._model = None
+        self._runs = ()
         self._send_stream = None
         self._receive_stream = None
@@ -0,0 +1,58 @@
+"""Report the phase timings of the graph runs behind a chat completion."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.graph.timing import RunTimings
+
+logger = get_logger(__name__)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+SERVER_TIMING_METADATA_KEY = "langgraph_server_timing"
+SERVER_TIMING_METADATA_VALUE = "v1"
+
+
+def server_timing_requested(metadata: dict[str, str] | None) -> bool:
+    """Return whether a stream opted into its trailing timing chunk."""
+    return (metadata or {}).get(SERVER_TIMING_METADATA_KEY) == (
+        SERVER_TIMING_METADATA_VALUE
+    )
+
+
+@dataclass
+class ServerTiming:
+    """The combined phase timings of the runs that produced one response."""
+
+    timings: RunTimings = field(default_factory=RunTimings)
+
+    @property
+    def milliseconds(self) -> dict[str, float]:
+        """Milliseconds spent in each measured phase."""
+        return {
+            phase: round(seconds * 1000, 3)
+            for phase, seconds in self.timings.seconds().items()
+        }
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """A ``Server-Timing`` header, or none when no run was timed."""
+        milliseconds = self.milliseconds
+        if not milliseconds:
+            return {}
+        return {
+            SERVER_TIMING_HEADER: ", ".join(
+                f"{phase};dur={duration}" for phase, duration in milliseconds.items()
+            )
+        }
+
+    def finish(self, runs: Iterable[RunTimings]) -> None:
+        """Combine the timings of finished runs and log the completed request."""
+        self.timings = RunTimings.slowest(runs)
+        logger.info(
+            "chat_completion.completed",
+            extra={
+                f"timing.{phase}_ms": duration
+                for phase, duration in self.milliseconds.items()
+            },
+        )
@@ -5,14 +5,18 @@ This module provides the FastAPI router for the chat completion endpoint,
 implementing an OpenAI-compatible interface.
 """
 
-from typing import Annotated
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from fastapi.responses import StreamingResponse
 from openai.types.shared import ErrorObject
 
 from langgraph_openai_serve.api.chat import service as chat_service
 from langgraph_openai_serve.api.chat.deps import (
+    chat_completion_request_dependency,
     checkpoint_scope_dependency,
     stream_owner_dependency,
 )
@@ -20,37 +24,75 @@ from langgraph_openai_serve.api.chat.schemas import (
     ChatCompletionRequest,
     ChatCompletionResponse,
 )
+from langgraph_openai_serve.api.chat.utils.budget import (
+    REQUEST_TIMEOUT_HEADER,
+    InvalidRunBudgetError,
+    requested_run_budget,
+)
+from langgraph_openai_serve.api.chat.utils.caching import (
+    InvalidResponseCacheError,
+    ResponseCacheLookup,
+    ResponseCacheStatus,
+    lookup_response_cache,
+)
+from langgraph_openai_serve.api.chat.utils.coalescing import (
+    InvalidStreamCoalescingError,
+    requested_stream_coalescing,
+)
 from langgraph_openai_serve.api.chat.utils.interrupts import (
     InvalidInterruptPayloadError,
     InvalidResumeRequestError,
 )
 from langgraph_openai_serve.api.chat.utils.streaming import _StreamOwner
+from langgraph_openai_serve.api.chat.utils.timing import ServerTiming
 from langgraph_openai_serve.api.models.deps import get_graph_registry_dependency
 from langgraph_openai_serve.core.errors import OpenAIHTTPException
 from langgraph_openai_serve.core.logging import bind_log_context
+from langgraph_openai_serve.core.metrics import serving_metrics, start_request_clock
+from langgraph_openai_serve.graph.admission import GraphOverloadedError
+from langgraph_openai_serve.graph.budget import RunBudget, RunBudgetExceededError
 from langgraph_openai_serve.graph.client_settings import ClientSettingsValidationError
 from langgraph_openai_serve.graph.graph_registry import (
+    GraphConfig,
     GraphConfigurationError,
     GraphNotFoundError,
     GraphRegistry,
+    StreamCoalescing,
+)
+from langgraph_openai_serve.graph.interrupt.coordination import (
+    RunBusyError,
+    RunLeaseLostError,
 )
-from langgraph_openai_serve.graph.interrupt.coordination import RunBusyError
 from langgraph_openai_serve.graph.interrupt.state import (
     RUN_METADATA_KEY,
     InterruptStateConflictError,
     InvalidRunIDError,
 )
-from langgraph_openai_serve.graph.utils import prepare_run
+from langgraph_openai_serve.graph.utils import (
+    GraphRun,
+    UnsupportedChoiceCountError,
+    prepare_choice_runs,
+)
 from langgraph_openai_serve.utils.message import InvalidChatMessageError
 
+if TYPE_CHECKING:
+    from langgraph_openai_serve.graph.response_cache import CachedCompletion
+
 router = APIRouter(tags=["openai"])
+_CHAT_COMPLETIONS_PATH = "/chat/completions"
 _CLIENT_ERROR_TYPES = (
     InvalidRunIDError,
     InvalidResumeRequestError,
     GraphNotFoundError,
     ClientSettingsValidationError,
     InvalidChatMessageError,
+    UnsupportedChoiceCountError,
+    InvalidStreamCoalescingError,
+    InvalidResponseCacheError,
+    InvalidRunBudgetError,
 )
+_UNKNOWN_MODEL_LABEL = "unknown"
+_ChoiceRunPreparer = Callable[[], Awaitable[list[GraphRun]]]
 
 
 def client_error_param(error: Exception) -> str | None:
@@ -62,25 +104,62 @@ def client_error_param(error: Exception) -> str | None:
             return f"metadata.{RUN_METADATA_KEY}"
         case InvalidResumeRequestError() | InvalidChatMessageError():
             return "messages"
-        case ClientSettingsValidationError():
+        case (
+            ClientSettingsValidationError()
+            | InvalidStreamCoalescingError()
+            | InvalidResponseCacheError()
+            | InvalidRunBudgetError()
+        ):
             return error.param
+        case UnsupportedChoiceCountError():
+            return "n"
         case _:
             return None
 
 
+def _request_body_openapi() -> dict[str, Any]:
+    # The body is decoded by a dependency, so FastAPI cannot document it. Nested
+    # models stay in the schema's own $defs, referenced by document pointer.
+    schema_pointer = (
+        f"#/paths/{_CHAT_COMPLETIONS_PATH.replace('/', '~1')}"
+        "/post/requestBody/content/application~1json/schema"
+    )
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": ChatCompletionRequest.model_json_schema(
+                        ref_template=f"{schema_pointer}/$defs/{{model}}",
+                    ),
+                },
+            },
+        },
+    }
+
+
 @router.post(
-    "/chat/completions",
+    _CHAT_COMPLETIONS_PATH,
     response_model=ChatCompletionResponse,
     response_model_exclude_none=True,
+    openapi_extra=_request_body_openapi(),
 )
-async def create_chat_completion(
-    chat_request: ChatCompletionRequest,
+async def create_chat_completion(  # ruff: ignore[too-many-arguments, too-many-positional-arguments]
+    chat_request: Annotated[
+        ChatCompletionRequest,
+        Depends(chat_completion_request_dependency),
+    ],
     graph_registry: Annotated[GraphRegistry, Depends(get_graph_registry_dependency)],
     checkpoint_scope: Annotated[str, Depends(checkpoint_scope_dependency)],
     stream_owner: Annotated[
         _StreamOwner,
         Depends(stream_owner_dependency, scope="request"),
     ],
+    http_response: Response,
+    request_timeout: Annotated[
+        str | None,
+        Header(alias=REQUEST_TIMEOUT_HEADER, include_in_schema=False),
+    ] = None,
 ) -> StreamingResponse | ChatCompletionResponse:
     """
     Create a chat completion.
@@ -92,6 +171,9 @@ async def create_chat_completion(
         graph_registry: The graph registry dependency.
         checkpoint_scope: The checkpoint scope boundary.
         stream_owner: The request-scoped streaming task owner.
+        http_response: The response whose headers report the cache status and
+            the ``Server-Timing`` of a completed run.
+        request_timeout: The client's deadline in seconds, if it sent one.
 
     Returns:
         A chat completion response, either as a complete response or as a stream.
@@ -101,61 +183,295 @@ async def create_chat_completion(
         model=chat_request.model,
         stream=chat_request.stream,
     )
+    start_request_clock()
+    server_timing = ServerTiming()
 
+    with _count_request(chat_request, graph_registry):
+        try:
+            graph_config = graph_registry.get_graph(chat_request.model)
+            cache_lookup = lookup_response_cache(
+                chat_request,
+                graph_config,
+                checkpoint_scope,
+            )
+            # The deadline starts before the request waits for admission.
+            budget = requested_run_budget(
+                chat_request.metadata,
+                request_timeout,
+                graph_config.execution_budget,
+            )
+            response = await _completion_response(
+                chat_request,
+                graph_config,
+                _choice_run_preparer(
+                    chat_request, graph_registry, checkpoint_scope, budget
+                ),
+                checkpoint_scope,
+                stream_owner,
+                cache_lookup,
+                server_timing,
+            )
+        except RunBudgetExceededError as e:
+            raise _budget_exceeded_exception(e) from e
+        except GraphOverloadedError as e:
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                error=ErrorObject(
+                    message=str(e),
+                    type="requests",
+                    code="rate_limit_exceeded",
+                ),
+                headers={"Retry-After": str(e.retry_after)},
+            ) from e
+        except RunBusyError as e:
+            serving_metrics().run_busy(chat_request.model)
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                error=ErrorObject(
+                    message=str(e),
+                    type="invalid_request_error",
+                    code="run_busy",
+                ),
+            ) from e
+        except RunLeaseLostError as e:
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                error=ErrorObject(
+                    message=str(e),
+                    type="server_error",
+                    code="run_lease_lost",
+                ),
+            ) from e
+        except InterruptStateConflictError as e:
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                error=ErrorObject(
+                    message=str(e),
+                    type="invalid_request_error",
+                    param="messages",
+                    code="interrupt_state_conflict",
+                ),
+            ) from e
+        except _CLIENT_ERROR_TYPES as e:
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                error=ErrorObject(
+                    message=str(e),
+                    type="invalid_request_error",
+                    param=client_error_param(e),
+                ),
+            ) from e
+        except (GraphConfigurationError, InvalidInterruptPayloadError) as e:
+            raise OpenAIHTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error=ErrorObject(
+                    message=str(e),
+                    type="server_error",
+                ),
+            ) from e
+    if cache_lookup is not None:
+        http_response.headers.update(cache_lookup.headers)
+    http_response.headers.update(server_timing.headers)
+    return response
+
+
+def _budget_exceeded_exception(error: RunBudgetExceededError) -> OpenAIHTTPException:
+    """Blame the client only for limits it asked for itself."""
+    if error.requested:
+        status_code, error_type = status.HTTP_400_BAD_REQUEST, "invalid_request_error"
+    elif error.code == "deadline_exceeded":
+        status_code, error_type = status.HTTP_504_GATEWAY_TIMEOUT, "server_error"
+    else:
+        status_code, error_type = status.HTTP_500_INTERNAL_SERVER_ERROR, "server_error"
+    return OpenAIHTTPException(
+        status_code=status_code,
+        error=ErrorObject(message=str(error), type=error_type, code=error.code),
+    )
+
+
+@contextmanager
+def _count_request(
+    chat_request: ChatCompletionRequest,
+    graph_registry: GraphRegistry,
+) -> Iterator[None]:
+    """Count the request by the status code its response starts with."""
+    # Unregistered names are not labels, so clients cannot grow the series.
+    model = (
+        chat_request.model
+        if chat_request.model in graph_registry.registry
+        else _UNKNOWN_MODEL_LABEL
+    )
+    count = partial(
+        serving_metrics().request_finished,
+        model,
+        stream=bool(chat_request.stream),
+    )
     try:
-        run = await prepare_run(
-            chat_request.model,
-            chat_request.messages,
-            graph_registry,
+        yield
+    except OpenAIHTTPException as e:
+        count(status_code=e.status_code)
+        raise
+    except Exception:
+        count(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        raise
+    count(status_code=status.HTTP_200_OK)
+
+
+async def _completion_response(  # ruff: ignore[too-many-arguments, too-many-positional-arguments]
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    prepare_runs: _ChoiceRunPreparer,
+    checkpoint_scope: str,
+    stream_owner: _StreamOwner,
+    cache_lookup: ResponseCacheLookup | None,
+    server_timing: ServerTiming,
+) -> StreamingResponse | ChatCompletionResponse:
+    """Serve a cached response, or prepare and run the graph for every choice."""
+    if cache_lookup is not None and cache_lookup.completion is not None:
+        return _cached_response(chat_request, graph_config, cache_lookup)
+
+    coalescing = (
+        requested_stream_coalescing(
+            chat_request.metadata,
+            graph_config.stream_coalescing,
+        )
+        if chat_request.stream
+        else None
+    )
+    # Only a miss stores the completed response.
+    response_cache = (
+        cache_lookup
+        if cache_lookup is not None and cache_lookup.status is ResponseCacheStatus.MISS
+        else None
+    )
+
+    if not chat_request.stream:
+        return await _complete(
             chat_request,
-            checkpoint_scope=checkpoint_scope,
+            graph_config,
+            prepare_runs,
+            checkpoint_scope,
+            response_cache,
+            server_timing,
         )
 
-        if chat_request.stream:
-            body = stream_owner.start(
-                chat_service.stream_completion(chat_request, run),
-                run,
-            )
-            return StreamingResponse(
-                body,
-                media_type="text/event-stream",
+    source, runs = await _stream_source(
+        chat_request,
+        graph_config,
+        prepare_runs,
+        checkpoint_scope,
+        coalescing,
+        response_cache,
+    )
+    body = stream_owner.start(source, runs, model=chat_request.model)
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers=cache_lookup.headers if cache_lookup is not None else None,
+    )
+
+
+async def _complete(  # ruff: ignore[too-many-arguments, too-many-positional-arguments]
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    prepare_runs: _ChoiceRunPreparer,
+    checkpoint_scope: str,
+    response_cache: ResponseCacheLookup | None,
+    server_timing: ServerTiming,
+) -> ChatCompletionResponse:
+    """Run the graph for every choice, or share one run with identical requests."""
+    with serving_metrics().track_run(chat_request.model):
+        if _shares_run(chat_request, graph_config):
+            return await chat_service.generate_shared_completion(
+                chat_request,
+                graph_config,
+                _single_run_preparer(prepare_runs),
+                checkpoint_scope=checkpoint_scope,
+                response_cache=response_cache,
+                server_timing=server_timing,
             )
 
-        response = await chat_service.generate_completion(chat_request, run)
-    except RunBusyError as e:
-        raise OpenAIHTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            error=ErrorObject(
-                message=str(e),
-                type="invalid_request_error",
-                code="run_busy",
-            ),
-        ) from e
-    except InterruptStateConflictError as e:
-        raise OpenAIHTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            error=ErrorObject(
-                message=str(e),
-                type="invalid_request_error",
-                param="messages",
-                code="interrupt_state_conflict",
-            ),
-        ) from e
-    except _CLIENT_ERROR_TYPES as e:
-        raise OpenAIHTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            error=ErrorObject(
-                message=str(e),
-                type="invalid_request_error",
-                param=client_error_param(e),
-            ),
-        ) from e
-    except (GraphConfigurationError, InvalidInterruptPayloadError) as e:
-        raise OpenAIHTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error=ErrorObject(
-                message=str(e),
-                type="server_error",
-            ),
-        ) from e
-    return response
+        return await chat_service.generate_completion(
+            chat_request,
+            await prepare_runs(),
+            response_cache=response_cache,
+            server_timing=server_timing,
+        )
+
+
+async def _stream_source(  # ruff: ignore[too-many-arguments, too-many-positional-arguments]
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    prepare_runs: _ChoiceRunPreparer,
+    checkpoint_scope: str,
+    coalescing: StreamCoalescing | None,
+    response_cache: ResponseCacheLookup | None,
+) -> tuple[AsyncGenerator[str, None], Sequence[GraphRun]]:
+    """Start a response stream and return it with the runs the request owns."""
+    if _shares_run(chat_request, graph_config):
+        # A shared run belongs to all of its subscribers, not to this request.
+        source = await chat_service.stream_shared_completion(
+            chat_request,
+            graph_config,
+            _single_run_preparer(prepare_runs),
+            checkpoint_scope=checkpoint_scope,
+            coalescing=coalescing,
+            response_cache=response_cache,
+        )
+        return source, ()
+
+    runs = await prepare_runs()
+    source = chat_service.stream_completion(
+        chat_request,
+        runs,
+        coalescing=coalescing,
+        response_cache=response_cache,
+    )
+    return source, runs
+
+
+def _shares_run(chat_request: ChatCompletionRequest, graph_config: GraphConfig) -> bool:
+    return graph_config.in_flight is not None and (chat_request.n or 1) == 1
+
+
+def _choice_run_preparer(
+    chat_request: ChatCompletionRequest,
+    graph_registry: GraphRegistry,
+    checkpoint_scope: str,
+    budget: RunBudget,
+) -> _ChoiceRunPreparer:
+    async def prepare_runs() -> list[GraphRun]:
+        return await prepare_choice_runs(
+            chat_request,
+            graph_registry,
+            checkpoint_scope=checkpoint_scope,
+            budget=budget,
+        )
+
+    return prepare_runs
+
+
+def _single_run_preparer(
+    prepare_runs: _ChoiceRunPreparer,
+) -> Callable[[], Awaitable[GraphRun]]:
+    async def prepare_run() -> GraphRun:
+        (run,) = await prepare_runs()
+        return run
+
+    return prepare_run
+
+
+def _cached_response(
+    chat_request: ChatCompletionRequest,
+    graph_config: GraphConfig,
+    cache_lookup: ResponseCacheLookup,
+) -> StreamingResponse | ChatCompletionResponse:
+    """Serve a response cache hit without preparing a graph run."""
+    completion = cast("CachedCompletion", cache_lookup.completion)
+    if not chat_request.stream:
+        return chat_service.cached_completion(chat_request, completion)
+    return StreamingResponse(
+        chat_service.stream_cached_completion(chat_request, graph_config, completion),
+        media_type="text/event-stream",
+        headers=cache_lookup.headers,
+    )
@@ -1,17 +1,26 @@
-"""Pure ASGI middleware for request correlation."""
+"""Pure ASGI middleware for request correlation, body limits and profiling."""
 
 from __future__ import annotations
 
 import uuid
+from functools import partial
 from typing import TYPE_CHECKING
 
+from anyio import CancelScope, to_thread
+from fastapi import status
+from fastapi.responses import JSONResponse
+from openai.types.shared import ErrorObject
 from starlette.datastructures import Headers, MutableHeaders
 
 if TYPE_CHECKING:
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+    from langgraph_openai_serve.core.profiling import RequestProfile, RequestProfiler
+
+from langgraph_openai_serve.core.errors import OpenAIHTTPException, openai_error_payload
 from langgraph_openai_serve.core.logging import (
     begin_log_context,
+    get_log_context,
     reset_log_context,
 )
 
@@ -60,3 +69,93 @@ def _usable_request_id(request_id: str) -> bool:
         and request_id.isascii()
         and request_id.isprintable()
     )
+
+
+class RequestBodyLimitMiddleware:
+    """Reject request bodies larger than a byte limit before they are parsed."""
+
+    def __init__(self, app: ASGIApp, *, max_body_bytes: int) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check the declared length, then count the bytes actually received."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            response = JSONResponse(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                content=openai_error_payload(self._error()),
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised inside the endpoint, so the OpenAI handlers render it.
+                    raise OpenAIHTTPException(
+                        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                        error=self._error(),
+                    )
+            return message
+
+        await self.app(scope, receive_wrapper, send)
+
+    def _error(self) -> ErrorObject:
+        return ErrorObject(
+            message=f"Request body exceeds the limit of {self.max_body_bytes} bytes.",
+            type="invalid_request_error",
+            code="request_body_too_large",
+        )
+
+
+class RequestProfilingMiddleware:
+    """
+    Sample the stacks of selected requests and keep profiles of slow ones.
+
+    It must run inside ``RequestContextMiddleware``, whose context names the
+    request ID and the model a chat completion bound.
+    """
+
+    def __init__(self, app: ASGIApp, *, profiler: RequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile a selected HTTP request until its response is complete."""
+        profile = self.profiler.start() if scope["type"] == "http" else None
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Cancelled requests are often the slowest, so they are kept too.
+            with CancelScope(shield=True):
+                await self._finish(profile)
+
+    async def _finish(self, profile: RequestProfile) -> None:
+        context = get_log_context()
+        model = context.get("model")
+        model = model if isinstance(model, str) else None
+        if not self.profiler.finish(profile, model=model) or model is None:
+            return
+        request_id = context.get("request_id")
+        await to_thread.run_sync(
+            partial(
+                self.profiler.write,
+                profile,
+                request_id=request_id if isinstance(request_id, str) else None,
+                model=model,
+            )
+        )
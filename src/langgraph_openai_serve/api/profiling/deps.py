@@ -0,0 +1,33 @@
+"""Dependencies for request profiler routes."""
+
+import secrets
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from langgraph_openai_serve.core.profiling import RequestProfiler
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def get_request_profiler_dependency(request: Request) -> RequestProfiler:
+    """Get the request profiler from application state."""
+    return request.app.state.request_profiler
+
+
+def require_profiler_admin(
+    request: Request,
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_bearer)],
+) -> None:
+    """Reject requests that do not carry the profiler admin bearer token."""
+    expected = request.app.state.profiler_admin_token.get_secret_value()
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(),
+        expected.encode(),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid profiler admin token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
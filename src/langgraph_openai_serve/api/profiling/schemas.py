@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ArmProfilerRequest(BaseModel):
+    """Profile the next requests for one model regardless of their duration."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    model: str
+    requests: Annotated[int, Field(ge=1, le=1000)] = 1
+
+
+class ArmProfilerResponse(BaseModel):
+    """Requests for the model that will still be profiled."""
+
+    model: str
+    requests: int
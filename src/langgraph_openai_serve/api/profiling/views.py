@@ -0,0 +1,52 @@
+"""
+Request profiler router.
+
+This module provides admin-only endpoints mounted on the host app for
+controlling the tail-triggered request profiler.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from langgraph_openai_serve.api.models.deps import get_graph_registry_dependency
+from langgraph_openai_serve.api.profiling.deps import (
+    get_request_profiler_dependency,
+    require_profiler_admin,
+)
+from langgraph_openai_serve.api.profiling.schemas import (
+    ArmProfilerRequest,
+    ArmProfilerResponse,
+)
+from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.profiling import RequestProfiler
+from langgraph_openai_serve.graph.graph_registry import GraphRegistry
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/admin/profiler",
+    tags=["admin"],
+    dependencies=[Depends(require_profiler_admin)],
+    include_in_schema=False,
+)
+
+
+@router.post("/arm")
+def arm_profiler(
+    body: ArmProfilerRequest,
+    profiler: Annotated[RequestProfiler, Depends(get_request_profiler_dependency)],
+    graph_registry: Annotated[GraphRegistry, Depends(get_graph_registry_dependency)],
+) -> ArmProfilerResponse:
+    """Profile the next requests for a model whatever their duration."""
+    if body.model not in graph_registry.registry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Model '{body.model}' is not registered.",
+        )
+    profiler.arm(body.model, body.requests)
+    logger.info(
+        "request_profiler.armed",
+        extra={"model": body.model, "requests": body.requests},
+    )
+    return ArmProfilerResponse(model=body.model, requests=profiler.armed(body.model))
@@ -0,0 +1,89 @@
+"""Serving metrics recorded by the chat completion route and its streams."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+
+from langgraph_openai_serve.core.settings import settings
+
+_request_started_at: ContextVar[float | None] = ContextVar(
+    "_request_started_at",
+    default=None,
+)
+
+
+class ServingMetrics:
+    """
+    Record the signals used to autoscale and alert on chat completions.
+
+    This base class records nothing, so instrumented code costs a method call
+    when metrics are disabled. ``LGOS_ENABLE_METRICS`` selects the Prometheus
+    implementation.
+    """
+
+    # Lets hot paths skip timing work that would only be discarded.
+    enabled = False
+
+    def request_finished(self, model: str, *, stream: bool, status_code: int) -> None:
+        """Count a request by the status code its response started with."""
+
+    def run_started(self, model: str) -> None:
+        """Count a request whose graph runs are now executing."""
+
+    def run_finished(self, model: str, seconds: float) -> None:
+        """Record how long a request's graph runs took, including its stream."""
+
+    def first_token(self, model: str, seconds: float) -> None:
+        """Record the time from request arrival to a stream's first text."""
+
+    def inter_token(self, model: str, seconds: float) -> None:
+        """Record the gap between two text chunks of a stream."""
+
+    def stream_finished(self, model: str, chunks: int) -> None:
+        """Record how many text chunks a completed stream sent."""
+
+    def stream_cancelled(self, model: str) -> None:
+        """Count a stream stopped before it finished, usually by a disconnect."""
+
+    def run_busy(self, model: str) -> None:
+        """Count a request rejected because its interrupt run was busy."""
+
+    @contextmanager
+    def track_run(self, model: str) -> Iterator[None]:
+        """Count the enclosed graph runs as in flight and record their duration."""
+        started = time.monotonic()
+        self.run_started(model)
+        try:
+            yield
+        finally:
+            self.run_finished(model, time.monotonic() - started)
+
+
+def serving_metrics() -> ServingMetrics:
+    """Return the process-wide metrics selected by ``LGOS_ENABLE_METRICS``."""
+    if not settings.ENABLE_METRICS:
+        return _DISABLED
+    return _prometheus_metrics()
+
+
+@cache
+def _prometheus_metrics() -> ServingMetrics:
+    from langgraph_openai_serve.integrations.prometheus import PrometheusMetrics
+
+    return PrometheusMetrics()
+
+
+_DISABLED = ServingMetrics()
+
+
+def start_request_clock() -> None:
+    """Start timing the current request for its time-to-first-token."""
+    _request_started_at.set(time.monotonic())
+
+
+def request_elapsed() -> float | None:
+    """Seconds since the current request started, if its clock was started."""
+    started = _request_started_at.get()
+    return None if started is None else time.monotonic() - started
@@ -0,0 +1,162 @@
+"""Sample the stacks of slow requests and keep profiles of the tail only."""
+
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+
+from langgraph_openai_serve.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass(eq=False)
+class RequestProfile:
+    """Stack samples of one request's thread, counted by collapsed stack."""
+
+    thread_id: int
+    started: float = field(default_factory=time.monotonic)
+    samples: Counter[str] = field(default_factory=Counter)
+
+
+class RequestProfiler:
+    """
+    Sample a fraction of requests and write profiles of those that are slow.
+
+    A single daemon thread samples the stack of every profiled request's thread
+    while any is in flight, so unprofiled requests pay nothing and fast ones are
+    discarded by dropping their counts. Requests served by one event loop share
+    its thread, so a profile also shows work done for concurrent requests.
+
+    Profiles are written in the collapsed-stack format read by ``flamegraph.pl``
+    and speedscope, one file per request named after its request ID and model.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        sample_rate: float,
+        threshold: float,
+        interval: float,
+    ) -> None:
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._profiles: set[RequestProfile] = set()
+        self._armed: dict[str, int] = {}
+        self._sampler: threading.Thread | None = None
+
+    def arm(self, model: str, requests: int) -> None:
+        """Profile the next ``requests`` requests for ``model`` whatever their speed."""
+        with self._lock:
+            self._armed[model] = requests
+
+    def armed(self, model: str) -> int:
+        """Return how many requests for ``model`` are still to be profiled."""
+        with self._lock:
+            return self._armed.get(model, 0)
+
+    def start(self) -> RequestProfile | None:
+        """
+        Start sampling the current thread if this request is selected.
+
+        Requests are selected at ``sample_rate``, and all of them while any model
+        is armed because the model is not known until the request is parsed.
+        """
+        with self._lock:
+            if not self._armed and random.random() >= self.sample_rate:  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+                return None
+            profile = RequestProfile(threading.get_ident())
+            self._profiles.add(profile)
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample,
+                    name="lgos-request-profiler",
+                    daemon=True,
+                )
+                self._sampler.start()
+        return profile
+
+    def finish(self, profile: RequestProfile, *, model: str | None) -> bool:
+        """
+        Stop sampling a request and return whether its profile is kept.
+
+        Profiles of chat completions are kept when they took at least
+        ``threshold`` seconds or their model is armed.
+        """
+        elapsed = time.monotonic() - profile.started
+        with self._lock:
+            self._profiles.discard(profile)
+            armed = model is not None and self._armed.get(model, 0) > 0
+            if armed:
+                self._armed[model] -= 1
+                if not self._armed[model]:
+                    del self._armed[model]
+        return model is not None and (armed or elapsed >= self.threshold)
+
+    def write(
+        self,
+        profile: RequestProfile,
+        *,
+        request_id: str | None,
+        model: str,
+    ) -> Path | None:
+        """Write a kept profile, returning its path or ``None`` if writing failed."""
+        name = "-".join(
+            _UNSAFE_FILENAME_CHARACTERS.sub("_", part)
+            for part in (str(time.time_ns()), request_id or "unknown", model)
+        )
+        path = self.directory / f"{name}.collapsed"
+        lines = [f"{stack} {count}\n" for stack, count in profile.samples.items()]
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path.write_text("".join(lines), encoding="utf-8")
+        except OSError:
+            logger.exception("request_profile.write_failed")
+            return None
+        logger.info(
+            "request_profile.written",
+            extra={"path": str(path), "samples": profile.samples.total()},
+        )
+        return path
+
+    def _sample(self) -> None:
+        while True:
+            with self._lock:
+                profiles = tuple(self._profiles)
+                if not profiles:
+                    self._sampler = None
+                    return
+            frames = sys._current_frames()  # ruff: ignore[private-member-access]
+            stacks = {
+                thread_id: _collapse(frames.get(thread_id))
+                for thread_id in {profile.thread_id for profile in profiles}
+            }
+            del frames
+            # Finished profiles are no longer counted, so writers read them safely.
+            with self._lock:
+                for profile in profiles:
+                    stack = stacks[profile.thread_id]
+                    if stack and profile in self._profiles:
+                        profile.samples[stack] += 1
+            time.sleep(self.interval)
+
+
+def _collapse(frame: FrameType | None) -> str:
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        labels.append(f"{module}:{code.co_qualname}".replace(";", ":"))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
@@ -1,8 +1,16 @@
 import importlib.util
 import os
-from typing import TypedDict
-
-from pydantic import field_validator
+from pathlib import Path
+from typing import Annotated, TypedDict
+
+from pydantic import (
+    Field,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    SecretStr,
+    field_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -40,6 +48,19 @@ class Settings(BaseSettings):
     OPENAI_API_PREFIX: str = "/v1"
     OPENAI_API_DOCS_ENABLED: bool = False
     ENABLE_LANGFUSE: bool = False
+    MAX_CONCURRENT_CHOICES: PositiveInt = 4
+    MAX_REQUEST_BODY_BYTES: PositiveInt | None = None
+    MESSAGE_CACHE_MAX_BYTES: NonNegativeInt = 0
+    INTERRUPT_CACHE_MAX_ENTRIES: NonNegativeInt = 0
+    MAX_REQUEST_TIMEOUT: PositiveFloat | None = None
+    MAX_RECURSION_LIMIT: PositiveInt | None = None
+    USAGE_TOKENIZER: str | None = None
+    ENABLE_METRICS: bool = False
+    PROFILE_DIR: Path | None = None
+    PROFILE_SAMPLE_RATE: Annotated[float, Field(ge=0, le=1)] = 0.01
+    PROFILE_THRESHOLD: PositiveFloat = 1.0
+    PROFILE_INTERVAL: PositiveFloat = 0.005
+    PROFILE_ADMIN_TOKEN: SecretStr | None = None
 
     @field_validator("OPENAI_API_PREFIX")
     @classmethod
@@ -78,6 +99,38 @@ class Settings(BaseSettings):
 
         return v
 
+    @field_validator("USAGE_TOKENIZER")
+    @classmethod
+    def check_usage_tokenizer(cls, v: str | None) -> str | None:
+        """Validate that the fallback usage tokenizer can be loaded."""
+        if v is None:
+            return v
+
+        if importlib.util.find_spec("tiktoken") is None:
+            msg = (
+                "USAGE_TOKENIZER is set but the 'tiktoken' package is not installed. "
+                "Please install it, e.g., with "
+                "`uv add langgraph-openai-serve[tokenizer]`."
+            )
+            raise RuntimeError(msg)
+        return v
+
+    @field_validator("ENABLE_METRICS")
+    @classmethod
+    def check_metrics_settings(cls, v: bool) -> bool:
+        """Validate that the Prometheus client is installed if metrics are enabled."""
+        if v is False:
+            return v
+
+        if importlib.util.find_spec("prometheus_client") is None:
+            msg = (
+                "Metrics are enabled but the 'prometheus_client' package is not "
+                "installed. Please install it, e.g., with "
+                "`uv add langgraph-openai-serve[metrics]`."
+            )
+            raise RuntimeError(msg)
+        return v
+
     @property
     def fastapi_docs_kwargs(self) -> _FastAPIDocsKwargs:
         """Kwargs to configure FastAPI docs visibility."""
@@ -0,0 +1,295 @@
+"""Limit how many requests run one graph at once, and share that capacity fairly."""
+
+import asyncio
+import itertools
+import math
+import time
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from langgraph_openai_serve.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from langgraph_openai_serve.graph.graph_registry import AdmissionPolicy
+
+logger = get_logger(__name__)
+
+# Weight of the latest run when averaging how long requests hold a slot.
+_HOLD_SMOOTHING = 0.2
+
+
+class GraphOverloadedError(RuntimeError):
+    """Raised when a graph cannot admit a request within its admission policy."""
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class AdmissionKeyStats:
+    """Load of one fairness key with running or queued requests."""
+
+    running: int
+    queued: int
+    oldest_wait: float
+    weight: float
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Load of an ``AdmissionControl`` and its counters since creation."""
+
+    running: int
+    queued: int
+    oldest_wait: float
+    admitted: int
+    rejected: int
+    timed_out: int
+    wait_seconds: float
+    keys: Mapping[str, AdmissionKeyStats]
+
+    @property
+    def average_wait(self) -> float:
+        """Mean queue wait of admitted requests, in seconds."""
+        return self.wait_seconds / self.admitted if self.admitted else 0.0
+
+
+class AdmissionTicket:
+    """
+    A running slot shared by every choice run of one admitted request.
+
+    Each run releases its share once; the slot is freed with the last share.
+    """
+
+    def __init__(self, holders: int, on_release: Callable[[float], None]) -> None:
+        self._holders = holders
+        self._on_release = on_release
+        self._admitted_at = time.monotonic()
+
+    def release(self) -> None:
+        """Release one holder's share of the slot."""
+        if self._holders == 0:
+            return
+        self._holders -= 1
+        if self._holders == 0:
+            self._on_release(time.monotonic() - self._admitted_at)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    key: str
+    interactive: bool
+    # Virtual time at which this request's fair share of capacity is used up.
+    finish_tag: float
+    order: int
+    admitted: asyncio.Future[None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _KeyState:
+    running: int = 0
+    queued: int = 0
+    finish_tag: float = 0.0
+
+
+class AdmissionControl:
+    """
+    Admit up to ``max_concurrent`` requests and queue up to ``max_queue`` more.
+
+    Waiting requests are admitted by weighted fair queuing over their fairness
+    keys: each queued request is tagged with the virtual time at which its key
+    would have used up its weighted share, and the smallest tag whose key is
+    below ``max_concurrent_per_key`` goes first. With ``prioritize_streaming``,
+    interactive requests are admitted before any batch request. Requests of one
+    key and kind keep their arrival order. A request that finds the queue full, or
+    waits longer than ``queue_timeout`` seconds, is rejected with
+    ``GraphOverloadedError``.
+    """
+
+    def __init__(self, policy: "AdmissionPolicy") -> None:
+        self.policy = policy
+        self._waiters: list[_Waiter] = []
+        self._keys: dict[str, _KeyState] = {}
+        self._order = itertools.count()
+        self._virtual_time = 0.0
+        self._running = 0
+        self._admitted = self._rejected = self._timed_out = 0
+        self._wait_seconds = 0.0
+        self._hold_seconds: float | None = None
+
+    def stats(self) -> AdmissionStats:
+        """Return the current load and counters."""
+        now = time.monotonic()
+        oldest: dict[str, float] = {}
+        for waiter in self._waiters:
+            oldest.setdefault(waiter.key, now - waiter.enqueued_at)
+        return AdmissionStats(
+            running=self._running,
+            queued=len(self._waiters),
+            oldest_wait=max(oldest.values(), default=0.0),
+            admitted=self._admitted,
+            rejected=self._rejected,
+            timed_out=self._timed_out,
+            wait_seconds=self._wait_seconds,
+            keys=MappingProxyType(
+                {
+                    key: AdmissionKeyStats(
+                        running=state.running,
+                        queued=state.queued,
+                        oldest_wait=oldest.get(key, 0.0),
+                        weight=self._weight(key),
+                    )
+                    for key, state in self._keys.items()
+                }
+            ),
+        )
+
+    async def admit(
+        self,
+        key: str = "",
+        *,
+        holders: int = 1,
+        interactive: bool = False,
+    ) -> AdmissionTicket:
+        """
+        Wait for a running slot shared by ``holders`` runs of one request.
+
+        Raises:
+            GraphOverloadedError: The queue is full or the wait timed out.
+
+        """
+        state = self._keys.setdefault(key, _KeyState())
+        # Capacity left idle means every waiter is held back by its key's cap.
+        if self._running < self.policy.max_concurrent and self._below_key_cap(state):
+            self._start(state)
+            return self._grant(key, holders, 0.0)
+        if len(self._waiters) >= self.policy.max_queue:
+            self._rejected += 1
+            self._forget_idle(key)
+            msg = "The model is overloaded; retry the request later."
+            raise GraphOverloadedError(msg, retry_after=self.retry_after())
+
+        waiter = self._enqueue(key, state, interactive=interactive)
+        try:
+            async with asyncio.timeout(self.policy.queue_timeout):
+                await waiter.admitted
+        except BaseException as exc:
+            self._abandon(waiter)
+            if not isinstance(exc, TimeoutError):
+                raise
+            self._timed_out += 1
+            msg = "The model is overloaded; the request timed out in its queue."
+            raise GraphOverloadedError(msg, retry_after=self.retry_after()) from None
+        waited = time.monotonic() - waiter.enqueued_at
+        logger.debug(
+            "graph_run.admitted",
+            extra={"admission.key": key, "queue.wait_seconds": waited},
+        )
+        return self._grant(key, holders, waited)
+
+    def retry_after(self) -> int:
+        """Estimate in whole seconds when a new request could be admitted."""
+        if self._hold_seconds is None:
+            return 1
+        backlog = (len(self._waiters) + 1) / self.policy.max_concurrent
+        return max(1, math.ceil(self._hold_seconds * backlog))
+
+    def _weight(self, key: str) -> float:
+        return self.policy.weights.get(key, 1.0)
+
+    def _below_key_cap(self, state: _KeyState) -> bool:
+        cap = self.policy.max_concurrent_per_key
+        return cap is None or state.running < cap
+
+    def _enqueue(self, key: str, state: _KeyState, *, interactive: bool) -> _Waiter:
+        start = max(self._virtual_time, state.finish_tag)
+        state.finish_tag = start + 1 / self._weight(key)
+        state.queued += 1
+        waiter = _Waiter(
+            key=key,
+            interactive=interactive,
+            finish_tag=state.finish_tag,
+            order=next(self._order),
+            admitted=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        return waiter
+
+    def _start(self, state: _KeyState) -> None:
+        self._running += 1
+        state.running += 1
+
+    def _grant(self, key: str, holders: int, waited: float) -> AdmissionTicket:
+        self._admitted += 1
+        self._wait_seconds += waited
+
+        def release(held: float) -> None:
+            self._release(key, held)
+
+        return AdmissionTicket(holders, release)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        if waiter.admitted.done() and not waiter.admitted.cancelled():
+            # The slot was granted just before the waiter gave up; pass it on.
+            self._stop(waiter.key)
+            return
+        waiter.admitted.cancel()
+        # A release may already have dispatched the cancelled waiter.
+        with suppress(ValueError):
+            self._waiters.remove(waiter)
+            self._keys[waiter.key].queued -= 1
+        self._forget_idle(waiter.key)
+
+    def _release(self, key: str, held: float) -> None:
+        self._hold_seconds = (
+            held
+            if self._hold_seconds is None
+            else self._hold_seconds + _HOLD_SMOOTHING * (held - self._hold_seconds)
+        )
+        self._stop(key)
+
+    def _stop(self, key: str) -> None:
+        self._running -= 1
+        self._keys[key].running -= 1
+        self._forget_idle(key)
+        self._dispatch()
+
+    def _forget_idle(self, key: str) -> None:
+        state = self._keys.get(key)
+        if state is not None and state.running == 0 and state.queued == 0:
+            del self._keys[key]
+
+    def _dispatch(self) -> None:
+        while self._running < self.policy.max_concurrent:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self._waiters.remove(waiter)
+            state = self._keys[waiter.key]
+            state.queued -= 1
+            self._virtual_time = max(self._virtual_time, waiter.finish_tag)
+            if not waiter.admitted.done():
+                self._start(state)
+                waiter.admitted.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        prioritize = self.policy.prioritize_streaming
+
+        def priority(waiter: _Waiter) -> tuple[bool, float, int]:
+            return (
+                prioritize and not waiter.interactive,
+                waiter.finish_tag,
+                waiter.order,
+            )
+
+        eligible = (
+            waiter
+            for waiter in self._waiters
+            if self._below_key_cap(self._keys[waiter.key])
+        )
+        return min(eligible, key=priority, default=None)
@@ -0,0 +1,153 @@
+"""Bound the wall-clock time and supersteps of one graph run."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from langgraph.errors import GraphRecursionError
+
+from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.settings import settings
+
+if TYPE_CHECKING:
+    from langgraph_openai_serve.graph.graph_registry import ExecutionBudget
+
+logger = get_logger(__name__)
+
+_EventT = TypeVar("_EventT")
+_LimitT = TypeVar("_LimitT", int, float)
+
+
+class RunBudgetExceededError(RuntimeError):
+    """
+    Raised when a graph run reaches its deadline or recursion limit.
+
+    ``requested`` is true when the request itself asked for the exhausted limit,
+    and false when it came from the graph's policy or a server maximum.
+    """
+
+    def __init__(self, message: str, *, code: str, requested: bool = False) -> None:
+        super().__init__(message)
+        self.code = code
+        self.requested = requested
+
+
+@dataclass(frozen=True)
+class RunBudget:
+    """
+    The deadline and superstep limit of one request's graph runs.
+
+    ``deadline`` is an event loop time, so every choice run of a request shares
+    the deadline started when the request arrived. The ``*_requested`` flags
+    record which limits the request asked for itself.
+    """
+
+    deadline: float | None = None
+    recursion_limit: int | None = None
+    deadline_requested: bool = False
+    recursion_limit_requested: bool = False
+
+    @asynccontextmanager
+    async def enforce(self) -> AsyncIterator[None]:
+        """
+        Cancel the enclosed graph work when the budget runs out.
+
+        Raises:
+            RunBudgetExceededError: The deadline passed or LangGraph reached the
+                recursion limit.
+
+        """
+        timeout = asyncio.timeout_at(self.deadline)
+        try:
+            async with timeout:
+                yield
+        except TimeoutError as exc:
+            # Only this budget's own deadline is reported as exhausted.
+            if not timeout.expired():
+                raise
+            logger.warning(
+                "graph_run.budget_exhausted",
+                extra={"error.code": "deadline_exceeded"},
+            )
+            msg = "The graph run did not finish before its deadline."
+            raise RunBudgetExceededError(
+                msg,
+                code="deadline_exceeded",
+                requested=self.deadline_requested,
+            ) from exc
+        except GraphRecursionError as exc:
+            logger.warning(
+                "graph_run.budget_exhausted",
+                extra={"error.code": "recursion_limit_exceeded"},
+            )
+            msg = "The graph run reached its recursion limit."
+            raise RunBudgetExceededError(
+                msg,
+                code="recursion_limit_exceeded",
+                requested=self.recursion_limit_requested,
+            ) from exc
+
+    async def bound(
+        self,
+        events: AsyncGenerator[_EventT, None],
+    ) -> AsyncGenerator[_EventT, None]:
+        """
+        Yield a graph stream's events while the budget lasts.
+
+        The deadline covers waiting for every event but not the consumer's own
+        work between events, so a cancellation never lands outside the stream.
+
+        Yields:
+            The stream's events unchanged.
+
+        """
+        async with aclosing(events):
+            while True:
+                async with self.enforce():
+                    try:
+                        event = await anext(events)
+                    except StopAsyncIteration:
+                        return
+                yield event
+
+
+def start_run_budget(
+    policy: "ExecutionBudget | None",
+    *,
+    timeout: float | None = None,
+    recursion_limit: int | None = None,
+) -> RunBudget:
+    """
+    Start the deadline of a request's runs now.
+
+    Requested values replace the graph's ``policy``, and ``MAX_REQUEST_TIMEOUT``
+    and ``MAX_RECURSION_LIMIT`` cap whichever applies. A limit counts as
+    requested only when the requested value is the one enforced.
+    """
+    requested_timeout, requested_recursion_limit = timeout, recursion_limit
+    if policy is not None:
+        timeout = timeout or policy.timeout
+        recursion_limit = recursion_limit or policy.recursion_limit
+    timeout = _capped(timeout, settings.MAX_REQUEST_TIMEOUT)
+    recursion_limit = _capped(recursion_limit, settings.MAX_RECURSION_LIMIT)
+    return RunBudget(
+        deadline=(
+            asyncio.get_running_loop().time() + timeout if timeout is not None else None
+        ),
+        recursion_limit=recursion_limit,
+        deadline_requested=(
+            requested_timeout is not None and timeout == requested_timeout
+        ),
+        recursion_limit_requested=(
+            requested_recursion_limit is not None
+            and recursion_limit == requested_recursion_limit
+        ),
+    )
+
+
+def _capped(value: _LimitT | None, maximum: _LimitT | None) -> _LimitT | None:
+    if value is None:
+        return maximum
+    return value if maximum is None else min(value, maximum)
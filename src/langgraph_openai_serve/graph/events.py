@@ -1,10 +1,12 @@
 """Public events emitted by LangGraph nodes and tools."""
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from openai.types.chat.chat_completion_message import Annotation, AnnotationURLCitation
 from pydantic import BaseModel, ConfigDict, Field, JsonValue, ValidationError
 
+if TYPE_CHECKING:
+    from openai.types.chat.chat_completion_message import Annotation
+
 CLIENT_EVENT_SCHEMA_VERSION = 1
 _CLIENT_EVENT_ENVELOPE_TYPE = "langgraph_openai_serve.client_event"
 
@@ -107,6 +109,12 @@ def citation_event(
     span: tuple[int, int],
 ) -> dict[str, object]:
     """Build an OpenAI URL citation from a Python-style half-open span."""
+    # Graphs that emit no citations do not pay for importing the OpenAI package.
+    from openai.types.chat.chat_completion_message import (
+        Annotation,
+        AnnotationURLCitation,
+    )
+
     start, stop = span
     if not 0 <= start < stop:
         msg = "citation span must define a valid non-empty text range"
@@ -123,7 +131,7 @@ def citation_event(
     ).model_dump(mode="json")
 
 
-def citation_slice(annotation: Annotation, content: str) -> slice:
+def citation_slice(annotation: "Annotation", content: str) -> slice:
     """Convert an OpenAI inclusive citation span to a validated Python slice."""
     citation = annotation.url_citation
     start = citation.start_index
@@ -1,8 +1,12 @@
 import inspect
+import time
+import weakref
 from collections.abc import Awaitable, Callable, Mapping
+from enum import StrEnum
 from types import MappingProxyType
-from typing import Annotated, Any
+from typing import Annotated, Any, Self
 
+import anyio
 from langchain_core.callbacks.base import Callbacks
 from langchain_core.messages import BaseMessage
 from langgraph.checkpoint.base import BaseCheckpointSaver
@@ -13,22 +17,25 @@ from pydantic import (
     ConfigDict,
     Field,
     PlainSerializer,
+    PrivateAttr,
     StringConstraints,
     field_validator,
+    model_validator,
 )
 
 from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.graph.admission import AdmissionControl
 from langgraph_openai_serve.graph.client_settings import (
     ClientSettings,
     validate_client_settings_model,
 )
 from langgraph_openai_serve.graph.features import GraphFeature
 from langgraph_openai_serve.graph.interrupt.coordination import RunCoordinator
+from langgraph_openai_serve.graph.response_cache import ResponseCache
+from langgraph_openai_serve.graph.single_flight import SingleFlight
 
-GraphResolver = (
-    CompiledStateGraph
-    | Callable[[], CompiledStateGraph | Awaitable[CompiledStateGraph]]
-)
+GraphFactory = Callable[[], CompiledStateGraph | Awaitable[CompiledStateGraph]]
+GraphResolver = CompiledStateGraph | GraphFactory
 RequestToInput = Callable[
     [ChatCompletionRequest, list[BaseMessage]], Any | Awaitable[Any]
 ]
@@ -37,6 +44,7 @@ ContextFactory = Callable[
     Any | Awaitable[Any],
 ]
 OutputToText = Callable[[Any], str | Awaitable[str]]
+LifecycleHook = Callable[[], Awaitable[None]]
 _INTERRUPT_CHECKPOINTER_METHODS = (
     "aget_tuple",
     "alist",
@@ -68,6 +76,132 @@ class GraphNotFoundError(ValueError):
     """Raised when a requested graph is not registered."""
 
 
+class GraphCachePolicy(BaseModel):
+    """
+    Reuse policy for graphs built by a ``GraphConfig`` factory.
+
+    Without a ``ttl`` the first resolved graph is reused until
+    ``GraphConfig.invalidate_graph()`` is called. With a ``ttl`` the next request
+    after expiry calls the factory again.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ttl: Annotated[float, Field(gt=0, allow_inf_nan=False)] | None = None
+
+
+class StreamCoalescing(BaseModel):
+    """
+    Merge streamed text deltas into fewer Chat Completions chunks.
+
+    The first text delta of each choice is sent immediately. Later deltas are
+    held until ``window`` seconds have passed since the oldest held delta, no
+    delta arrived for ``idle`` seconds, or a choice holds ``max_bytes`` of UTF-8
+    text. Custom events, interrupts and finish chunks flush held text first.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    window: Annotated[float, Field(gt=0, allow_inf_nan=False)] = 0.05
+    idle: Annotated[float, Field(gt=0, allow_inf_nan=False)] = 0.01
+    max_bytes: Annotated[int, Field(gt=0)] = 512
+
+
+class ResponseCachePolicy(BaseModel):
+    """
+    Serve repeated identical requests from completed responses.
+
+    Requests match when their checkpoint scope, ``user``, model, validated
+    messages, validated client settings and ``stream`` flag are equal, so use it
+    only for graphs whose answers depend on nothing else. Entries expire after ``ttl`` seconds, and
+    the least recently used entry is evicted beyond ``max_entries``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ttl: Annotated[float, Field(gt=0, allow_inf_nan=False)] | None = None
+    max_entries: Annotated[int, Field(gt=0)] = 1024
+
+
+class FairnessKey(StrEnum):
+    """
+    Who a queued request is admitted on behalf of.
+
+    ``SCOPE`` uses the server-trusted checkpoint scope. ``USER`` uses the request's
+    ``user`` field and ``SESSION`` its ``session_id`` metadata, each falling back
+    to the previous key when absent; both are chosen by the client.
+    """
+
+    SCOPE = "scope"
+    USER = "user"
+    SESSION = "session"
+
+
+class AdmissionPolicy(BaseModel):
+    """
+    Limit how many requests run a graph at once.
+
+    Up to ``max_concurrent`` requests run, whatever their number of choices, and
+    up to ``max_queue`` more wait for at most ``queue_timeout`` seconds. Requests
+    beyond the queue, or that wait too long, are rejected. Queued requests are
+    admitted in arrival order unless ``fairness`` shares capacity between keys
+    in proportion to their ``weights``, each running at most
+    ``max_concurrent_per_key`` requests. ``prioritize_streaming`` admits queued
+    streaming requests before non-streaming ones.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_concurrent: Annotated[int, Field(gt=0)]
+    max_queue: Annotated[int, Field(ge=0)] = 0
+    queue_timeout: Annotated[float, Field(gt=0, allow_inf_nan=False)] = 30.0
+    fairness: FairnessKey | None = None
+    weights: Mapping[str, Annotated[float, Field(gt=0, allow_inf_nan=False)]] = Field(
+        default_factory=dict
+    )
+    max_concurrent_per_key: Annotated[int, Field(gt=0)] | None = None
+    prioritize_streaming: bool = False
+
+    @model_validator(mode="after")
+    def require_fairness_key(self) -> Self:
+        """Reject per-key settings without a key to apply them to."""
+        if self.fairness is None and (
+            self.weights or self.max_concurrent_per_key is not None
+        ):
+            msg = "weights and max_concurrent_per_key require fairness."
+            raise ValueError(msg)
+        return self
+
+
+class ExecutionBudget(BaseModel):
+    """
+    Bound how long one graph run may take and how many supersteps it may run.
+
+    ``timeout`` is the default deadline in seconds, counted from when a request
+    arrives, and ``recursion_limit`` the default superstep limit passed to
+    LangGraph. Requests may override both within the server maximums.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    timeout: Annotated[float, Field(gt=0, allow_inf_nan=False)] | None = None
+    recursion_limit: Annotated[int, Field(gt=0)] | None = None
+
+
+class InvokeMode(StrEnum):
+    """
+    How non-streaming requests collect a graph's output.
+
+    ``VALUES`` streams root and subgraph state after every superstep and keeps the
+    last root value. ``FINAL`` reads the root output once when the run ends, which
+    avoids materializing intermediate state for deep or message-heavy graphs.
+    Custom events are collected in both modes.
+    """
+
+    VALUES = "values"
+    FINAL = "final"
+
+
 class GraphConfig(BaseModel):
     """Graph configuration."""
 
@@ -84,6 +218,25 @@ class GraphConfig(BaseModel):
     context_factory: ContextFactory | None = None
     output_to_text: OutputToText | None = None
     run_coordinator: RunCoordinator | None = None
+    graph_cache: GraphCachePolicy | None = None
+    on_startup: LifecycleHook | None = None
+    on_shutdown: LifecycleHook | None = None
+    invoke_mode: InvokeMode = InvokeMode.VALUES
+    stream_coalescing: StreamCoalescing | None = None
+    response_cache: ResponseCachePolicy | None = None
+    single_flight: bool = False
+    admission: AdmissionPolicy | None = None
+    execution_budget: ExecutionBudget | None = None
+
+    _cached_graph: CompiledStateGraph | None = PrivateAttr(default=None)
+    _cached_until: float = PrivateAttr(default=0.0)
+    _cache_generation: int = PrivateAttr(default=0)
+    _resolve_lock: anyio.Lock = PrivateAttr(default_factory=anyio.Lock)
+    _validated_graph: weakref.ref[CompiledStateGraph] | None = PrivateAttr(default=None)
+    _response_store: ResponseCache | None = PrivateAttr(default=None)
+    _in_flight: SingleFlight = PrivateAttr(default_factory=SingleFlight)
+    _admission_control: AdmissionControl | None = PrivateAttr(default=None)
+    _admission_policy: AdmissionPolicy | None = PrivateAttr(default=None)
 
     @field_validator("client_settings")
     @classmethod
@@ -98,12 +251,119 @@ class GraphConfig(BaseModel):
         """Return whether this graph supports a feature."""
         return feature in self.features
 
+    @model_validator(mode="after")
+    def reset_resolved_graph(self) -> Self:
+        """Forget resolved and validated graphs when the configuration changes."""
+        self.invalidate_graph()
+        self._validated_graph = None
+        return self
+
+    @model_validator(mode="after")
+    def reset_response_cache(self) -> Self:
+        """Start an empty response cache when the configuration changes."""
+        if self.response_cache is None:
+            self._response_store = None
+            return self
+        if self.supports(GraphFeature.INTERRUPTS):
+            msg = "response_cache is not supported for interrupt-enabled graphs."
+            raise ValueError(msg)
+        self._response_store = ResponseCache(
+            max_entries=self.response_cache.max_entries,
+            ttl=self.response_cache.ttl,
+        )
+        return self
+
+    @property
+    def response_store(self) -> ResponseCache | None:
+        """The response cache configured by ``response_cache``."""
+        return self._response_store
+
+    @model_validator(mode="after")
+    def validate_single_flight(self) -> Self:
+        """Reject shared executions for graphs whose runs own durable state."""
+        if self.single_flight and self.supports(GraphFeature.INTERRUPTS):
+            msg = "single_flight is not supported for interrupt-enabled graphs."
+            raise ValueError(msg)
+        return self
+
+    @property
+    def in_flight(self) -> SingleFlight | None:
+        """The executions shared by concurrent requests when ``single_flight``."""
+        return self._in_flight if self.single_flight else None
+
+    @model_validator(mode="after")
+    def reset_admission_control(self) -> Self:
+        """Apply a changed admission policy to requests admitted after the change."""
+        if self.admission == self._admission_policy:
+            return self
+        self._admission_policy = self.admission
+        self._admission_control = (
+            AdmissionControl(self.admission) if self.admission is not None else None
+        )
+        return self
+
+    @property
+    def admission_control(self) -> AdmissionControl | None:
+        """The admission control configured by ``admission``."""
+        return self._admission_control
+
     async def resolve_graph(self) -> CompiledStateGraph:
         """Get the graph instance, resolving callable graph factories."""
         if isinstance(self.graph, CompiledStateGraph):
             graph = self.graph
-        else:
+        elif self.graph_cache is None:
             graph = await _maybe_await(self.graph())
+        else:
+            return await self._resolve_cached_graph(self.graph, self.graph_cache)
+
+        self._validate_graph(graph)
+        return graph
+
+    def invalidate_graph(self) -> None:
+        """Make the next request call the graph factory again."""
+        self._cache_generation += 1
+        self._cached_graph = None
+
+    async def _resolve_cached_graph(
+        self,
+        factory: GraphFactory,
+        policy: GraphCachePolicy,
+    ) -> CompiledStateGraph:
+        graph = self._fresh_cached_graph()
+        if graph is not None:
+            return graph
+
+        # Concurrent first requests wait for one factory call instead of each
+        # building the graph. A cancelled caller releases the lock, and the next
+        # waiter repeats the call.
+        async with self._resolve_lock:
+            graph = self._fresh_cached_graph()
+            if graph is not None:
+                return graph
+
+            generation = self._cache_generation
+            graph = await _maybe_await(factory())
+            self._validate_graph(graph)
+            # An invalidation during the factory call supersedes its result.
+            if generation == self._cache_generation:
+                self._cached_graph = graph
+                self._cached_until = (
+                    time.monotonic() + policy.ttl
+                    if policy.ttl is not None
+                    else float("inf")
+                )
+            return graph
+
+    def _fresh_cached_graph(self) -> CompiledStateGraph | None:
+        if self._cached_graph is None or time.monotonic() >= self._cached_until:
+            return None
+        return self._cached_graph
+
+    def _validate_graph(self, graph: CompiledStateGraph) -> None:
+        """Check registration requirements once per resolved graph instance."""
+        validated = self._validated_graph
+        if validated is not None and validated() is graph:
+            return
 
         if (
             self.client_settings is not None
@@ -131,7 +391,7 @@ class GraphConfig(BaseModel):
                 msg = "Interrupt-enabled graphs must configure a run_coordinator."
                 raise GraphConfigurationError(msg)
 
-        return graph
+        self._validated_graph = weakref.ref(graph)
 
     async def build_input(
         self,
@@ -4,12 +4,28 @@ from langgraph_openai_serve.graph.interrupt.coordination import (
     InMemoryRunCoordinator,
     RunBusyError,
     RunCoordinator,
+    RunLeaseLostError,
+    RunLeaseWatch,
+    RunLeaseWatcher,
+)
+from langgraph_openai_serve.graph.interrupt.models import (
+    CheckpointHeadReader,
+    CheckpointHeads,
+    LangGraphInterruptBatch,
+    ResumeHead,
+    ResumeHeadReader,
 )
-from langgraph_openai_serve.graph.interrupt.models import LangGraphInterruptBatch
 
 __all__ = [
+    "CheckpointHeadReader",
+    "CheckpointHeads",
     "InMemoryRunCoordinator",
     "LangGraphInterruptBatch",
+    "ResumeHead",
+    "ResumeHeadReader",
     "RunBusyError",
     "RunCoordinator",
+    "RunLeaseLostError",
+    "RunLeaseWatch",
+    "RunLeaseWatcher",
 ]
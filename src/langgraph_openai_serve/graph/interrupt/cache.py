@@ -0,0 +1,85 @@
+"""Process-local cache of the interrupt batches awaiting answers."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from langgraph_openai_serve.core.settings import settings
+from langgraph_openai_serve.graph.interrupt.models import LangGraphInterruptBatch
+
+
+@dataclass(frozen=True)
+class PendingInterruptCacheStats:
+    """Counters of a ``PendingInterruptCache`` since it was created or cleared."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that found a batch."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PendingInterruptCache:
+    """
+    Keep the last interrupt batch emitted for each checkpoint thread.
+
+    Batches are written when a run emits them and dropped when the run is
+    resumed or its checkpoints are deleted. Another process may still advance
+    the thread, so callers must compare a batch's ``state_token`` with the
+    thread's current token before serving it. The least recently used batch is
+    evicted once ``max_entries`` are held. A ``max_entries`` of 0 disables
+    caching.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, LangGraphInterruptBatch] = OrderedDict()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> PendingInterruptCacheStats:
+        """Return the current counters."""
+        return PendingInterruptCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    def get(self, thread_id: str) -> LangGraphInterruptBatch | None:
+        """Return the batch last emitted for ``thread_id``, if still cached."""
+        if self.max_entries <= 0:
+            return None
+        batch = self._entries.get(thread_id)
+        if batch is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(thread_id)
+        return batch
+
+    def put(self, thread_id: str, batch: LangGraphInterruptBatch) -> None:
+        """Store an emitted batch, evicting the least recently used entry."""
+        if self.max_entries <= 0:
+            return
+        self._entries[thread_id] = batch
+        self._entries.move_to_end(thread_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def discard(self, thread_id: str) -> None:
+        """Forget the batch of a resumed, advanced or deleted thread."""
+        self._entries.pop(thread_id, None)
+
+
+pending_interrupt_cache = PendingInterruptCache(settings.INTERRUPT_CACHE_MAX_ENTRIES)
@@ -1,10 +1,14 @@
 """Nonblocking coordination for graph runs that share durable state."""
 
-from collections.abc import AsyncIterator
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
 from threading import Lock
 from typing import Protocol, runtime_checkable
 
+from anyio import CancelScope
+
+from langgraph_openai_serve.graph.interrupt.models import CheckpointHeads
+
 
 class RunBusyError(RuntimeError):
     """Raised when a run cannot acquire its coordination lease."""
@@ -14,19 +18,87 @@ class RunBusyError(RuntimeError):
         super().__init__("This interrupt run cannot acquire its coordination lease.")
 
 
+class RunLeaseLostError(RuntimeError):
+    """Raised in a run whose coordination lease was lost while it executed."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        super().__init__("This interrupt run lost its coordination lease.")
+
+
+class RunLeaseWatch:
+    """
+    Cancel the work of a run once its coordination lease is lost.
+
+    Work entered with ``guard()`` is cancelled when ``lose()`` is called, from
+    any task of the event loop, and then raises ``RunLeaseLostError``.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.lost = False
+        self._scopes: set[CancelScope] = set()
+
+    def lose(self) -> None:
+        """Mark the lease lost and cancel the work guarded by it."""
+        self.lost = True
+        for scope in self._scopes:
+            scope.cancel()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run the enclosed work while the lease is held.
+
+        Raises:
+            RunLeaseLostError: The lease was lost before or during the work.
+
+        """
+        if self.lost:
+            raise RunLeaseLostError(self.key)
+        with CancelScope() as scope:
+            self._scopes.add(scope)
+            try:
+                yield
+            finally:
+                self._scopes.discard(scope)
+        if self.lost:
+            raise RunLeaseLostError(self.key)
+
+
 @runtime_checkable
 class RunCoordinator(Protocol):
-    """Acquire a lease that rejects rather than queues an occupied run key."""
+    """
+    Acquire a lease that rejects rather than queues an occupied run key.
+
+    Keys are checkpoint thread ids. A lease may enter with the thread's
+    ``CheckpointHeads`` read under the lease, or with ``None``.
+    """
 
     def __call__(
         self,
         key: str,
         /,
-    ) -> AbstractAsyncContextManager[None]:
+    ) -> AbstractAsyncContextManager[CheckpointHeads | None]:
         """Acquire lease synchronously."""
         ...
 
 
+@runtime_checkable
+class RunLeaseWatcher(Protocol):
+    """
+    A run coordinator whose leases can be lost while their runs execute.
+
+    Runs of such coordinators guard their graph work with the watch of their
+    lease, so losing it, for example with the database session holding it,
+    stops the run instead of letting it continue without mutual exclusion.
+    """
+
+    def lease_watch(self, key: str, /) -> RunLeaseWatch | None:
+        """Return the watch of the lease this process holds for ``key``."""
+        ...
+
+
 class InMemoryRunCoordinator:
     """Coordinate runs within one process without waiting on occupied keys."""
 
@@ -54,4 +126,11 @@ class InMemoryRunCoordinator:
             self._active_keys.remove(key)
 
 
-__all__ = ["InMemoryRunCoordinator", "RunBusyError", "RunCoordinator"]
+__all__ = [
+    "InMemoryRunCoordinator",
+    "RunBusyError",
+    "RunCoordinator",
+    "RunLeaseLostError",
+    "RunLeaseWatch",
+    "RunLeaseWatcher",
+]
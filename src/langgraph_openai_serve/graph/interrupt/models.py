@@ -1,7 +1,10 @@
-"""Result models produced by interrupt-enabled graph runs."""
+"""Result models and checkpoint capabilities for interrupt-enabled graph runs."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
 
+from langgraph.checkpoint.base import CheckpointTuple
 from langgraph.types import Interrupt
 
 
@@ -14,4 +17,60 @@ class LangGraphInterruptBatch:
     interrupts: tuple[Interrupt, ...]
 
 
-__all__ = ["LangGraphInterruptBatch"]
+@dataclass(frozen=True)
+class CheckpointHeads:
+    """
+    The latest checkpoint tuple of every namespace in one checkpoint thread.
+
+    A run coordinator that reads these under its lease lets run preparation
+    build the state snapshot and state token without further checkpoint reads.
+    """
+
+    thread_id: str
+    tuples: Mapping[str, CheckpointTuple]
+
+
+@runtime_checkable
+class CheckpointHeadReader(Protocol):
+    """Checkpointer that reads the latest checkpoint of every namespace at once."""
+
+    async def aget_checkpoint_heads(self, thread_id: str) -> CheckpointHeads | None:
+        """Return the thread's heads, or ``None`` to fall back to a history scan."""
+        ...
+
+
+@dataclass(frozen=True)
+class ResumeHead:
+    """
+    What a state token reads from the latest checkpoint of one namespace.
+
+    ``resume_writes`` pairs each task with the number of resume values it has
+    received, as counted by :func:`resume_write_count`.
+    """
+
+    checkpoint_id: str
+    resume_writes: tuple[tuple[str, int], ...]
+
+
+@runtime_checkable
+class ResumeHeadReader(Protocol):
+    """Checkpointer that reads only the state token inputs of every namespace."""
+
+    async def aget_resume_heads(self, thread_id: str) -> Mapping[str, ResumeHead]:
+        """Return the resume head of every namespace in the thread."""
+        ...
+
+
+def resume_write_count(value: object) -> int:
+    """Count the resume values held by one pending ``RESUME`` write."""
+    return len(value) if isinstance(value, (list, tuple)) else 1
+
+
+__all__ = [
+    "CheckpointHeadReader",
+    "CheckpointHeads",
+    "LangGraphInterruptBatch",
+    "ResumeHead",
+    "ResumeHeadReader",
+    "resume_write_count",
+]
@@ -3,14 +3,18 @@
 import hashlib
 import json
 import uuid
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any, cast
 
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     RESUME,
     BaseCheckpointSaver,
+    CheckpointTuple,
+    DeltaChannelHistory,
     get_checkpoint_id,
 )
+from langgraph.constants import CONFIG_KEY_CHECKPOINTER
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command, Interrupt, StateSnapshot
 
@@ -24,8 +28,16 @@ from langgraph_openai_serve.graph.graph_registry import (
     GraphConfig,
     GraphConfigurationError,
 )
-from langgraph_openai_serve.graph.interrupt.models import LangGraphInterruptBatch
-from langgraph_openai_serve.utils.message import convert_to_lc_messages
+from langgraph_openai_serve.graph.interrupt.cache import pending_interrupt_cache
+from langgraph_openai_serve.graph.interrupt.models import (
+    CheckpointHeadReader,
+    CheckpointHeads,
+    LangGraphInterruptBatch,
+    ResumeHeadReader,
+    resume_write_count,
+)
+from langgraph_openai_serve.graph.timing import RunPhase, RunTimings
+from langgraph_openai_serve.utils.message import message_prefix_cache
 
 RUN_METADATA_KEY = "langgraph_run_id"
 
@@ -38,21 +50,30 @@ class InterruptStateConflictError(RuntimeError):
     """Raised when a resume does not match durable pending state."""
 
 
-async def prepare_interrupt_input(
+async def prepare_interrupt_input(  # ruff: ignore[too-many-arguments]
     graph_config: GraphConfig,
     graph: CompiledStateGraph,
     request: ChatCompletionRequest,
     snapshot: StateSnapshot,
     resume: InterruptResume | None,
+    *,
+    timings: RunTimings,
+    heads: CheckpointHeads | None = None,
 ) -> tuple[Any, bool]:
-    """Build a new input or causally validate an interrupt resume."""
+    """
+    Build a new input or causally validate an interrupt resume.
+
+    ``heads`` read under the run lease replace the state token's checkpoint
+    scan.
+    """
     pending_interrupts = interrupts_by_id(snapshot)
     checkpoint_id = get_checkpoint_id(snapshot.config)
 
     if resume is None:
         if checkpoint_id is None:
-            lc_messages = convert_to_lc_messages(request.messages)
-            return await graph_config.build_input(request, lc_messages), True
+            with timings.measure(RunPhase.BUILD_INPUT):
+                lc_messages = message_prefix_cache.convert(request.messages)
+                return await graph_config.build_input(request, lc_messages), True
         if pending_interrupts:
             # Re-emit persisted tool calls without rerunning graph nodes.
             return None, False
@@ -66,15 +87,56 @@ async def prepare_interrupt_input(
         msg = "This run no longer has pending interrupts."
         raise InterruptStateConflictError(msg)
 
-    state_token = await checkpoint_state_token(graph, snapshot.config)
+    with timings.measure(RunPhase.CHECKPOINT_STATE_TOKEN):
+        state_token = await current_state_token(graph, snapshot.config, heads)
     if state_token is None:
         msg = "No durable interrupt state exists for this run."
         raise InterruptStateConflictError(msg)
-    return _resume_interrupt_inputs(
-        state_token,
-        set(pending_interrupts),
+    inputs = _resume_interrupt_inputs(state_token, set(pending_interrupts), resume)
+    pending_interrupt_cache.discard(snapshot.config["configurable"]["thread_id"])
+    return inputs, True
+
+
+async def cached_interrupt_batch(
+    graph: CompiledStateGraph,
+    runnable_config: RunnableConfig,
+    heads: CheckpointHeads | None = None,
+    *,
+    timings: RunTimings,
+) -> LangGraphInterruptBatch | None:
+    """
+    Return the run's cached pending batch if it is still the durable state.
+
+    A cached batch is served only while its state token matches the thread's
+    current token, so batches advanced by another process are discarded.
+    """
+    thread_id = runnable_config["configurable"]["thread_id"]
+    batch = pending_interrupt_cache.get(thread_id)
+    if batch is None:
+        return None
+    with timings.measure(RunPhase.CHECKPOINT_STATE_TOKEN):
+        state_token = await current_state_token(graph, runnable_config, heads)
+    if state_token != batch.state_token:
+        pending_interrupt_cache.discard(thread_id)
+        return None
+    return batch
+
+
+def prepare_cached_interrupt_input(
+    batch: LangGraphInterruptBatch,
+    resume: InterruptResume | None,
+    thread_id: str,
+) -> tuple[Any, bool]:
+    """Re-emit or validate a resume against a current cached pending batch."""
+    if resume is None:
+        return None, False
+    inputs = _resume_interrupt_inputs(
+        batch.state_token,
+        {interrupt.id for interrupt in batch.interrupts},
         resume,
-    ), True
+    )
+    pending_interrupt_cache.discard(thread_id)
+    return inputs, True
 
 
 def _resume_interrupt_inputs(
@@ -178,12 +240,33 @@ async def checkpoint_state_token(
     subgraphs are not exposed through state snapshots. Scanning the checkpointer
     keeps stale-resume detection generic without introducing separate state.
 
-    Performance impact: Local PostgreSQL measurements were 0.5-0.7 ms for the
-    current 1-2 tuple runs, scaling linearly to about 5 ms at 100 and 45 ms at
-    1,000 small tuples.
+    A checkpointer implementing ``ResumeHeadReader`` supplies only the
+    checkpoint ids and resume write counts the token needs. One implementing
+    ``CheckpointHeadReader`` supplies whole head tuples, so the token costs one
+    read per namespace. Other checkpointers, or a head reader returning
+    ``None``, are scanned.
+
+    Performance impact: Local PostgreSQL measurements of the scan were
+    0.5-0.7 ms for the current 1-2 tuple runs, scaling linearly to about 5 ms
+    at 100 and 45 ms at 1,000 small tuples. ``make benchmark-micro`` tracks the
+    scan against an in-memory saver at 10, 100 and 1,000 tuples, and
+    ``benchmarks.postgres_state_token`` compares it with the indexed reader.
     """
     checkpointer = cast("BaseCheckpointSaver", graph.checkpointer)
     thread_id = runnable_config["configurable"]["thread_id"]
+    if isinstance(checkpointer, ResumeHeadReader):
+        resume_heads = await checkpointer.aget_resume_heads(thread_id)
+        return _state_token(
+            {
+                namespace: (head.checkpoint_id, list(head.resume_writes))
+                for namespace, head in resume_heads.items()
+            }
+        )
+    if isinstance(checkpointer, CheckpointHeadReader):
+        indexed_heads = await checkpointer.aget_checkpoint_heads(thread_id)
+        if indexed_heads is not None:
+            return heads_state_token(indexed_heads)
+
     heads: dict[str, tuple[str, list[tuple[str, int]]]] = {}
 
     async for checkpoint_tuple in checkpointer.alist(
@@ -194,19 +277,44 @@ async def checkpoint_state_token(
         head = heads.get(namespace)
         if head is not None and checkpoint_id <= head[0]:
             continue
+        heads[namespace] = (checkpoint_id, _resume_write_counts(checkpoint_tuple))
+
+    return _state_token(heads)
+
+
+def heads_state_token(heads: CheckpointHeads) -> str | None:
+    """Fingerprint checkpoint heads exactly as ``checkpoint_state_token`` does."""
+    return _state_token(
+        {
+            namespace: (
+                require_checkpoint_id(checkpoint_tuple.config),
+                _resume_write_counts(checkpoint_tuple),
+            )
+            for namespace, checkpoint_tuple in heads.tuples.items()
+        }
+    )
 
-        heads[namespace] = (
-            checkpoint_id,
-            sorted(
-                (
-                    task_id,
-                    len(value) if isinstance(value, (list, tuple)) else 1,
-                )
-                for task_id, channel, value in checkpoint_tuple.pending_writes or ()
-                if channel == RESUME
-            ),
-        )
 
+async def current_state_token(
+    graph: CompiledStateGraph,
+    runnable_config: RunnableConfig,
+    heads: CheckpointHeads | None = None,
+) -> str | None:
+    """Fingerprint the run's durable state, from ``heads`` when they belong to it."""
+    if _heads_for(heads, runnable_config) is not None:
+        return heads_state_token(cast("CheckpointHeads", heads))
+    return await checkpoint_state_token(graph, runnable_config)
+
+
+def _resume_write_counts(checkpoint_tuple: CheckpointTuple) -> list[tuple[str, int]]:
+    return sorted(
+        (task_id, resume_write_count(value))
+        for task_id, channel, value in checkpoint_tuple.pending_writes or ()
+        if channel == RESUME
+    )
+
+
+def _state_token(heads: dict[str, tuple[str, list[tuple[str, int]]]]) -> str | None:
     if not heads:
         return None
 
@@ -220,6 +328,84 @@ async def checkpoint_state_token(
     return hashlib.sha256(identity.encode()).hexdigest()
 
 
+async def aget_interrupt_state(
+    graph: CompiledStateGraph,
+    runnable_config: RunnableConfig,
+    heads: CheckpointHeads | None = None,
+) -> StateSnapshot:
+    """
+    Load the run's state snapshot across subgraphs.
+
+    ``heads`` of the run's checkpoint thread answer every latest-checkpoint
+    read, so only older checkpoints, if any, are loaded from the checkpointer.
+    """
+    if _heads_for(heads, runnable_config) is None:
+        return await graph.aget_state(runnable_config, subgraphs=True)
+    saver = _PrefetchedHeadsSaver(
+        cast("BaseCheckpointSaver", graph.checkpointer),
+        cast("CheckpointHeads", heads),
+    )
+    return await graph.aget_state(
+        {
+            **runnable_config,
+            "configurable": {
+                **runnable_config["configurable"],
+                CONFIG_KEY_CHECKPOINTER: saver,
+            },
+        },
+        subgraphs=True,
+    )
+
+
+def _heads_for(
+    heads: CheckpointHeads | None,
+    runnable_config: RunnableConfig,
+) -> CheckpointHeads | None:
+    if heads is None or heads.thread_id != runnable_config["configurable"].get(
+        "thread_id"
+    ):
+        return None
+    return heads
+
+
+class _PrefetchedHeadsSaver(BaseCheckpointSaver):
+    """Read-only saver that answers latest-checkpoint reads from heads."""
+
+    def __init__(self, saver: BaseCheckpointSaver, heads: CheckpointHeads) -> None:
+        super().__init__(serde=saver.serde)
+        self._saver = saver
+        self._heads = heads
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        configurable = config["configurable"]
+        if configurable.get(
+            "thread_id"
+        ) == self._heads.thread_id and not get_checkpoint_id(config):
+            return self._heads.tuples.get(configurable.get("checkpoint_ns", ""))
+        return await self._saver.aget_tuple(config)
+
+    async def aget_delta_channel_history(
+        self,
+        *,
+        config: RunnableConfig,
+        channels: Sequence[str],
+    ) -> Mapping[str, DeltaChannelHistory]:
+        return await self._saver.aget_delta_channel_history(
+            config=config, channels=channels
+        )
+
+    def get_next_version(self, current: Any, channel: None) -> Any:
+        return self._saver.get_next_version(current, channel)
+
+    def with_allowlist(
+        self,
+        extra_allowlist: Collection[tuple[str, ...]],
+    ) -> BaseCheckpointSaver:
+        # Heads were decoded without the graph's msgpack allowlist, so strict
+        # deserialization reads every checkpoint through the restricted saver.
+        return self._saver.with_allowlist(extra_allowlist)
+
+
 def require_checkpoint_id(config: RunnableConfig) -> str:
     """Return the checkpoint id from a validated LangGraph config."""
     try:
@@ -236,14 +422,23 @@ async def durable_interrupt_batch(
     graph: CompiledStateGraph,
     runnable_config: RunnableConfig | None,
     run_id: str | None,
+    *,
+    timings: RunTimings,
 ) -> LangGraphInterruptBatch | None:
-    """Read the durable checkpoint head after graph execution has quiesced."""
+    """
+    Read the durable checkpoint head after graph execution has quiesced.
+
+    An exposed batch is written through to the pending interrupt cache.
+    """
     if runnable_config is None:
         msg = "Interrupt-enabled runs require runnable configuration."
         raise RuntimeError(msg)
 
-    snapshot = await graph.aget_state(runnable_config, subgraphs=True)
+    thread_id = runnable_config["configurable"]["thread_id"]
+    with timings.measure(RunPhase.AGET_STATE):
+        snapshot = await graph.aget_state(runnable_config, subgraphs=True)
     if not snapshot.interrupts:
+        pending_interrupt_cache.discard(thread_id)
         return None
 
     pending_interrupts = interrupts_by_id(snapshot)
@@ -253,12 +448,15 @@ async def durable_interrupt_batch(
     if run_id is None:
         msg = "run_id cannot be None"
         raise RuntimeError(msg)
-    state_token = await checkpoint_state_token(graph, snapshot.config)
+    with timings.measure(RunPhase.CHECKPOINT_STATE_TOKEN):
+        state_token = await checkpoint_state_token(graph, snapshot.config)
     if state_token is None:
         msg = "Interrupted LangGraph state has no checkpoint tuple."
         raise RuntimeError(msg)
-    return LangGraphInterruptBatch(
+    batch = LangGraphInterruptBatch(
         run_id=run_id,
         state_token=state_token,
         interrupts=tuple(pending_interrupts.values()),
     )
+    pending_interrupt_cache.put(thread_id, batch)
+    return batch
@@ -0,0 +1,116 @@
+"""Start and stop registered graphs with the host application's lifespan."""
+
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Annotated
+
+from anyio import CancelScope, create_task_group, fail_after
+from pydantic import BaseModel, ConfigDict, Field
+
+from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.settings import settings
+from langgraph_openai_serve.graph.graph_registry import GraphConfig, GraphRegistry
+from langgraph_openai_serve.integrations.langfuse import get_langfuse_callback
+
+logger = get_logger(__name__)
+
+
+class GraphWarmup(BaseModel):
+    """Resolve every registered graph before the host app starts serving."""
+
+    model_config = ConfigDict(frozen=True)
+
+    parallel: bool = False
+    timeout: Annotated[float, Field(gt=0, allow_inf_nan=False)] | None = None
+
+
+class GraphLifecycle:
+    """
+    Run graph startup and shutdown hooks around the host application's lifespan.
+
+    Startup runs each graph's ``on_startup`` hook and, with a ``warmup`` policy,
+    resolves the graph so cached factories and registration checks are paid
+    before the first request. Only graphs whose startup hook completed are shut
+    down, in reverse order.
+    """
+
+    def __init__(
+        self,
+        graph_registry: GraphRegistry,
+        warmup: GraphWarmup | None = None,
+    ) -> None:
+        self.graph_registry = graph_registry
+        self.warmup = warmup
+        self._started: list[tuple[str, GraphConfig]] = []
+        self._timings: dict[str, float] = {}
+
+    @property
+    def timings(self) -> Mapping[str, float]:
+        """Seconds spent warming each graph during the last startup."""
+        return MappingProxyType(self._timings)
+
+    async def startup(self) -> None:
+        """Warm every registered graph, undoing partial startup on failure."""
+        self._timings = {}
+        start = time.perf_counter()
+        timeout = self.warmup.timeout if self.warmup is not None else None
+        try:
+            with fail_after(timeout):
+                await self._start_graphs()
+        except BaseException:
+            await self.shutdown()
+            raise
+
+        logger.info(
+            "server.graphs_started",
+            extra={
+                "graph_count": len(self._timings),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            },
+        )
+
+    async def shutdown(self) -> None:
+        """Run shutdown hooks for started graphs; one failure does not skip others."""
+        started, self._started = self._started, []
+        with CancelScope(shield=True):
+            for model, config in reversed(started):
+                if config.on_shutdown is None:
+                    continue
+                try:
+                    await config.on_shutdown()
+                except Exception:
+                    logger.exception(
+                        "server.graph_shutdown_failed", extra={"model": model}
+                    )
+
+    async def _start_graphs(self) -> None:
+        if settings.ENABLE_LANGFUSE:
+            get_langfuse_callback()
+
+        graphs = self.graph_registry.registry.items()
+        if self.warmup is None or not self.warmup.parallel:
+            for model, config in graphs:
+                await self._start_graph(model, config)
+            return
+
+        async with create_task_group() as task_group:
+            for model, config in graphs:
+                task_group.start_soon(self._start_graph, model, config)
+
+    async def _start_graph(self, model: str, config: GraphConfig) -> None:
+        start = time.perf_counter()
+        if config.on_startup is not None:
+            await config.on_startup()
+        # Register before resolving so a failed resolution still closes resources
+        # its startup hook opened.
+        self._started.append((model, config))
+        if self.warmup is not None:
+            await config.resolve_graph()
+
+        duration = time.perf_counter() - start
+        self._timings[model] = duration
+        logger.info(
+            "server.graph_started",
+            extra={"model": model, "duration_ms": round(duration * 1000, 3)},
+        )
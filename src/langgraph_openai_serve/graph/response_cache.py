@@ -0,0 +1,88 @@
+"""Exact-match cache of completed graph responses."""
+
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from langgraph.types import CustomStreamPart
+
+# Assistant text and custom events of one completed choice, in emission order.
+CachedCompletion = tuple[str | CustomStreamPart, ...]
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters of a ``ResponseCache`` since it was created or cleared."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    completion: CachedCompletion
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Keep completed responses by request key.
+
+    Entries expire ``ttl`` seconds after they were stored, and the least recently
+    used entry is evicted once ``max_entries`` are held.
+    """
+
+    def __init__(self, *, max_entries: int, ttl: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, _CacheEntry] = OrderedDict()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> ResponseCacheStats:
+        """Return the current counters."""
+        return ResponseCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    def get(self, key: bytes) -> CachedCompletion | None:
+        """Return the live completion stored under ``key``."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry.completion
+
+    def put(self, key: bytes, completion: CachedCompletion) -> None:
+        """Store a completed response, evicting the least recently used entry."""
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        )
+        # Custom event payloads belong to the graph that emitted them.
+        self._entries[key] = _CacheEntry(copy.deepcopy(completion), expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
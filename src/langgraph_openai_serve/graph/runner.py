@@ -1,14 +1,23 @@
 """Run LangGraph workflows behind the OpenAI-compatible chat API."""
 
 from collections.abc import AsyncGenerator
-from contextlib import aclosing
-from dataclasses import dataclass
+from contextlib import aclosing, nullcontext
+from dataclasses import dataclass, is_dataclass
+from inspect import isclass
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from anyio import CancelScope
+from langchain_core.callbacks import (
+    AsyncCallbackHandler,
+    AsyncCallbackManager,
+    BaseCallbackHandler,
+    BaseCallbackManager,
+)
 from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableConfig
 from langgraph.constants import TAG_HIDDEN
 from langgraph.types import CustomStreamPart, StreamMode
+from pydantic import BaseModel
 
 from langgraph_openai_serve.api.chat.schemas import (
     ChatCompletionRequest,
@@ -16,11 +25,14 @@ from langgraph_openai_serve.api.chat.schemas import (
 )
 from langgraph_openai_serve.core.logging import get_logger
 from langgraph_openai_serve.graph.features import GraphFeature
-from langgraph_openai_serve.graph.graph_registry import GraphRegistry
+from langgraph_openai_serve.graph.graph_registry import GraphRegistry, InvokeMode
 from langgraph_openai_serve.graph.interrupt import (
     models as interrupt_models,
     state as interrupt_state,
 )
+from langgraph_openai_serve.graph.interrupt.coordination import RunLeaseWatch
+from langgraph_openai_serve.graph.timing import RunPhase, RunTimings
+from langgraph_openai_serve.graph.usage import TokenUsage, UsageCallback
 from langgraph_openai_serve.graph.utils import (
     GraphRun,
     prepare_run,
@@ -28,20 +40,30 @@ from langgraph_openai_serve.graph.utils import (
 
 if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
+    from langgraph.graph.state import CompiledStateGraph
 
 logger = get_logger(__name__)
 
 
 @dataclass(frozen=True)
 class LangGraphInvocation:
-    """A graph result together with custom events emitted during its run."""
+    """
+    A graph result together with custom events emitted during its run.
+
+    ``usage`` sums the usage its model calls reported, or is ``None`` when none
+    reported any. ``timings`` are the phase timings of the run that produced it.
+    """
 
     output: "LangGraphOutput"
     custom_events: tuple[CustomStreamPart, ...]
+    usage: TokenUsage | None = None
+    timings: RunTimings | None = None
 
 
 LangGraphOutput = str | interrupt_models.LangGraphInterruptBatch
-LangGraphStreamEvent = str | interrupt_models.LangGraphInterruptBatch | CustomStreamPart
+LangGraphStreamEvent = (
+    str | interrupt_models.LangGraphInterruptBatch | CustomStreamPart | TokenUsage
+)
 
 _MISSING = object()
 _CheckpointDisposition = Literal["unknown", "preserve", "delete"]
@@ -82,7 +104,7 @@ async def run_langgraph(
 
 
 async def invoke_run(run: GraphRun) -> LangGraphInvocation:
-    """Invoke a graph and collect its custom events."""
+    """Invoke a graph within its budget and collect its custom events."""
     checkpoint_disposition: _CheckpointDisposition = "unknown"
     try:
         if not run.should_execute:
@@ -91,33 +113,15 @@ async def invoke_run(run: GraphRun) -> LangGraphInvocation:
                 msg = "Pending interrupt state disappeared before use."
                 raise RuntimeError(msg)
             checkpoint_disposition = "preserve"
-            return LangGraphInvocation(output=interrupt_batch, custom_events=())
-
-        stream_mode: list[StreamMode] = ["values", "custom"]
-
-        final_output: Any = _MISSING
-        custom_events: list[CustomStreamPart] = []
-        graph_stream = cast(
-            "AsyncGenerator[dict[str, Any], None]",
-            run.graph.astream(
-                run.inputs,
-                config=run.runnable_config,
-                context=run.context,
-                stream_mode=stream_mode,
-                output_keys=run.graph.output_channels,
-                **_astream_options(run),
-            ),
-        )
-        async with aclosing(graph_stream):
-            async for event in graph_stream:
-                if event.get("type") == "custom":
-                    custom_events.append(cast("CustomStreamPart", event))
-                    continue
+            return LangGraphInvocation(
+                output=interrupt_batch,
+                custom_events=(),
+                timings=run.timings,
+            )
 
-                # Subgraph values share this stream, but only the root namespace is
-                # the registered graph's final output.
-                if event.get("type") == "values" and not event.get("ns"):
-                    final_output = event.get("data")
+        usage = UsageCallback()
+        with run.timings.measure(RunPhase.EXECUTION):
+            final_output, custom_events = await _collect(run, usage)
 
         if run.config.supports(GraphFeature.INTERRUPTS):
             interrupt_batch = await _durable_interrupt_batch(run)
@@ -126,24 +130,166 @@ async def invoke_run(run: GraphRun) -> LangGraphInvocation:
                 return LangGraphInvocation(
                     output=interrupt_batch,
                     custom_events=tuple(custom_events),
+                    usage=usage.usage,
+                    timings=run.timings,
                 )
 
         if final_output is _MISSING:
             msg = "LangGraph invocation completed without a final value."
             raise RuntimeError(msg)
 
-        rendered_output = await run.config.render_output(final_output)
+        with run.timings.measure(RunPhase.RENDERING):
+            rendered_output = await run.config.render_output(final_output)
         if run.config.supports(GraphFeature.INTERRUPTS):
             checkpoint_disposition = "delete"
 
         return LangGraphInvocation(
             output=rendered_output,
             custom_events=tuple(custom_events),
+            usage=usage.usage,
+            timings=run.timings,
         )
     finally:
         await finalize_run(run, checkpoint_disposition)
 
 
+async def _collect(
+    run: GraphRun,
+    usage: UsageCallback,
+) -> tuple[Any, list[CustomStreamPart]]:
+    """Collect a run's final value and custom events within its budget and lease."""
+    watch = run.lease_watch()
+    async with run.budget.enforce():
+        with watch.guard() if watch is not None else nullcontext():
+            if run.config.invoke_mode is InvokeMode.FINAL:
+                return await _collect_final_output(run, usage)
+            return await _collect_values(run, usage)
+
+
+async def _collect_values(
+    run: GraphRun,
+    usage: UsageCallback,
+) -> tuple[Any, list[CustomStreamPart]]:
+    """Collect custom events and the last root value from a values stream."""
+    stream_mode: list[StreamMode] = ["values", "custom"]
+
+    final_output: Any = _MISSING
+    custom_events: list[CustomStreamPart] = []
+    graph_stream = cast(
+        "AsyncGenerator[dict[str, Any], None]",
+        run.graph.astream(
+            run.inputs,
+            config=_run_config(run, usage),
+            context=run.context,
+            stream_mode=stream_mode,
+            output_keys=run.graph.output_channels,
+            **_astream_options(run),
+        ),
+    )
+    async with aclosing(graph_stream):
+        async for event in graph_stream:
+            if event.get("type") == "custom":
+                custom_events.append(cast("CustomStreamPart", event))
+                continue
+
+            # Subgraph values share this stream, but only the root namespace is
+            # the registered graph's final output.
+            if event.get("type") == "values" and not event.get("ns"):
+                final_output = event.get("data")
+    return final_output, custom_events
+
+
+class _FinalOutputCallback(AsyncCallbackHandler):
+    """Record the output LangGraph reports when the root graph run ends."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.output: Any = _MISSING
+
+    async def on_chain_end(self, outputs: Any, **_kwargs: Any) -> None:
+        self.output = outputs
+
+
+async def _collect_final_output(
+    run: GraphRun,
+    usage: UsageCallback,
+) -> tuple[Any, list[CustomStreamPart]]:
+    """
+    Collect custom events and read the root output once at the end of the run.
+
+    A custom-only stream keeps subgraph custom events without materializing any
+    intermediate state. The root run's end callback carries the same output
+    channels the last root ``values`` event would have held.
+    """
+    output_callback = _FinalOutputCallback()
+    stream_mode: list[StreamMode] = ["custom"]
+
+    graph_stream = cast(
+        "AsyncGenerator[dict[str, Any], None]",
+        run.graph.astream(
+            run.inputs,
+            config=_with_callback(
+                _run_config(run, usage),
+                output_callback,
+                inherit=False,
+            ),
+            context=run.context,
+            stream_mode=stream_mode,
+            output_keys=run.graph.output_channels,
+            **_astream_options(run),
+        ),
+    )
+    async with aclosing(graph_stream):
+        custom_events = [
+            cast("CustomStreamPart", event) async for event in graph_stream
+        ]
+
+    final_output = output_callback.output
+    output_schema = _coerced_output_schema(run.graph)
+    if isinstance(final_output, dict) and output_schema is not None:
+        final_output = output_schema(**final_output)
+    return final_output, custom_events
+
+
+def _coerced_output_schema(graph: "CompiledStateGraph") -> type[Any] | None:
+    """
+    Get the schema LangGraph builds root ``values`` events from, if any.
+
+    Version 2 streams build pydantic and dataclass output schemas from the
+    output channels, so the end callback's mapping is built the same way.
+    """
+    schema = graph.builder.output_schema
+    if not isinstance(graph.output_channels, list) or not isclass(schema):
+        return None
+    if issubclass(schema, BaseModel) or is_dataclass(schema):
+        return schema
+    return None
+
+
+def _with_callback(
+    runnable_config: RunnableConfig | None,
+    callback: BaseCallbackHandler,
+    *,
+    inherit: bool,
+) -> RunnableConfig:
+    """
+    Attach a callback to a copy of the config, leaving the config unchanged.
+
+    Non-inherited handlers see the root graph run only; they are not passed to
+    nodes, subgraphs or models.
+    """
+    callbacks = (runnable_config or {}).get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        manager = callbacks.copy()
+    else:
+        handlers = list(callbacks or [])
+        manager = AsyncCallbackManager(handlers=handlers, inheritable_handlers=handlers)
+    manager.add_handler(callback, inherit=inherit)
+    config = RunnableConfig(**(runnable_config or {}))
+    config["callbacks"] = manager
+    return config
+
+
 async def run_langgraph_stream(
     model: str,
     messages: list[ChatCompletionRequestMessage],
@@ -165,7 +311,8 @@ async def run_langgraph_stream(
         request: The complete chat completion request passed to graph adapters.
 
     Yields:
-        Assistant text chunks, custom events, or LangGraph interrupts.
+        Assistant text chunks, custom events, the reported token usage, or
+        LangGraph interrupts.
 
     """
     run = await prepare_run(model, messages, graph_registry, request)
@@ -181,6 +328,10 @@ async def stream_run(
     """
     Stream an already prepared LangGraph invocation.
 
+    The graph stream is cancelled once the run's budget is exhausted. When its
+    models reported usage, the summed ``TokenUsage`` follows the last text chunk.
+    Its phases are timed in ``run.timings``, complete once the stream ends.
+
     Yields:
         LangGraph stream events.
 
@@ -197,29 +348,35 @@ async def stream_run(
             return
 
         stream_mode: list[StreamMode] = ["messages", "custom"]
+        usage = UsageCallback()
 
         graph_stream = cast(
             "AsyncGenerator[dict[str, Any], None]",
             run.graph.astream(
                 run.inputs,
-                config=run.runnable_config,
+                config=_run_config(run, usage),
                 context=run.context,
                 stream_mode=stream_mode,
                 **_astream_options(run),
             ),
         )
-        async with aclosing(graph_stream):
-            async for event in graph_stream:
-                if event.get("type") == "custom":
-                    yield cast("CustomStreamPart", event)
-                    continue
+        bounded_stream = _bounded(run, graph_stream)
+        with run.timings.measure(RunPhase.EXECUTION):
+            async with aclosing(bounded_stream):
+                async for event in bounded_stream:
+                    if event.get("type") == "custom":
+                        yield cast("CustomStreamPart", event)
+                        continue
+
+                    if event.get("type") != "messages":
+                        continue
 
-                if event.get("type") != "messages":
-                    continue
+                    content = text_from_message_event(event, run)
+                    if content:
+                        yield content
 
-                content = text_from_message_event(event, run)
-                if content:
-                    yield content
+        if usage.usage is not None:
+            yield usage.usage
 
         if run.config.supports(GraphFeature.INTERRUPTS):
             interrupt_batch = await _durable_interrupt_batch(run)
@@ -232,6 +389,40 @@ async def stream_run(
         await finalize_run(run, checkpoint_disposition)
 
 
+def _bounded(
+    run: GraphRun,
+    events: AsyncGenerator[dict[str, Any], None],
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Bound a graph stream by the run's budget and, if it can be lost, lease."""
+    bounded = run.budget.bound(events)
+    watch = run.lease_watch()
+    return bounded if watch is None else _while_leased(watch, bounded)
+
+
+async def _while_leased(
+    watch: RunLeaseWatch,
+    events: AsyncGenerator[dict[str, Any], None],
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Yield a graph stream's events while the run holds its lease.
+
+    Like the budget, the guard covers waiting for every event but not the
+    consumer's work between events.
+
+    Yields:
+        The stream's events unchanged.
+
+    """
+    async with aclosing(events):
+        while True:
+            with watch.guard():
+                try:
+                    event = await anext(events)
+                except StopAsyncIteration:
+                    return
+            yield event
+
+
 def text_from_message_event(event: dict, run: GraphRun) -> str | None:
     """Extract visible text from a streamable LangGraph message event."""
     message, metadata = event["data"]
@@ -246,6 +437,14 @@ def text_from_message_event(event: dict, run: GraphRun) -> str | None:
     return content or None
 
 
+def _run_config(run: GraphRun, usage: UsageCallback) -> RunnableConfig:
+    """Add the run's usage accounting and recursion limit to a config copy."""
+    config = _with_callback(run.runnable_config, usage, inherit=True)
+    if run.budget.recursion_limit is not None:
+        config["recursion_limit"] = run.budget.recursion_limit
+    return config
+
+
 def _astream_options(run: GraphRun) -> dict[str, Any]:
     """Build the shared execution options for LangGraph event streams."""
     options: dict[str, Any] = {"subgraphs": True, "version": "v2"}
@@ -254,27 +453,16 @@ def _astream_options(run: GraphRun) -> dict[str, Any]:
     return options
 
 
-def usage_for(
-    output: LangGraphOutput,
-    messages: list[ChatCompletionRequestMessage],
-) -> dict[str, int]:
-    """Calculate token usage."""
-    prompt_tokens = sum(len((message.content or "").split()) for message in messages)
-    completion_tokens = len(output.split()) if isinstance(output, str) else 0
-    return {
-        "prompt_tokens": prompt_tokens,
-        "completion_tokens": completion_tokens,
-        "total_tokens": prompt_tokens + completion_tokens,
-    }
-
-
 async def _durable_interrupt_batch(
     run: GraphRun,
 ) -> interrupt_models.LangGraphInterruptBatch | None:
+    if run.pending_batch is not None:
+        return run.pending_batch
     return await interrupt_state.durable_interrupt_batch(
         run.graph,
         run.runnable_config,
         run.run_id,
+        timings=run.timings,
     )
 
 
@@ -285,17 +473,22 @@ async def finalize_run(
     """
     Finalize checkpoint retention, then release the run lease.
 
-    Only state exposed as a resumable interrupt is preserved. Cleanup for an
+    Only state exposed as a resumable interrupt, or of a run that lost its lease
+    to a thread another process may now own, is preserved. Cleanup for an
     unclassified run is best-effort so it cannot mask the failure that prevented
     classification.
     """
+    watch = run.lease_watch()
+    if watch is not None and watch.lost:
+        checkpoint_disposition = "preserve"
     with CancelScope(shield=True):
         try:
             if checkpoint_disposition == "delete" or (
                 checkpoint_disposition == "unknown"
                 and run.config.supports(GraphFeature.INTERRUPTS)
             ):
-                await delete_checkpoint_thread(run)
+                with run.timings.measure(RunPhase.CHECKPOINT_DELETE):
+                    await delete_checkpoint_thread(run)
         except Exception:
             if checkpoint_disposition != "unknown":
                 raise
@@ -315,5 +508,6 @@ async def delete_checkpoint_thread(run: GraphRun) -> None:
         msg = "Interrupt-enabled run has no checkpoint thread id."
         raise RuntimeError(msg)
 
+    interrupt_state.pending_interrupt_cache.discard(run.checkpoint_thread_id)
     checkpointer = cast("BaseCheckpointSaver", run.graph.checkpointer)
     await checkpointer.adelete_thread(run.checkpoint_thread_id)
@@ -0,0 +1,186 @@
+"""Share one execution among concurrent identical requests."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing, suppress
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Counters of a ``SingleFlight`` since it was created."""
+
+    leaders: int
+    followers: int
+    in_flight: int
+
+
+class _Flight:
+    """One shared execution and the callers attached to it."""
+
+    # Assigned by ``SingleFlight._start`` before any caller attaches.
+    task: asyncio.Task[Any]
+
+    def __init__(self) -> None:
+        self.users = 0
+
+    def release(self) -> None:
+        # The execution belongs to no caller, so it stops only when the last one
+        # attached to it has gone.
+        self.users -= 1
+        if self.users == 0 and not self.task.done():
+            self.task.cancel()
+
+
+class _StreamFlight(_Flight):
+    """A shared event stream, recorded so late subscribers replay it from the start."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.events: list[Any] = []
+        self.error: BaseException | None = None
+        self.done = False
+        self._changed = asyncio.Event()
+
+    async def produce(
+        self,
+        start: Callable[[], Awaitable[AsyncGenerator[Any, None]]],
+    ) -> None:
+        try:
+            stream = await start()
+        except Exception as exc:  # ruff: ignore[blind-except]
+            # Every caller waiting on the flight reports the same failure.
+            self.ready.set_exception(exc)
+            return
+        else:
+            self.ready.set_result(None)
+        finally:
+            # A cancelled start must not leave callers waiting.
+            self.ready.cancel()
+
+        try:
+            async with aclosing(stream):
+                async for event in stream:
+                    self.events.append(event)
+                    self._notify()
+        except Exception as exc:  # ruff: ignore[blind-except]
+            self.error = exc
+        finally:
+            self.done = True
+            self._notify()
+
+    async def subscribe(self) -> AsyncGenerator[Any, None]:
+        try:
+            index = 0
+            while True:
+                changed = self._changed
+                while index < len(self.events):
+                    yield self.events[index]
+                    index += 1
+                if self.done:
+                    break
+                await changed.wait()
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.release()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class SingleFlight:
+    """
+    Run concurrent calls with the same key once and share the outcome.
+
+    The first caller of a key starts the shared execution in its own task, so a
+    cancelled caller does not cancel the others; the execution is cancelled only
+    once every caller attached to it has gone. A key is free again as soon as its
+    execution finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[bytes, _Flight] = {}
+        self._streams: dict[bytes, _StreamFlight] = {}
+        self._leaders = self._followers = 0
+
+    def stats(self) -> SingleFlightStats:
+        """Return the current counters."""
+        return SingleFlightStats(
+            leaders=self._leaders,
+            followers=self._followers,
+            in_flight=len(self._calls) + len(self._streams),
+        )
+
+    async def call(self, key: bytes, work: Callable[[], Awaitable[T]]) -> T:
+        """Await ``work()``, or the in-flight call already running for ``key``."""
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = _Flight()
+            flight.task = self._start(self._calls, key, flight, work())
+        else:
+            self._followers += 1
+        flight.users += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.release()
+
+    async def stream(
+        self,
+        key: bytes,
+        start: Callable[[], Awaitable[AsyncGenerator[T, None]]],
+    ) -> AsyncGenerator[T, None]:
+        """
+        Subscribe to the stream ``start()`` opens, or the one open for ``key``.
+
+        Returns once the stream has started, so errors raised by ``start`` reach
+        every caller before any event. Each subscription yields every event from
+        the beginning of the stream.
+
+        """
+        flight = self._streams.get(key)
+        if flight is None:
+            flight = _StreamFlight()
+            flight.task = self._start(self._streams, key, flight, flight.produce(start))
+        else:
+            self._followers += 1
+        flight.users += 1
+        try:
+            await asyncio.shield(flight.ready)
+        except BaseException:
+            flight.release()
+            raise
+        # The subscription releases the flight when it is closed; one that is
+        # never iterated leaves the execution to finish on its own.
+        return flight.subscribe()
+
+    def _start(
+        self,
+        flights: dict[bytes, Any],
+        key: bytes,
+        flight: _Flight,
+        work: Awaitable[Any],
+    ) -> asyncio.Task[Any]:
+        async def run() -> Any:
+            return await work
+
+        self._leaders += 1
+        flights[key] = flight
+        task = asyncio.create_task(run(), name="single-flight")
+
+        def forget(_task: asyncio.Task[Any]) -> None:
+            if flights.get(key) is flight:
+                del flights[key]
+            # Callers that left before it finished never read its outcome.
+            if not task.cancelled():
+                with suppress(BaseException):
+                    task.exception()
+
+        task.add_done_callback(forget)
+        return task
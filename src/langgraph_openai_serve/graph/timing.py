@@ -0,0 +1,67 @@
+"""Time the preparation, execution and cleanup phases of one graph run."""
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+
+
+class RunPhase(StrEnum):
+    """A timed phase of a graph run, named as it appears in ``Server-Timing``."""
+
+    RESOLVE_GRAPH = "resolve_graph"
+    BUILD_INPUT = "build_input"
+    BUILD_CONTEXT = "build_context"
+    LEASE = "lease"
+    AGET_STATE = "aget_state"
+    CHECKPOINT_STATE_TOKEN = "checkpoint_state_token"  # ruff: ignore[hardcoded-password-string]
+    EXECUTION = "execution"
+    RENDERING = "rendering"
+    CHECKPOINT_DELETE = "checkpoint_delete"
+
+
+class RunTimings:
+    """
+    Seconds one graph run spent in each phase, measured with a monotonic clock.
+
+    A phase entered more than once, such as reading state before and after
+    execution, accumulates. Streamed execution includes time spent waiting for
+    the client to read earlier chunks.
+    """
+
+    def __init__(self) -> None:
+        self._seconds: dict[RunPhase, float] = {}
+
+    @contextmanager
+    def measure(self, phase: RunPhase) -> Iterator[None]:
+        """Add the time spent in the enclosed block to ``phase``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - started)
+
+    def add(self, phase: RunPhase, seconds: float) -> None:
+        """Add ``seconds`` to ``phase``."""
+        self._seconds[phase] = self._seconds.get(phase, 0.0) + seconds
+
+    def seconds(self) -> dict[RunPhase, float]:
+        """Return the measured phases in the order they were first entered."""
+        return dict(self._seconds)
+
+    @classmethod
+    def slowest(cls, runs: Iterable["RunTimings"]) -> "RunTimings":
+        """
+        Combine the timings of runs that executed concurrently.
+
+        Choices of one request run side by side, so each phase reports its
+        slowest run rather than their sum.
+        """
+        combined = cls()
+        for run in runs:
+            for phase, seconds in run.seconds().items():
+                combined._seconds[phase] = max(
+                    combined._seconds.get(phase, 0.0),
+                    seconds,
+                )
+        return combined
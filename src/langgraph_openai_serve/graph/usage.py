@@ -0,0 +1,123 @@
+"""Account for the tokens a graph run spends in its model calls."""
+
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from langgraph_openai_serve.core.settings import settings
+
+if TYPE_CHECKING:
+    from langchain_core.outputs import LLMResult
+    from tiktoken import Encoding
+
+# Distinct message texts whose fallback token counts are remembered.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Prompt and completion tokens in the OpenAI ``usage`` shape."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt and completion tokens together."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        """Add the tokens of two runs or model calls."""
+        return TokenUsage(
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the OpenAI ``usage`` object."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+
+class UsageCallback(BaseCallbackHandler):
+    """
+    Sum the ``usage_metadata`` that chat models report for one graph run.
+
+    Attached as an inherited handler, it sees every model call made by the run's
+    nodes and subgraphs. It runs inline and ignores every event but model ends,
+    so it adds no work to graph steps. ``usage`` stays ``None`` when no call
+    reported usage.
+    """
+
+    run_inline = True
+    ignore_chain = True
+    ignore_chat_model = True
+    ignore_agent = True
+    ignore_retriever = True
+    ignore_retry = True
+    ignore_custom_event = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.usage: TokenUsage | None = None
+        # Model calls of synchronous nodes report from worker threads.
+        self._lock = Lock()
+
+    def on_llm_end(self, response: "LLMResult", **_kwargs: Any) -> None:
+        """Add the usage reported by one finished model call."""
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage_metadata = getattr(message, "usage_metadata", None)
+                if not usage_metadata:
+                    continue
+                reported = TokenUsage(
+                    prompt_tokens=usage_metadata.get("input_tokens", 0),
+                    completion_tokens=usage_metadata.get("output_tokens", 0),
+                )
+                with self._lock:
+                    self.usage = (
+                        reported if self.usage is None else self.usage + reported
+                    )
+
+
+def estimate_usage(output: str | None, messages: list[Any]) -> TokenUsage:
+    """
+    Estimate usage for a run whose models reported none.
+
+    Tokens are counted with the ``LGOS_USAGE_TOKENIZER`` encoding when it is set,
+    or as whitespace-separated words otherwise.
+    """
+    tokenizer = settings.USAGE_TOKENIZER
+    return TokenUsage(
+        prompt_tokens=sum(
+            count_tokens(message.content or "", tokenizer) for message in messages
+        ),
+        completion_tokens=count_tokens(output, tokenizer) if output else 0,
+    )
+
+
+@lru_cache(maxsize=_TOKEN_COUNT_CACHE_SIZE)
+def count_tokens(text: str, tokenizer: str | None = None) -> int:
+    """
+    Count the fallback tokens of one message text, remembering recent texts.
+
+    ``tokenizer`` names a ``tiktoken`` encoding; without one, whitespace-separated
+    words are counted. Counts are remembered per tokenizer and text.
+    """
+    if tokenizer is None:
+        return len(text.split())
+    return len(_encoding(tokenizer).encode_ordinary(text))
+
+
+@cache
+def _encoding(name: str) -> "Encoding":
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
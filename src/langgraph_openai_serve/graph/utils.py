@@ -14,21 +14,37 @@ from langgraph_openai_serve.api.chat.schemas import (
     ChatCompletionRequest,
     ChatCompletionRequestMessage,
 )
-from langgraph_openai_serve.api.chat.utils.interrupts import parse_resume_request
+from langgraph_openai_serve.api.chat.utils.interrupts import (
+    InterruptResume,
+    parse_resume_request,
+)
 from langgraph_openai_serve.core.logging import (
     bind_log_context,
     get_log_context,
     get_logger,
 )
 from langgraph_openai_serve.core.settings import settings
+from langgraph_openai_serve.graph.admission import AdmissionTicket
+from langgraph_openai_serve.graph.budget import RunBudget, start_run_budget
 from langgraph_openai_serve.graph.features import GraphFeature
 from langgraph_openai_serve.graph.graph_registry import (
+    AdmissionPolicy,
+    FairnessKey,
     GraphConfig,
     GraphRegistry,
 )
 from langgraph_openai_serve.graph.interrupt import state as interrupt_state
+from langgraph_openai_serve.graph.interrupt.coordination import (
+    RunLeaseWatch,
+    RunLeaseWatcher,
+)
+from langgraph_openai_serve.graph.interrupt.models import (
+    CheckpointHeads,
+    LangGraphInterruptBatch,
+)
+from langgraph_openai_serve.graph.timing import RunPhase, RunTimings
 from langgraph_openai_serve.integrations.langfuse import get_langfuse_callback
-from langgraph_openai_serve.utils.message import convert_to_lc_messages
+from langgraph_openai_serve.utils.message import message_prefix_cache
 
 logger = get_logger(__name__)
 _RUN_NAME = "lgos.chat_completion"
@@ -36,6 +52,10 @@ _SESSION_ID_METADATA_KEY = "session_id"
 _LANGFUSE_SESSION_ID_METADATA_KEY = "langfuse_session_id"
 
 
+class UnsupportedChoiceCountError(ValueError):
+    """Raised when a graph cannot produce the requested number of choices."""
+
+
 @dataclass
 class GraphRun:
     """Context for a graph run."""
@@ -48,44 +68,79 @@ class GraphRun:
     run_id: str | None
     checkpoint_thread_id: str | None = None
     should_execute: bool = True
-    _lease: AbstractAsyncContextManager[None] | None = field(
+    pending_batch: LangGraphInterruptBatch | None = None
+    budget: RunBudget = field(default_factory=RunBudget)
+    timings: RunTimings = field(default_factory=RunTimings)
+    _lease: AbstractAsyncContextManager[CheckpointHeads | None] | None = field(
         default=None,
         repr=False,
     )
+    _admission: AdmissionTicket | None = field(default=None, repr=False)
+
+    def lease_watch(self) -> RunLeaseWatch | None:
+        """Return the watch of this run's lease, if its coordinator can lose it."""
+        coordinator = self.config.run_coordinator
+        if self._lease is None or not isinstance(coordinator, RunLeaseWatcher):
+            return None
+        return coordinator.lease_watch(cast("str", self.checkpoint_thread_id))
+
+    def hold(self, admission: AdmissionTicket) -> None:
+        """Keep a share of the request's admission until this run is closed."""
+        self._admission = admission
 
     async def aclose(self) -> None:
-        """Release this run's single-flight lease exactly once."""
+        """Release this run's single-flight lease and admission exactly once."""
         lease, self._lease = self._lease, None
-        if lease is not None:
-            await lease.__aexit__(None, None, None)
+        admission, self._admission = self._admission, None
+        try:
+            if lease is not None:
+                await lease.__aexit__(None, None, None)
+        finally:
+            if admission is not None:
+                admission.release()
 
 
-async def prepare_run(  # ruff: ignore[too-many-locals]
+async def prepare_run(  # ruff: ignore[too-many-locals, too-many-arguments]
     model: str,
     messages: list[ChatCompletionRequestMessage],
     graph_registry: GraphRegistry,
     request: ChatCompletionRequest | None,
     *,
     checkpoint_scope: str = "default",
+    budget: RunBudget | None = None,
 ) -> GraphRun:
-    """Prepare a graph run."""
+    """
+    Prepare a graph run.
+
+    Without a ``budget``, the run's deadline starts now from the graph's default
+    execution budget. Each preparation phase is timed in the run's ``timings``.
+    """
     graph_config = graph_registry.get_graph(model)
+    budget = budget or start_run_budget(graph_config.execution_budget)
+    timings = RunTimings()
 
     request = request or ChatCompletionRequest(model=model, messages=messages)
-    graph = await graph_config.resolve_graph()
+    with timings.measure(RunPhase.RESOLVE_GRAPH):
+        graph = await graph_config.resolve_graph()
 
     if not graph_config.supports(GraphFeature.INTERRUPTS):
-        lc_messages = convert_to_lc_messages(messages)
+        with timings.measure(RunPhase.BUILD_INPUT):
+            lc_messages = message_prefix_cache.convert(messages)
+            inputs = await graph_config.build_input(request, lc_messages)
+        with timings.measure(RunPhase.BUILD_CONTEXT):
+            context = await graph_config.build_context(request, graph)
         return GraphRun(
             config=graph_config,
             graph=graph,
-            inputs=await graph_config.build_input(request, lc_messages),
-            context=await graph_config.build_context(request, graph),
+            inputs=inputs,
+            context=context,
             runnable_config=build_runnable_config(
                 graph_config.runtime_callbacks,
                 metadata=_runnable_metadata(request),
             ),
             run_id=None,
+            budget=budget,
+            timings=timings,
         )
 
     resume = parse_resume_request(messages)
@@ -111,20 +166,25 @@ async def prepare_run(  # ruff: ignore[too-many-locals]
         msg = "Interrupt run has no coordinator."
         raise RuntimeError(msg)
     lease = coordinator(checkpoint_thread_id)
-    await lease.__aenter__()  # ruff: ignore[unnecessary-dunder-call]
+    with timings.measure(RunPhase.LEASE):
+        heads = await lease.__aenter__()  # ruff: ignore[unnecessary-dunder-call]
 
     try:
-        snapshot = await graph.aget_state(runnable_config, subgraphs=True)
-        inputs, should_execute = await interrupt_state.prepare_interrupt_input(
+        inputs, should_execute, pending_batch = await _interrupt_input(
             graph_config,
             graph,
             request,
-            snapshot,
+            runnable_config,
             resume,
+            heads=heads,
+            timings=timings,
         )
-        context = (
-            await graph_config.build_context(request, graph) if should_execute else None
-        )
+        with timings.measure(RunPhase.BUILD_CONTEXT):
+            context = (
+                await graph_config.build_context(request, graph)
+                if should_execute
+                else None
+            )
     except BaseException:
         error_info = sys.exc_info()
         with CancelScope(shield=True):
@@ -143,10 +203,134 @@ async def prepare_run(  # ruff: ignore[too-many-locals]
         run_id=run_id,
         checkpoint_thread_id=checkpoint_thread_id,
         should_execute=should_execute,
+        pending_batch=pending_batch,
+        budget=budget,
+        timings=timings,
         _lease=lease,
     )
 
 
+async def _interrupt_input(  # ruff: ignore[too-many-arguments]
+    graph_config: GraphConfig,
+    graph: CompiledStateGraph,
+    request: ChatCompletionRequest,
+    runnable_config: RunnableConfig,
+    resume: InterruptResume | None,
+    *,
+    heads: CheckpointHeads | None,
+    timings: RunTimings,
+) -> tuple[Any, bool, LangGraphInterruptBatch | None]:
+    """Prepare leased interrupt input, returning a cached batch to re-emit."""
+    pending_batch = await interrupt_state.cached_interrupt_batch(
+        graph,
+        runnable_config,
+        heads,
+        timings=timings,
+    )
+    if pending_batch is not None:
+        inputs, should_execute = interrupt_state.prepare_cached_interrupt_input(
+            pending_batch,
+            resume,
+            runnable_config["configurable"]["thread_id"],
+        )
+        return inputs, should_execute, None if should_execute else pending_batch
+
+    with timings.measure(RunPhase.AGET_STATE):
+        snapshot = await interrupt_state.aget_interrupt_state(
+            graph,
+            runnable_config,
+            heads,
+        )
+    inputs, should_execute = await interrupt_state.prepare_interrupt_input(
+        graph_config,
+        graph,
+        request,
+        snapshot,
+        resume,
+        timings=timings,
+        heads=heads,
+    )
+    return inputs, should_execute, None
+
+
+async def prepare_choice_runs(
+    request: ChatCompletionRequest,
+    graph_registry: GraphRegistry,
+    *,
+    checkpoint_scope: str = "default",
+    budget: RunBudget | None = None,
+) -> list[GraphRun]:
+    """
+    Prepare one independent run for every choice the request asks for.
+
+    Interrupt runs are bound to one durable operation, so only one choice can
+    own it. A graph with an admission policy admits the request before any run
+    is prepared, and its choice runs share the admitted slot. A ``budget``
+    replaces the graph's default execution budget for every choice.
+    """
+    choice_count = request.n or 1
+    graph_config = graph_registry.get_graph(request.model)
+    if choice_count > 1 and graph_config.supports(GraphFeature.INTERRUPTS):
+        msg = "Interrupt-enabled graphs support only n=1."
+        raise UnsupportedChoiceCountError(msg)
+
+    admission_control = graph_config.admission_control
+    admission = (
+        await admission_control.admit(
+            admission_key(admission_control.policy, request, checkpoint_scope),
+            holders=choice_count,
+            interactive=bool(request.stream),
+        )
+        if admission_control is not None
+        else None
+    )
+    runs: list[GraphRun] = []
+    try:
+        # Append each run as soon as it is prepared so a later failure can
+        # release it; a comprehension would lose the partial list.
+        for _ in range(choice_count):
+            run = await prepare_run(
+                request.model,
+                request.messages,
+                graph_registry,
+                request,
+                checkpoint_scope=checkpoint_scope,
+                budget=budget,
+            )
+            if admission is not None:
+                run.hold(admission)
+            runs.append(run)
+    except BaseException:
+        with CancelScope(shield=True):
+            for run in runs:
+                try:
+                    await run.aclose()
+                except Exception:
+                    logger.exception("graph_run.preparation_cleanup_failed")
+        if admission is not None:
+            for _ in range(choice_count - len(runs)):
+                admission.release()
+        raise
+    return runs
+
+
+def admission_key(
+    policy: AdmissionPolicy,
+    request: ChatCompletionRequest,
+    checkpoint_scope: str,
+) -> str:
+    """Get the key a request is queued under by a fair admission policy."""
+    key = ""
+    if policy.fairness is not None:
+        key = checkpoint_scope
+    if policy.fairness in {FairnessKey.USER, FairnessKey.SESSION}:
+        key = request.user or key
+    if policy.fairness is FairnessKey.SESSION:
+        session_id = (request.metadata or {}).get(_SESSION_ID_METADATA_KEY)
+        key = session_id if isinstance(session_id, str) and session_id else key
+    return key
+
+
 def build_runnable_config(
     callbacks: Callbacks,
     configurable: dict[str, Any] | None = None,
@@ -1,25 +1,153 @@
 """PostgreSQL coordination for interrupt-enabled graph runs."""
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import asyncio
+import contextlib
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from functools import cache
 from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
 from threading import BoundedSemaphore
-from typing import Any
+from typing import Any, LiteralString, Self, cast
 
+import anyio
 from anyio import CancelScope
+from langgraph.checkpoint.base import RESUME, CheckpointTuple
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg import AsyncConnection
+from psycopg.rows import DictRow, dict_row
 from psycopg_pool import AsyncConnectionPool
 
 from langgraph_openai_serve.core.logging import get_logger
-from langgraph_openai_serve.graph.interrupt.coordination import RunBusyError
+from langgraph_openai_serve.graph.interrupt.coordination import (
+    RunBusyError,
+    RunLeaseWatch,
+)
+from langgraph_openai_serve.graph.interrupt.models import (
+    CheckpointHeads,
+    ResumeHead,
+    resume_write_count,
+)
 
-_TRY_ADVISORY_LOCK_SQL = "SELECT pg_try_advisory_lock(%s) AS acquired"
-_UNLOCK_ADVISORY_LOCK_SQL = "SELECT pg_advisory_unlock(%s) AS released"
+_TRY_ADVISORY_LOCK_SQL: LiteralString = "SELECT pg_try_advisory_lock(%s) AS acquired"
+_UNLOCK_ADVISORY_LOCK_SQL: LiteralString = "SELECT pg_advisory_unlock(%s) AS released"
+_HEALTH_CHECK_SQL: LiteralString = "SELECT 1 AS alive"
+# The recursive CTE walks distinct namespaces through the primary key index, so
+# reading every namespace head costs one index probe per namespace rather than a
+# scan of the thread history.
+_NAMESPACE_HEADS_SQL: LiteralString = """
+    WITH RECURSIVE namespaces AS (
+        (
+            SELECT checkpoint_ns FROM checkpoints
+            WHERE thread_id = %(thread_id)s
+            ORDER BY checkpoint_ns LIMIT 1
+        )
+        UNION ALL
+        SELECT (
+            SELECT later.checkpoint_ns FROM checkpoints AS later
+            WHERE later.thread_id = %(thread_id)s
+                AND later.checkpoint_ns > namespaces.checkpoint_ns
+            ORDER BY later.checkpoint_ns LIMIT 1
+        )
+        FROM namespaces WHERE namespaces.checkpoint_ns IS NOT NULL
+    )
+    SELECT namespaces.checkpoint_ns, (
+        SELECT max(head.checkpoint_id) FROM checkpoints AS head
+        WHERE head.thread_id = %(thread_id)s
+            AND head.checkpoint_ns = namespaces.checkpoint_ns
+    ) AS checkpoint_id
+    FROM namespaces WHERE namespaces.checkpoint_ns IS NOT NULL"""
+# Appended to the saver's checkpoint SELECT to read whole head tuples.
+_CHECKPOINT_HEADS_WHERE_SQL: LiteralString = f"""
+WHERE thread_id = %(thread_id)s AND (checkpoint_ns, checkpoint_id) IN ({_NAMESPACE_HEADS_SQL}
+)"""
+# State tokens need only each head's id and its pending resume writes, so no
+# checkpoint, channel blob or other write is transferred or decoded.
+_RESUME_HEADS_SQL: LiteralString = f"""
+SELECT heads.checkpoint_ns, heads.checkpoint_id, writes.task_id, writes.type,
+    writes.blob
+FROM ({_NAMESPACE_HEADS_SQL}
+) AS heads
+LEFT JOIN checkpoint_writes AS writes
+    ON writes.thread_id = %(thread_id)s
+    AND writes.checkpoint_ns = heads.checkpoint_ns
+    AND writes.checkpoint_id = heads.checkpoint_id
+    AND writes.channel = %(channel)s"""  # ruff: ignore[hardcoded-sql-expression]
+# Older checkpoints need pending sends migrated from their parent, which only
+# the saver's own reads perform.
+_MIN_PREFETCH_CHECKPOINT_VERSION = 4
+# Head rows are decoded with the saver's private row loader, whose signature is
+# only known for these langgraph-checkpoint-postgres major versions.
+_ROW_LOADER_MAJOR_VERSIONS = frozenset({3})
+
+_CONNECTION_KWARGS = {
+    "autocommit": True,
+    "prepare_threshold": 0,
+    "row_factory": dict_row,
+}
+# Checkpoint I/O happens between graph steps rather than for a whole run, so
+# one checkpoint connection serves several concurrent runs.
+_RUNS_PER_CHECKPOINT_CONNECTION = 4
+# A pooled lease holds a server connection for its whole run. Above this many
+# concurrent runs, leases are multiplexed over a few sessions by default so one
+# worker cannot exhaust the server's max_connections.
+_MAX_POOLED_LEASES = 64
+_DEFAULT_LOCK_CONNECTIONS = 2
+_MIN_CHECKPOINT_CONNECTIONS = 2
 
 _PostgresPool = AsyncConnectionPool[AsyncConnection[dict[str, Any]]]
 logger = get_logger(__name__)
 
 
+class PostgresCheckpointSaver(AsyncPostgresSaver):
+    """
+    ``AsyncPostgresSaver`` that reads every namespace head with one query.
+
+    It implements ``ResumeHeadReader``, so interrupt state tokens cost one index
+    probe per checkpoint namespace instead of a scan of the thread's whole
+    checkpoint history, and decode only pending resume writes. It also
+    implements ``CheckpointHeadReader`` for callers that need whole head tuples.
+    """
+
+    async def aget_resume_heads(self, thread_id: str) -> dict[str, ResumeHead]:
+        """Return the checkpoint id and resume write counts of every head."""
+        async with self._cursor() as cursor:
+            await cursor.execute(
+                _RESUME_HEADS_SQL,
+                {"thread_id": thread_id, "channel": RESUME},
+            )
+            rows = await cursor.fetchall()
+        checkpoint_ids: dict[str, str] = {}
+        resume_writes: dict[str, list[tuple[str, int]]] = {}
+        for row in rows:
+            namespace = row["checkpoint_ns"]
+            checkpoint_ids[namespace] = row["checkpoint_id"]
+            writes = resume_writes.setdefault(namespace, [])
+            if row["task_id"] is not None:
+                value = self.serde.loads_typed((row["type"], row["blob"]))
+                writes.append((row["task_id"], resume_write_count(value)))
+        return {
+            namespace: ResumeHead(
+                checkpoint_id=checkpoint_id,
+                resume_writes=tuple(sorted(resume_writes[namespace])),
+            )
+            for namespace, checkpoint_id in checkpoint_ids.items()
+        }
+
+    async def aget_checkpoint_heads(self, thread_id: str) -> CheckpointHeads | None:
+        """Return the thread's checkpoint heads, or None for legacy checkpoints."""
+        async with self._cursor() as cursor:
+            await cursor.execute(
+                _checkpoint_heads_sql(self),
+                {"thread_id": thread_id},
+                binary=True,
+            )
+            head_rows = await cursor.fetchall()
+        return await _load_checkpoint_heads(self, thread_id, head_rows)
+
+
 class PostgresRunCoordinator:
     """
     Coordinate runs with PostgreSQL session advisory locks.
@@ -29,6 +157,11 @@ class PostgresRunCoordinator:
     ``max_concurrent_leases`` limits how many pool connections coordination may
     hold at once. When the checkpointer shares this pool, reserve at least one
     connection for checkpoint I/O to avoid exhausting the pool with leases.
+
+    With a ``checkpointer``, each lease pipelines its lock with a read of the
+    latest checkpoint in every namespace of the leased thread, and enters with
+    those ``CheckpointHeads``. Run preparation then builds the state snapshot
+    and state token from that single round trip.
     """
 
     def __init__(
@@ -36,6 +169,7 @@ class PostgresRunCoordinator:
         pool: _PostgresPool,
         *,
         max_concurrent_leases: int,
+        checkpointer: AsyncPostgresSaver | None = None,
     ) -> None:
         if getattr(pool, "close_returns", False) is True:
             msg = "PostgresRunCoordinator requires a pool with close_returns=False."
@@ -49,21 +183,46 @@ class PostgresRunCoordinator:
             raise ValueError(msg)
         self._pool = pool
         self._capacity = BoundedSemaphore(max_concurrent_leases)
+        self._checkpointer = checkpointer
 
     @asynccontextmanager
-    async def __call__(self, key: str, /) -> AsyncIterator[None]:
-        """Acquire Postgres advisory lease."""
+    async def __call__(self, key: str, /) -> AsyncIterator[CheckpointHeads | None]:
+        """
+        Acquire Postgres advisory lease.
+
+        Yields:
+            The thread's checkpoint heads when read with the lock, or None.
+
+        """
         if not self._capacity.acquire(blocking=False):
             raise RunBusyError(key)
         try:
             lock_key = _advisory_lock_key(key)
             async with self._pool.connection() as connection:
-                if not await _try_acquire_advisory_lock(connection, lock_key):
+                head_rows: list[dict[str, Any]] | None = None
+                if self._checkpointer is None:
+                    acquired = await _try_acquire_advisory_lock(connection, lock_key)
+                else:
+                    acquired, head_rows = await _try_acquire_advisory_lock_with_heads(
+                        connection,
+                        lock_key,
+                        _checkpoint_heads_sql(self._checkpointer),
+                        key,
+                    )
+                if not acquired:
                     raise RunBusyError(key)
 
                 body_error: BaseException | None = None
                 try:
-                    yield
+                    yield (
+                        None
+                        if head_rows is None
+                        else await _load_checkpoint_heads(
+                            cast("AsyncPostgresSaver", self._checkpointer),
+                            key,
+                            head_rows,
+                        )
+                    )
                 except BaseException as exc:
                     body_error = exc
                     raise
@@ -78,6 +237,441 @@ class PostgresRunCoordinator:
             self._capacity.release()
 
 
+class MultiplexedPostgresRunCoordinator:
+    """
+    Coordinate runs with advisory locks multiplexed over dedicated sessions.
+
+    Every lease takes a session advisory lock on one of ``lock_connections``
+    connections opened from ``conninfo`` for coordination only, chosen by the
+    lock key, and releases it on the same session. Leases therefore hold no
+    pool connection while their run executes, and thousands of concurrent runs
+    share a few sessions. PostgreSQL advisory locks are reentrant within a
+    session, so keys already leased by this process are rejected locally
+    without a round trip.
+
+    Closing a session releases every lock it holds. A session whose statement
+    fails or takes longer than ``statement_timeout`` seconds, including the
+    health check run every ``health_check_interval`` seconds while it holds
+    locks, is closed and replaced. Its leases are lost: their runs are
+    cancelled through their ``RunLeaseWatch`` and end without unlocking. Call
+    ``aclose()`` when the process stops serving, for example at the end of the
+    host lifespan.
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        *,
+        lock_connections: int = _DEFAULT_LOCK_CONNECTIONS,
+        health_check_interval: float = 5.0,
+        statement_timeout: float = 5.0,
+    ) -> None:
+        if (
+            isinstance(lock_connections, bool)
+            or not isinstance(lock_connections, int)
+            or lock_connections < 1
+        ):
+            msg = "lock_connections must be a positive integer"
+            raise ValueError(msg)
+        if not health_check_interval > 0:
+            msg = "health_check_interval must be positive"
+            raise ValueError(msg)
+        if not statement_timeout > 0:
+            msg = "statement_timeout must be positive"
+            raise ValueError(msg)
+        self._conninfo = conninfo
+        self._sessions = [
+            _LockSession(statement_timeout) for _ in range(lock_connections)
+        ]
+        self._health_check_interval = health_check_interval
+        self._leases: dict[int, RunLeaseWatch] = {}
+        self._watchdog: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def __call__(self, key: str, /) -> AsyncIterator[None]:
+        """Acquire a multiplexed Postgres advisory lease."""
+        lock_key = _advisory_lock_key(key)
+        if lock_key in self._leases:
+            raise RunBusyError(key)
+        watch = self._leases[lock_key] = RunLeaseWatch(key)
+        try:
+            self._watch()
+            session = self._sessions[lock_key % len(self._sessions)]
+            # Shielded statements always finish or time out, so a cancelled
+            # request never leaves a lock of unknown state on a session other
+            # leases share.
+            with CancelScope(shield=True):
+                generation = await session.try_lock(self._conninfo, lock_key, watch)
+            if generation is None:
+                raise RunBusyError(key)
+
+            body_error: BaseException | None = None
+            try:
+                yield
+            except BaseException as exc:
+                body_error = exc
+                raise
+            finally:
+                try:
+                    with CancelScope(shield=True):
+                        await session.unlock(lock_key, generation)
+                except Exception:
+                    if body_error is None:
+                        raise
+                    logger.exception("postgres.graph_run_lease_release_failed")
+        finally:
+            del self._leases[lock_key]
+
+    def lease_watch(self, key: str, /) -> RunLeaseWatch | None:
+        """Return the watch of the lease this process holds for ``key``."""
+        return self._leases.get(_advisory_lock_key(key))
+
+    @property
+    def held_leases(self) -> int:
+        """Leases this process currently holds across its lock sessions."""
+        return sum(len(session.leases) for session in self._sessions)
+
+    async def check_sessions(self) -> None:
+        """Close and replace every lock session that fails a health check."""
+        for session in self._sessions:
+            if session.leases:
+                with contextlib.suppress(Exception):
+                    await session.check()
+
+    async def aclose(self) -> None:
+        """Stop health checks and close every lock session."""
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            watchdog.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watchdog
+        with CancelScope(shield=True):
+            for session in self._sessions:
+                await session.discard()
+
+    def _watch(self) -> None:
+        if self._watchdog is None or self._watchdog.done():
+            self._watchdog = asyncio.create_task(
+                self._check_periodically(),
+                name="postgres-lock-session-health",
+            )
+
+    async def _check_periodically(self) -> None:
+        while True:
+            await anyio.sleep(self._health_check_interval)
+            await self.check_sessions()
+
+
+@dataclass(eq=False)
+class _LockSession:
+    """One dedicated connection and the advisory locks it holds."""
+
+    timeout: float
+    connection: AsyncConnection[DictRow] | None = None
+    generation: int = 0
+    leases: dict[int, RunLeaseWatch] = field(default_factory=dict)
+    guard: anyio.Lock = field(default_factory=anyio.Lock)
+
+    async def try_lock(
+        self,
+        conninfo: str,
+        lock_key: int,
+        watch: RunLeaseWatch,
+    ) -> int | None:
+        """Take a lock, returning the session generation that holds it."""
+        async with self.guard:
+            if self.connection is None or self.connection.closed:
+                await self._replace()
+                with anyio.fail_after(self.timeout):
+                    self.connection = await AsyncConnection[DictRow].connect(
+                        conninfo,
+                        autocommit=True,
+                        row_factory=dict_row,
+                    )
+            row = await self._fetch(_TRY_ADVISORY_LOCK_SQL, (lock_key,))
+            if row is None:
+                await self._replace()
+                msg = "PostgreSQL advisory lease acquisition returned no result."
+                raise RuntimeError(msg)
+            if not row["acquired"]:
+                return None
+            self.leases[lock_key] = watch
+            return self.generation
+
+    async def unlock(self, lock_key: int, generation: int) -> None:
+        """Release a lock taken by ``generation`` of this session."""
+        async with self.guard:
+            if generation != self.generation:
+                # Closing the lost session already released the lock.
+                return
+            self.leases.pop(lock_key, None)
+            row = await self._fetch(_UNLOCK_ADVISORY_LOCK_SQL, (lock_key,))
+            if row is None or not row["released"]:
+                await self._replace()
+                msg = "PostgreSQL advisory lease could not be released."
+                raise RuntimeError(msg)
+
+    async def check(self) -> None:
+        """Run a health check, replacing the session when it fails."""
+        async with self.guard:
+            if self.connection is not None:
+                await self._fetch(_HEALTH_CHECK_SQL, ())
+
+    async def discard(self) -> None:
+        """Close the session, losing any locks it still holds."""
+        async with self.guard:
+            await self._replace()
+
+    async def _fetch(
+        self,
+        query: LiteralString,
+        parameters: tuple[int, ...],
+    ) -> DictRow | None:
+        if self.connection is None:
+            msg = "PostgreSQL lock session is not connected."
+            raise RuntimeError(msg)
+        try:
+            # A half-open connection never answers, so a statement that
+            # outlives the timeout is treated as a dead session.
+            with anyio.fail_after(self.timeout):
+                cursor = await self.connection.execute(query, parameters)
+                return await cursor.fetchone()
+        except BaseException:
+            await self._replace()
+            raise
+
+    async def _replace(self) -> None:
+        connection, self.connection = self.connection, None
+        if self.leases:
+            logger.error(
+                "postgres.graph_run_leases_lost",
+                extra={"lease_count": len(self.leases)},
+            )
+            for watch in self.leases.values():
+                watch.lose()
+            self.leases.clear()
+        self.generation += 1
+        if connection is not None and not connection.closed:
+            with CancelScope(shield=True):
+                await connection.close()
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresPoolSizes:
+    """
+    Connections of each PostgreSQL pool in one worker process.
+
+    ``coordination`` is zero when leases are multiplexed over ``lock``
+    dedicated sessions instead, and ``lock`` is zero otherwise.
+    """
+
+    checkpoint: int
+    coordination: int
+    lock: int = 0
+
+    @classmethod
+    def for_concurrency(
+        cls,
+        max_concurrent_runs: int,
+        *,
+        checkpoint_connections: int | None = None,
+        lock_connections: int | None = None,
+        max_pooled_leases: int = _MAX_POOLED_LEASES,
+    ) -> Self:
+        """
+        Size pools for ``max_concurrent_runs`` interrupt runs per worker.
+
+        A pooled lease holds its coordination connection for the whole run, so
+        the coordination pool has one connection per concurrent run. Above
+        ``max_pooled_leases`` runs, or with ``lock_connections``, leases are
+        multiplexed over ``lock_connections`` sessions (two by default) and no
+        coordination pool is sized. Checkpoint reads and writes happen only
+        between graph steps, so unless ``checkpoint_connections`` is given the
+        checkpoint pool has one connection per four runs, and at least two.
+        """
+        _require_positive("max_concurrent_runs", max_concurrent_runs)
+        _require_positive("max_pooled_leases", max_pooled_leases)
+        if checkpoint_connections is None:
+            checkpoint_connections = max(
+                _MIN_CHECKPOINT_CONNECTIONS,
+                math.ceil(max_concurrent_runs / _RUNS_PER_CHECKPOINT_CONNECTION),
+            )
+        _require_positive("checkpoint_connections", checkpoint_connections)
+        if lock_connections is None and max_concurrent_runs > max_pooled_leases:
+            lock_connections = _DEFAULT_LOCK_CONNECTIONS
+        if lock_connections is None:
+            return cls(
+                checkpoint=checkpoint_connections,
+                coordination=max_concurrent_runs,
+            )
+        _require_positive("lock_connections", lock_connections)
+        return cls(
+            checkpoint=checkpoint_connections,
+            coordination=0,
+            lock=lock_connections,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresPoolStats:
+    """Point-in-time usage of one PostgreSQL connection pool."""
+
+    size: int
+    max_size: int
+    in_use: int
+    waiting: int
+    requests: int
+    wait_seconds: float
+    checkout_timeouts: int
+    connections_lost: int
+
+    @classmethod
+    def from_pool(cls, pool: _PostgresPool) -> Self:
+        """
+        Read counters from ``psycopg_pool``.
+
+        Request, wait and timeout counters are cumulative since the pool
+        opened. ``checkout_timeouts`` counts checkouts that failed after the
+        pool's ``timeout`` or because its queue was full.
+        """
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        return cls(
+            size=size,
+            max_size=stats.get("pool_max", pool.max_size),
+            in_use=size - stats.get("pool_available", 0),
+            waiting=stats.get("requests_waiting", 0),
+            requests=stats.get("requests_num", 0),
+            wait_seconds=stats.get("requests_wait_ms", 0) / 1000,
+            checkout_timeouts=stats.get("requests_errors", 0),
+            connections_lost=stats.get("connections_lost", 0),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresRuntime:
+    """Checkpointer and run coordinator backed by separate PostgreSQL pools."""
+
+    checkpointer: PostgresCheckpointSaver
+    run_coordinator: PostgresRunCoordinator | MultiplexedPostgresRunCoordinator
+    checkpoint_pool: _PostgresPool
+    coordination_pool: _PostgresPool | None = None
+
+    def pool_stats(self) -> dict[str, PostgresPoolStats]:
+        """Return usage of every pool the runtime owns, keyed by its role."""
+        stats = {"checkpoint": PostgresPoolStats.from_pool(self.checkpoint_pool)}
+        if self.coordination_pool is not None:
+            stats["coordination"] = PostgresPoolStats.from_pool(self.coordination_pool)
+        return stats
+
+
+@asynccontextmanager
+async def postgres_runtime(  # ruff: ignore[too-many-arguments]
+    conninfo: str,
+    *,
+    max_concurrent_runs: int,
+    checkpoint_connections: int | None = None,
+    lock_connections: int | None = None,
+    max_pooled_leases: int = _MAX_POOLED_LEASES,
+    checkout_timeout: float = 30.0,
+) -> AsyncIterator[PostgresRuntime]:
+    """
+    Open ready pools for checkpoint I/O and run coordination in one process.
+
+    Pools are sized by ``PostgresPoolSizes.for_concurrency``. Leases take
+    connections from a coordination pool of their own, so long runs never
+    starve checkpoint writes. With ``lock_connections``, or more than
+    ``max_pooled_leases`` concurrent runs, leases are instead multiplexed over
+    dedicated sessions and no coordination pool is opened. Pooled leases read
+    checkpoint heads together with their lock. Checkouts wait at most
+    ``checkout_timeout`` seconds. Run ``setup_postgres_schema`` once before
+    workers open their runtimes.
+
+    Yields:
+        Configured PostgresRuntime.
+
+    """
+    sizes = PostgresPoolSizes.for_concurrency(
+        max_concurrent_runs,
+        checkpoint_connections=checkpoint_connections,
+        lock_connections=lock_connections,
+        max_pooled_leases=max_pooled_leases,
+    )
+    async with AsyncExitStack() as stack:
+        checkpoint_pool = await stack.enter_async_context(
+            _open_pool(conninfo, "lgos-checkpoint", sizes.checkpoint, checkout_timeout)
+        )
+        checkpointer = PostgresCheckpointSaver(checkpoint_pool)
+        coordination_pool: _PostgresPool | None = None
+        run_coordinator: PostgresRunCoordinator | MultiplexedPostgresRunCoordinator
+        if sizes.lock == 0:
+            coordination_pool = await stack.enter_async_context(
+                _open_pool(
+                    conninfo, "lgos-coordination", sizes.coordination, checkout_timeout
+                )
+            )
+            run_coordinator = PostgresRunCoordinator(
+                coordination_pool,
+                max_concurrent_leases=sizes.coordination,
+                checkpointer=checkpointer,
+            )
+        else:
+            run_coordinator = MultiplexedPostgresRunCoordinator(
+                conninfo,
+                lock_connections=sizes.lock,
+            )
+            stack.push_async_callback(run_coordinator.aclose)
+        await checkpoint_pool.wait(checkout_timeout)
+        if coordination_pool is not None:
+            await coordination_pool.wait(checkout_timeout)
+        logger.info(
+            "postgres.runtime_opened",
+            extra={
+                "checkpoint_connections": sizes.checkpoint,
+                "coordination_connections": sizes.coordination,
+                "lock_connections": sizes.lock,
+            },
+        )
+        yield PostgresRuntime(
+            checkpointer=checkpointer,
+            run_coordinator=run_coordinator,
+            checkpoint_pool=checkpoint_pool,
+            coordination_pool=coordination_pool,
+        )
+
+
+async def setup_postgres_schema(conninfo: str) -> None:
+    """Initialize or migrate the checkpoint schema once before workers start."""
+    async with PostgresCheckpointSaver.from_conn_string(conninfo) as checkpointer:
+        await checkpointer.setup()
+
+
+def _open_pool(
+    conninfo: str,
+    name: str,
+    max_size: int,
+    timeout: float,
+) -> _PostgresPool:
+    return cast(
+        "_PostgresPool",
+        AsyncConnectionPool(
+            conninfo=conninfo,
+            kwargs=_CONNECTION_KWARGS,
+            min_size=1,
+            max_size=max_size,
+            name=name,
+            timeout=timeout,
+            open=False,
+        ),
+    )
+
+
+def _require_positive(name: str, value: int) -> None:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        msg = f"{name} must be a positive integer"
+        raise ValueError(msg)
+
+
 def _advisory_lock_key(value: str) -> int:
     digest = sha256(value.encode("utf-8")).digest()
     return int.from_bytes(digest[:8], byteorder="big", signed=True)
@@ -105,6 +699,82 @@ async def _try_acquire_advisory_lock(
         raise
 
 
+async def _try_acquire_advisory_lock_with_heads(
+    connection: AsyncConnection[dict[str, Any]],
+    lock_key: int,
+    select_heads_sql: LiteralString,
+    thread_id: str,
+) -> tuple[bool, list[dict[str, Any]]]:
+    """Acquire one session lock and read checkpoint heads in one round trip."""
+    try:  # ruff: ignore[too-many-statements-in-try-clause]
+        # The heads statement starts after the lock statement has finished, so
+        # its snapshot includes every write committed under earlier leases.
+        async with connection.pipeline():
+            lock_cursor = await connection.execute(
+                _TRY_ADVISORY_LOCK_SQL,
+                (lock_key,),
+            )
+            heads_cursor = await connection.execute(
+                select_heads_sql,
+                {"thread_id": thread_id},
+                binary=True,
+            )
+        row = await lock_cursor.fetchone()
+        if row is None:
+            msg = "PostgreSQL advisory lease acquisition returned no result."
+            raise RuntimeError(msg)  # ruff: ignore[raise-within-try]
+        head_rows = await heads_cursor.fetchall()
+    except BaseException:
+        await _discard_connection(connection)
+        raise
+    return bool(row["acquired"]), head_rows
+
+
+def _checkpoint_heads_sql(checkpointer: AsyncPostgresSaver) -> LiteralString:
+    """Build the saver's checkpoint SELECT restricted to every namespace head."""
+    # SELECT_SQL is the saver's class constant, never request input.
+    select_sql = cast("LiteralString", checkpointer.SELECT_SQL)
+    return select_sql + _CHECKPOINT_HEADS_WHERE_SQL
+
+
+async def _load_checkpoint_heads(
+    checkpointer: AsyncPostgresSaver,
+    thread_id: str,
+    head_rows: list[dict[str, Any]],
+) -> CheckpointHeads | None:
+    """Decode head rows, or return ``None`` when the saver must read them."""
+    load_row = _checkpoint_row_loader(checkpointer)
+    if load_row is None or any(
+        row["checkpoint"]["v"] < _MIN_PREFETCH_CHECKPOINT_VERSION
+        and row["parent_checkpoint_id"]
+        for row in head_rows
+    ):
+        return None
+    return CheckpointHeads(
+        thread_id=thread_id,
+        tuples={row["checkpoint_ns"]: await load_row(row) for row in head_rows},
+    )
+
+
+def _checkpoint_row_loader(
+    checkpointer: AsyncPostgresSaver,
+) -> Callable[[dict[str, Any]], Awaitable[CheckpointTuple]] | None:
+    """Get the saver's ``SELECT_SQL`` row decoder, if this release is known."""
+    if _checkpoint_postgres_major_version() not in _ROW_LOADER_MAJOR_VERSIONS:
+        return None
+    return getattr(checkpointer, "_load_checkpoint_tuple", None)
+
+
+@cache
+def _checkpoint_postgres_major_version() -> int | None:
+    try:
+        release = version("langgraph-checkpoint-postgres")
+    except PackageNotFoundError:
+        return None
+    major = release.partition(".")[0]
+    return int(major) if major.isdigit() else None
+
+
 async def _release_advisory_lock(
     connection: AsyncConnection[dict[str, Any]],
     lock_key: int,
@@ -134,4 +804,13 @@ async def _discard_connection(
         await connection.close()
 
 
-__all__ = ["PostgresRunCoordinator"]
+__all__ = [
+    "MultiplexedPostgresRunCoordinator",
+    "PostgresCheckpointSaver",
+    "PostgresPoolSizes",
+    "PostgresPoolStats",
+    "PostgresRunCoordinator",
+    "PostgresRuntime",
+    "postgres_runtime",
+    "setup_postgres_schema",
+]
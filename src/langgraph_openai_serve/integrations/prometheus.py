@@ -0,0 +1,133 @@
+"""Prometheus collectors and exposition for the optional metrics integration."""
+
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from prometheus_client.exposition import choose_encoder
+from prometheus_client.multiprocess import MultiProcessCollector
+from starlette.requests import Request
+from starlette.responses import Response
+
+from langgraph_openai_serve.core.metrics import ServingMetrics
+
+# Token latencies are tens of milliseconds; first tokens and runs take seconds.
+_INTER_TOKEN_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+_CHUNK_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class PrometheusMetrics(ServingMetrics):
+    """
+    Record serving metrics in the default Prometheus registry.
+
+    Collectors are labelled by model. With ``PROMETHEUS_MULTIPROC_DIR`` set,
+    ``prometheus_client`` writes them to per-process files that ``metrics_endpoint``
+    aggregates across workers.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.requests = Counter(
+            "lgos_chat_completion_requests",
+            "Chat completion requests by response status code.",
+            ["model", "stream", "status_code"],
+        )
+        self.runs_in_flight = Gauge(
+            "lgos_graph_runs_in_flight",
+            "Chat completion requests whose graph runs are executing.",
+            ["model"],
+            multiprocess_mode="livesum",
+        )
+        self.run_duration = Histogram(
+            "lgos_graph_run_duration_seconds",
+            "Time a request's graph runs took, including streaming.",
+            ["model"],
+            buckets=_LATENCY_BUCKETS,
+        )
+        self.time_to_first_token = Histogram(
+            "lgos_time_to_first_token_seconds",
+            "Time from request arrival to a stream's first text.",
+            ["model"],
+            buckets=_LATENCY_BUCKETS,
+        )
+        self.inter_token_latency = Histogram(
+            "lgos_inter_token_latency_seconds",
+            "Gap between consecutive text chunks of a stream.",
+            ["model"],
+            buckets=_INTER_TOKEN_BUCKETS,
+        )
+        self.stream_chunks = Histogram(
+            "lgos_stream_chunks",
+            "Text chunks sent by completed streams.",
+            ["model"],
+            buckets=_CHUNK_BUCKETS,
+        )
+        self.stream_cancellations = Counter(
+            "lgos_stream_cancellations",
+            "Streams stopped before they finished.",
+            ["model"],
+        )
+        self.run_busy_rejections = Counter(
+            "lgos_run_busy_rejections",
+            "Requests rejected because their interrupt run was busy.",
+            ["model"],
+        )
+
+    def request_finished(self, model: str, *, stream: bool, status_code: int) -> None:
+        """Count a request by the status code its response started with."""
+        self.requests.labels(
+            model=model,
+            stream=str(stream).lower(),
+            status_code=str(status_code),
+        ).inc()
+
+    def run_started(self, model: str) -> None:
+        """Count a request whose graph runs are now executing."""
+        self.runs_in_flight.labels(model=model).inc()
+
+    def run_finished(self, model: str, seconds: float) -> None:
+        """Record how long a request's graph runs took, including its stream."""
+        self.runs_in_flight.labels(model=model).dec()
+        self.run_duration.labels(model=model).observe(seconds)
+
+    def first_token(self, model: str, seconds: float) -> None:
+        """Record the time from request arrival to a stream's first text."""
+        self.time_to_first_token.labels(model=model).observe(seconds)
+
+    def inter_token(self, model: str, seconds: float) -> None:
+        """Record the gap between two text chunks of a stream."""
+        self.inter_token_latency.labels(model=model).observe(seconds)
+
+    def stream_finished(self, model: str, chunks: int) -> None:
+        """Record how many text chunks a completed stream sent."""
+        self.stream_chunks.labels(model=model).observe(chunks)
+
+    def stream_cancelled(self, model: str) -> None:
+        """Count a stream stopped before it finished, usually by a disconnect."""
+        self.stream_cancellations.labels(model=model).inc()
+
+    def run_busy(self, model: str) -> None:
+        """Count a request rejected because its interrupt run was busy."""
+        self.run_busy_rejections.labels(model=model).inc()
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """
+    Expose the metrics of every worker in the format the scraper accepts.
+
+    It is synchronous because aggregating worker files reads from disk.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    encoder, content_type = choose_encoder(request.headers.get("accept", ""))
+    return Response(encoder(registry), headers={"Content-Type": content_type})
@@ -31,24 +31,36 @@ Examples:
 
 """
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI, Request
 from starlette.middleware import Middleware
-from starlette.routing import Mount
+from starlette.routing import Mount, Route
 
 from langgraph_openai_serve.api.chat import views as chat_views
 from langgraph_openai_serve.api.health import views as health_views
-from langgraph_openai_serve.api.middleware import RequestContextMiddleware
+from langgraph_openai_serve.api.middleware import (
+    RequestBodyLimitMiddleware,
+    RequestContextMiddleware,
+    RequestProfilingMiddleware,
+)
 from langgraph_openai_serve.api.models import views as models_views
+from langgraph_openai_serve.api.profiling import views as profiling_views
 from langgraph_openai_serve.core.errors import configure_openai_error_handlers
 from langgraph_openai_serve.core.logging import get_logger
+from langgraph_openai_serve.core.profiling import RequestProfiler
 from langgraph_openai_serve.core.settings import normalize_openai_api_prefix, settings
 from langgraph_openai_serve.core.version import get_version
 from langgraph_openai_serve.graph.graph_registry import GraphRegistry
+from langgraph_openai_serve.graph.lifecycle import GraphLifecycle, GraphWarmup
 
 logger = get_logger(__name__)
 
+METRICS_PATH = "/metrics"
+
 
 class LanggraphOpenaiServe:
     """
@@ -62,6 +74,8 @@ class LanggraphOpenaiServe:
         app: The host FastAPI application to mount the OpenAI API on.
         graph_registry: The populated GraphRegistry containing the graphs to serve.
         openai_app: The mounted OpenAI-compatible FastAPI application.
+        lifecycle: Graph startup and shutdown run inside the host app's lifespan.
+        profiler: The request profiler, when ``PROFILE_DIR`` enables it.
 
     """
 
@@ -70,6 +84,7 @@ class LanggraphOpenaiServe:
         graphs: GraphRegistry,
         app: FastAPI | None = None,
         checkpoint_scope: Callable[[Request], str | Awaitable[str]] | None = None,
+        warmup: GraphWarmup | None = None,
     ) -> None:
         """
         Initialize the server with a FastAPI app and a populated graph registry.
@@ -80,6 +95,9 @@ class LanggraphOpenaiServe:
             graphs: A GraphRegistry instance containing the graphs to serve.
             checkpoint_scope: Optional server-trusted resolver used to isolate
                 interrupt checkpoints by deployment or authenticated principal.
+            warmup: Optional policy for resolving every graph during host
+                startup, so the first request does not pay for graph
+                construction and validation.
 
         Raises:
             TypeError: If graphs is not a GraphRegistry instance.
@@ -97,6 +115,7 @@ class LanggraphOpenaiServe:
             )
         self.app: FastAPI = app
         self._openai_app: FastAPI | None = None
+        self.profiler: RequestProfiler | None = None
         self.checkpoint_scope = checkpoint_scope or (lambda _request: "default")
 
         self.graph_registry = graphs
@@ -106,11 +125,36 @@ class LanggraphOpenaiServe:
         self.app.state.graph_registry = self.graph_registry
         self.app.state.checkpoint_scope = self.checkpoint_scope
 
+        self.lifecycle = GraphLifecycle(self.graph_registry, warmup)
+        self._wrap_host_lifespan()
+
         logger.info(
             "server.initialized",
             extra={"graph_count": len(self.graph_registry.registry)},
         )
 
+    @property
+    def warmup_timings(self) -> Mapping[str, float]:
+        """Seconds spent starting each graph during the last host startup."""
+        return self.lifecycle.timings
+
+    def _wrap_host_lifespan(self) -> None:
+        host_lifespan = self.app.router.lifespan_context
+        lifecycle = self.lifecycle
+
+        # Graphs start inside the host lifespan because their factories and
+        # hooks may depend on resources the host opens, such as a database pool.
+        @asynccontextmanager
+        async def lifespan(app: Any) -> AsyncIterator[Any]:
+            async with host_lifespan(app) as state:
+                await lifecycle.startup()
+                try:
+                    yield state
+                finally:
+                    await lifecycle.shutdown()
+
+        self.app.router.lifespan_context = lifespan
+
     @property
     def openai_app(self) -> FastAPI:
         """The mounted OpenAI-compatible FastAPI application."""
@@ -148,16 +192,58 @@ class LanggraphOpenaiServe:
         openai_app.include_router(health_views.router)
         openai_app.include_router(models_views.router)
 
+        middleware = [Middleware(RequestContextMiddleware)]
+        if settings.PROFILE_DIR is not None:
+            middleware.append(self._request_profiling_middleware(settings.PROFILE_DIR))
+        if settings.MAX_REQUEST_BODY_BYTES is not None:
+            middleware.append(
+                Middleware(
+                    RequestBodyLimitMiddleware,
+                    max_body_bytes=settings.MAX_REQUEST_BODY_BYTES,
+                )
+            )
         self.app.router.routes.append(
             Mount(
                 prefix,
                 app=openai_app,
                 name="openai",
-                middleware=[Middleware(RequestContextMiddleware)],
+                middleware=middleware,
             )
         )
+        if settings.ENABLE_METRICS:
+            self._mount_metrics()
         self._openai_app = openai_app
 
         logger.info("server.api_bound", extra={"prefix": prefix})
 
         return self
+
+    def _request_profiling_middleware(self, directory: Path) -> Middleware:
+        self.profiler = RequestProfiler(
+            directory,
+            sample_rate=settings.PROFILE_SAMPLE_RATE,
+            threshold=settings.PROFILE_THRESHOLD,
+            interval=settings.PROFILE_INTERVAL,
+        )
+        if settings.PROFILE_ADMIN_TOKEN is not None:
+            # Operators arm the profiler on the host app, outside the OpenAI prefix.
+            self.app.state.request_profiler = self.profiler
+            self.app.state.profiler_admin_token = settings.PROFILE_ADMIN_TOKEN
+            self.app.include_router(profiling_views.router)
+        logger.info("server.profiler_enabled", extra={"directory": str(directory)})
+        return Middleware(RequestProfilingMiddleware, profiler=self.profiler)
+
+    def _mount_metrics(self) -> None:
+        # Scrapers read metrics from the host app, outside the OpenAI prefix.
+        from langgraph_openai_serve.integrations.prometheus import metrics_endpoint
+
+        self.app.router.routes.append(
+            Route(
+                METRICS_PATH,
+                metrics_endpoint,
+                methods=["GET"],
+                name="metrics",
+                include_in_schema=False,
+            )
+        )
+        logger.info("server.metrics_bound", extra={"path": METRICS_PATH})
@@ -1,4 +1,7 @@
-"""Shared fake streaming model helpers for demos and tests."""
+"""Shared fake streaming model helpers for demos, tests and benchmarks."""
+
+import asyncio
+from collections.abc import Callable
 
 from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.messages import HumanMessage
@@ -7,12 +10,23 @@ from langchain_core.messages import HumanMessage
 async def stream_fake_chat_response(
     response: str,
     prompt: str,
+    *,
+    chunk_delay: float = 0.0,
+    on_chunk: Callable[[int], None] | None = None,
 ) -> str:
-    """Stream a deterministic fake chat response and collect it for graph state."""
+    """
+    Stream a deterministic fake chat response and collect it for graph state.
+
+    The fake model streams words and whitespace as separate chunks. A
+    ``chunk_delay`` paces them like a remote model, and ``on_chunk`` is called
+    with each chunk's index once it has been streamed.
+    """
     model = GenericFakeChatModel(messages=iter([response]))
-    return "".join(
-        [
-            str(chunk.content)
-            async for chunk in model.astream([HumanMessage(content=prompt)])
-        ]
-    )
+    parts = []
+    async for chunk in model.astream([HumanMessage(content=prompt)]):
+        if on_chunk is not None:
+            on_chunk(len(parts))
+        parts.append(str(chunk.content))
+        if chunk_delay:
+            await asyncio.sleep(chunk_delay)
+    return "".join(parts)
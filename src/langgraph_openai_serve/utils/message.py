@@ -1,4 +1,8 @@
+import hashlib
 import json
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, cast
 
 from langchain_core.exceptions import OutputParserException
@@ -15,8 +19,13 @@ from langchain_core.output_parsers.openai_tools import (
     make_invalid_tool_call,
     parse_tool_call,
 )
+from pydantic_core import to_json
 
 from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequestMessage, Role
+from langgraph_openai_serve.core.settings import settings
+
+# Copies bypass the models' own __setattr__, like pydantic's model copies.
+_object_setattr = object.__setattr__
 
 
 class InvalidChatMessageError(ValueError):
@@ -122,3 +131,177 @@ def _assistant_message(message: ChatCompletionRequestMessage) -> AIMessage:
         tool_calls=tool_calls,
         invalid_tool_calls=invalid_tool_calls,
     )
+
+
+@dataclass(frozen=True)
+class MessagePrefixCacheStats:
+    """Counters of a ``MessagePrefixCache`` since it was created or cleared."""
+
+    hits: int
+    misses: int
+    reused_messages: int
+    converted_messages: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of conversions that reused a cached prefix."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _CachedConversation:
+    messages: tuple[BaseMessage, ...]
+    size_bytes: int
+
+
+class MessagePrefixCache:
+    """
+    Reuse converted LangChain messages across turns of the same conversation.
+
+    Clients resend the whole history every turn. Each converted request is kept
+    under a rolling hash of its messages, so the next turn converts only the
+    messages appended after the longest cached prefix. Entries are evicted least
+    recently used first once their messages exceed ``max_bytes`` of request
+    JSON. Callers always receive copies, so graphs that mutate their input
+    messages cannot change the cache. A ``max_bytes`` of 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, _CachedConversation] = OrderedDict()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._size_bytes = 0
+        self._hits = self._misses = self._evictions = 0
+        self._reused_messages = self._converted_messages = 0
+
+    def stats(self) -> MessagePrefixCacheStats:
+        """Return the current counters."""
+        return MessagePrefixCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            reused_messages=self._reused_messages,
+            converted_messages=self._converted_messages,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    def convert(
+        self,
+        messages: Sequence[ChatCompletionRequestMessage],
+    ) -> list[BaseMessage]:
+        """Convert messages like ``convert_to_lc_messages``, reusing a cached prefix."""
+        if self.max_bytes <= 0 or not messages:
+            return convert_to_lc_messages(list(messages))
+
+        digests, sizes = _prefix_digests(messages)
+        start, cached = self._longest_cached_prefix(digests)
+        converted = convert_to_lc_messages(list(messages[start:]))
+
+        if cached is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._reused_messages += start
+        self._converted_messages += len(converted)
+
+        reused = cached.messages if cached is not None else ()
+        if converted:
+            self._store(
+                digests[-1],
+                _CachedConversation(
+                    (*reused, *(_copy_message(m) for m in converted)),
+                    sizes[-1],
+                ),
+            )
+        return [*(_copy_message(m) for m in reused), *converted]
+
+    def _longest_cached_prefix(
+        self,
+        digests: list[bytes],
+    ) -> tuple[int, _CachedConversation | None]:
+        for length in range(len(digests), 0, -1):
+            cached = self._entries.get(digests[length - 1])
+            if cached is not None:
+                self._entries.move_to_end(digests[length - 1])
+                return length, cached
+        return 0, None
+
+    def _store(self, digest: bytes, entry: _CachedConversation) -> None:
+        if entry.size_bytes > self.max_bytes:
+            return
+        previous = self._entries.pop(digest, None)
+        if previous is not None:
+            self._size_bytes -= previous.size_bytes
+        self._entries[digest] = entry
+        self._size_bytes += entry.size_bytes
+        while self._size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= evicted.size_bytes
+            self._evictions += 1
+
+
+def _prefix_digests(
+    messages: Sequence[ChatCompletionRequestMessage],
+) -> tuple[list[bytes], list[int]]:
+    """Return the rolling digest and cumulative JSON size of every prefix."""
+    rolling = hashlib.blake2b(digest_size=16)
+    digests: list[bytes] = []
+    sizes: list[int] = []
+    size = 0
+    for message in messages:
+        # Serialized messages are self-delimiting JSON objects.
+        payload = to_json(message)
+        rolling.update(payload)
+        size += len(payload)
+        digests.append(rolling.copy().digest())
+        sizes.append(size)
+    return digests, sizes
+
+
+def _copy_message(message: BaseMessage) -> BaseMessage:
+    # Converted messages hold only JSON-like values. Copying them field by field
+    # is several times cheaper than a model deep copy, which is slower than
+    # converting the message again.
+    cls = message.__class__
+    copied = cls.__new__(cls)
+    extra = message.__pydantic_extra__
+    private = message.__pydantic_private__
+    _object_setattr(
+        copied,
+        "__dict__",
+        {name: _copy_json_value(value) for name, value in message.__dict__.items()},
+    )
+    _object_setattr(
+        copied, "__pydantic_fields_set__", set(message.__pydantic_fields_set__)
+    )
+    _object_setattr(
+        copied,
+        "__pydantic_extra__",
+        _copy_json_value(extra) if extra is not None else None,
+    )
+    _object_setattr(
+        copied,
+        "__pydantic_private__",
+        dict(private) if private is not None else None,
+    )
+    return copied
+
+
+def _copy_json_value(value: Any) -> Any:
+    if value.__class__ is dict:
+        return {key: _copy_json_value(item) for key, item in value.items()}
+    if value.__class__ is list:
+        return [_copy_json_value(item) for item in value]
+    return value
+
+
+message_prefix_cache = MessagePrefixCache(settings.MESSAGE_CACHE_MAX_BYTES)
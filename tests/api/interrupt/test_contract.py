@@ -3,18 +3,20 @@ from http import HTTPStatus
 
 import pytest
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
-from openai import APIError, AsyncOpenAI, InternalServerError
+from openai import APIError, AsyncOpenAI, BadRequestError, InternalServerError
 
 from tests.graph.support.interrupt import DEFAULT_INTERRUPT_PAYLOAD
 
 from .support import (
     INVALID_PAYLOAD_MODEL,
+    MODEL,
     NESTED_MODEL,
     PARALLEL_MODEL,
     assert_checkpoint_deleted,
     assert_interrupt_arguments,
     create_completion,
     resume_interrupt,
+    resume_messages,
 )
 
 EXPECTED_PARALLEL_INTERRUPTS = 2
@@ -35,6 +37,19 @@ async def test_non_streaming_interrupt_matches_contract_and_resumes(
     assert final_response.choices[0].message.content == "resumed:approve"
 
 
+async def test_interrupt_graph_rejects_multiple_choices(
+    openai_client: AsyncOpenAI,
+) -> None:
+    with pytest.raises(BadRequestError) as exc_info:
+        await openai_client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": "Approve?"}],
+            n=2,
+        )
+
+    assert exc_info.value.response.json()["error"]["param"] == "n"
+
+
 async def test_id_mapped_json_null_is_a_valid_resume_value(
     openai_client: AsyncOpenAI,
 ) -> None:
@@ -157,3 +172,25 @@ async def test_parallel_nested_interrupts_resume_as_one_tool_call_batch(
     assert final_response.choices[0].message.content == (
         "nested-a:first,nested-b:second"
     )
+
+
+async def test_resumed_interrupt_reports_state_phases(
+    openai_client: AsyncOpenAI,
+) -> None:
+    response = await create_completion(openai_client)
+
+    resumed = await openai_client.chat.completions.with_raw_response.create(
+        model=MODEL,
+        messages=resume_messages(response, ["approve"]),
+    )
+
+    phases = {
+        metric.split(";")[0] for metric in resumed.headers["server-timing"].split(", ")
+    }
+    assert {
+        "lease",
+        "aget_state",
+        "checkpoint_state_token",
+        "execution",
+        "checkpoint_delete",
+    } <= phases
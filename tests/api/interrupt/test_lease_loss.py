@@ -0,0 +1,153 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, START, StateGraph
+from openai import APIError, AsyncOpenAI, InternalServerError
+
+from langgraph_openai_serve import (
+    GraphConfig,
+    GraphFeature,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+)
+from langgraph_openai_serve.graph.interrupt import (
+    InMemoryRunCoordinator,
+    RunLeaseWatch,
+)
+from tests.graph.support.interrupt import InterruptAnswerState
+
+MODEL = "lease-loss"
+
+
+class WatchedRunCoordinator(InMemoryRunCoordinator):
+    """In-memory coordinator whose leases the test can lose."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.watches: dict[str, RunLeaseWatch] = {}
+
+    @asynccontextmanager
+    async def __call__(self, key: str, /) -> AsyncIterator[None]:
+        async with super().__call__(key):
+            self.watches[key] = RunLeaseWatch(key)
+            try:
+                yield
+            finally:
+                del self.watches[key]
+
+    def lease_watch(self, key: str, /) -> RunLeaseWatch | None:
+        return self.watches.get(key)
+
+
+@pytest.fixture
+def coordinator() -> WatchedRunCoordinator:
+    return WatchedRunCoordinator()
+
+
+@pytest.fixture
+def started() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+def fastapi_app(
+    sqlite_checkpointer: AsyncSqliteSaver,
+    coordinator: WatchedRunCoordinator,
+    started: asyncio.Event,
+) -> FastAPI:
+    async def work(_state: InterruptAnswerState) -> dict[str, list[str]]:
+        started.set()
+        await asyncio.Event().wait()
+        return {"answers": ["never"]}
+
+    graph = (
+        StateGraph(InterruptAnswerState)
+        .add_node("work", work)
+        .add_edge(START, "work")
+        .add_edge("work", END)
+        .compile(checkpointer=sqlite_checkpointer)
+    )
+
+    def empty_answers(_request: Any, _messages: Any) -> dict[str, list[str]]:
+        return {"answers": []}
+
+    registry = GraphRegistry(
+        registry={
+            MODEL: GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                features={GraphFeature.INTERRUPTS},
+                run_coordinator=coordinator,
+                request_to_input=empty_answers,
+            ),
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+async def lose_leases_once_started(
+    coordinator: WatchedRunCoordinator,
+    started: asyncio.Event,
+) -> None:
+    await asyncio.wait_for(started.wait(), timeout=2)
+    (watch,) = coordinator.watches.values()
+    watch.lose()
+
+
+async def test_lost_lease_cancels_the_run_and_keeps_its_checkpoints(
+    openai_client: AsyncOpenAI,
+    sqlite_checkpointer: AsyncSqliteSaver,
+    coordinator: WatchedRunCoordinator,
+    started: asyncio.Event,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    deleted: list[str] = []
+
+    async def record_delete(thread_id: str) -> None:
+        deleted.append(thread_id)
+
+    # Another process may own the thread once the lease is lost.
+    monkeypatch.setattr(sqlite_checkpointer, "adelete_thread", record_delete)
+    request = asyncio.create_task(
+        openai_client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": "Hi"}],
+        )
+    )
+    await lose_leases_once_started(coordinator, started)
+
+    with pytest.raises(InternalServerError) as exc_info:
+        await asyncio.wait_for(request, timeout=2)
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert exc_info.value.code == "run_lease_lost"
+    assert coordinator.watches == {}
+    assert deleted == []
+
+
+async def test_lost_lease_ends_a_streaming_run(
+    openai_client: AsyncOpenAI,
+    coordinator: WatchedRunCoordinator,
+    started: asyncio.Event,
+) -> None:
+    async def consume() -> None:
+        stream = await openai_client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": "Hi"}],
+            stream=True,
+        )
+        async for _chunk in stream:
+            pass
+
+    request = asyncio.create_task(consume())
+    await lose_leases_once_started(coordinator, started)
+
+    with pytest.raises(APIError, match="Internal server error"):
+        await asyncio.wait_for(request, timeout=2)
+    assert coordinator.watches == {}
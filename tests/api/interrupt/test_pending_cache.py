@@ -0,0 +1,157 @@
+import json
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from openai import AsyncOpenAI, ConflictError
+
+from langgraph_openai_serve.graph.interrupt import state as interrupt_state
+from langgraph_openai_serve.graph.interrupt.cache import PendingInterruptCache
+from langgraph_openai_serve.graph.interrupt.state import checkpoint_key
+
+from .support import (
+    MODEL,
+    SEQUENTIAL_MODEL,
+    assert_interrupt_arguments,
+    create_completion,
+    resume_interrupt,
+    resume_messages,
+)
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> PendingInterruptCache:
+    cache = PendingInterruptCache(max_entries=16)
+    monkeypatch.setattr(interrupt_state, "pending_interrupt_cache", cache)
+    return cache
+
+
+@pytest.fixture
+async def graph_states(
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[str]:
+    """Record which models load subgraph state after the fixture is used."""
+    reads: list[str] = []
+    for model in (MODEL, SEQUENTIAL_MODEL):
+        graph = await fastapi_app.state.graph_registry.get_graph(model).resolve_graph()
+        read_state = graph.aget_state
+
+        async def record_read(*args, _model=model, _read=read_state, **kwargs):
+            reads.append(_model)
+            return await _read(*args, **kwargs)
+
+        monkeypatch.setattr(graph, "aget_state", record_read)
+    return reads
+
+
+async def test_reemit_is_served_from_the_cached_batch(
+    openai_client: AsyncOpenAI,
+    cache: PendingInterruptCache,
+    graph_states: list[str],
+) -> None:
+    run_id = str(uuid.uuid4())
+    first_response = await create_completion(openai_client, run_id=run_id)
+    graph_states.clear()
+
+    recovered_response = await create_completion(openai_client, run_id=run_id)
+
+    assert graph_states == []
+    assert cache.stats().hits == 1
+    assert [
+        call.model_dump(mode="json")
+        for call in recovered_response.choices[0].message.tool_calls or []
+    ] == [
+        call.model_dump(mode="json")
+        for call in first_response.choices[0].message.tool_calls or []
+    ]
+
+
+async def test_stale_resume_is_rejected_from_the_cached_batch(
+    openai_client: AsyncOpenAI,
+    cache: PendingInterruptCache,
+    graph_states: list[str],
+) -> None:
+    first_response = await create_completion(openai_client)
+    messages = resume_messages(first_response, ["approve"])
+    assistant_call = messages[0]["tool_calls"][0]
+    arguments = json.loads(assistant_call["function"]["arguments"])
+    arguments["state_token"] = "stale-state-token"
+    assistant_call["function"]["arguments"] = json.dumps(arguments)
+    graph_states.clear()
+
+    with pytest.raises(ConflictError):
+        await openai_client.chat.completions.create(model=MODEL, messages=messages)
+
+    assert graph_states == []
+    assert cache.stats().entries == 1
+
+
+async def test_resume_and_deletion_invalidate_the_cached_batch(
+    openai_client: AsyncOpenAI,
+    cache: PendingInterruptCache,
+) -> None:
+    first_pause = await create_completion(openai_client, model=SEQUENTIAL_MODEL)
+    run_id = assert_interrupt_arguments(first_pause.choices[0].message.tool_calls[0])[
+        "run_id"
+    ]
+    thread_id = checkpoint_key(SEQUENTIAL_MODEL, run_id)
+    first_batch = cache.get(thread_id)
+
+    second_pause = await resume_interrupt(
+        openai_client,
+        first_pause,
+        "one",
+        model=SEQUENTIAL_MODEL,
+    )
+    second_batch = cache.get(thread_id)
+
+    assert first_batch is not None
+    assert second_batch is not None
+    assert second_batch.state_token != first_batch.state_token
+
+    await resume_interrupt(openai_client, second_pause, "two", model=SEQUENTIAL_MODEL)
+
+    assert cache.get(thread_id) is None
+
+
+async def test_batch_advanced_elsewhere_is_not_served(
+    openai_client: AsyncOpenAI,
+    cache: PendingInterruptCache,
+) -> None:
+    first_pause = await create_completion(openai_client, model=SEQUENTIAL_MODEL)
+    run_id = assert_interrupt_arguments(first_pause.choices[0].message.tool_calls[0])[
+        "run_id"
+    ]
+    thread_id = checkpoint_key(SEQUENTIAL_MODEL, run_id)
+    first_batch = cache.get(thread_id)
+    assert first_batch is not None
+    second_pause = await resume_interrupt(
+        openai_client,
+        first_pause,
+        "one",
+        model=SEQUENTIAL_MODEL,
+    )
+    # Another worker's process would still hold the first batch.
+    cache.put(thread_id, first_batch)
+
+    recovered = await create_completion(
+        openai_client,
+        model=SEQUENTIAL_MODEL,
+        run_id=run_id,
+    )
+
+    assert [
+        call.model_dump(mode="json")
+        for call in recovered.choices[0].message.tool_calls or []
+    ] == [
+        call.model_dump(mode="json")
+        for call in second_pause.choices[0].message.tool_calls or []
+    ]
+    with pytest.raises(ConflictError):
+        await resume_interrupt(
+            openai_client,
+            first_pause,
+            "one",
+            model=SEQUENTIAL_MODEL,
+        )
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.graph import StateGraph
+from starlette import status
+
+from langgraph_openai_serve import (
+    AdmissionPolicy,
+    GraphConfig,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+)
+from tests.graph.support.schemas import MessageState
+
+MESSAGES = [{"role": "user", "content": "Expensive question?"}]
+
+
+class Gate:
+    def __init__(self) -> None:
+        self.prepared = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+
+@pytest.fixture
+def gate() -> Gate:
+    return Gate()
+
+
+@pytest.fixture
+def fastapi_app(gate: Gate) -> FastAPI:
+    model = FakeListChatModel(responses=["answer"])
+
+    async def generate(state: MessageState):
+        gate.started.set()
+        await gate.release.wait()
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    def request_to_input(_request, messages):
+        gate.prepared += 1
+        return {"messages": messages}
+
+    graph = (
+        StateGraph(MessageState)
+        .add_node("generate", generate)
+        .set_entry_point("generate")
+        .set_finish_point("generate")
+        .compile()
+    )
+    registry = GraphRegistry(
+        registry={
+            "limited": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+                request_to_input=request_to_input,
+                admission=AdmissionPolicy(max_concurrent=1),
+            ),
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+async def post(client: AsyncClient, **kwargs):
+    return await client.post(
+        "/v1/chat/completions",
+        json={"model": "limited", "messages": MESSAGES, **kwargs},
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+async def test_request_over_the_limit_is_shed_with_429(
+    client: AsyncClient,
+    gate: Gate,
+    *,
+    stream: bool,
+) -> None:
+    running = asyncio.create_task(post(client, stream=stream))
+    await asyncio.wait_for(gate.started.wait(), timeout=2)
+
+    shed = await post(client)
+
+    assert shed.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert shed.headers["Retry-After"] == "1"
+    assert shed.json()["error"] == {
+        "message": "The model is overloaded; retry the request later.",
+        "type": "requests",
+        "param": None,
+        "code": "rate_limit_exceeded",
+    }
+    # Shed requests are rejected before their graph input is prepared.
+    assert gate.prepared == 1
+
+    gate.release.set()
+    assert (await running).status_code == status.HTTP_200_OK
+    assert (await post(client)).status_code == status.HTTP_200_OK
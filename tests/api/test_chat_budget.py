@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.graph import END, StateGraph
+from openai import AsyncOpenAI
+from starlette import status
+
+from langgraph_openai_serve import (
+    ExecutionBudget,
+    GraphConfig,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+)
+from langgraph_openai_serve.core.settings import Settings
+from langgraph_openai_serve.graph import budget as budget_module
+from tests.graph.support.schemas import MessageState
+
+ANSWER = "Partial answer"
+MESSAGES = [{"role": "user", "content": "Think forever?"}]
+
+
+@pytest.fixture
+def fastapi_app() -> FastAPI:
+    model = FakeListChatModel(responses=[ANSWER])
+
+    async def generate(state: MessageState):
+        message = await model.ainvoke(state["messages"])
+        await asyncio.sleep(1)
+        return {"messages": [message]}
+
+    def loop(state: MessageState):
+        return {"messages": [("ai", f"Step {len(state['messages'])}")]}
+
+    slow = (
+        StateGraph(MessageState)
+        .add_node("generate", generate)
+        .set_entry_point("generate")
+        .set_finish_point("generate")
+        .compile()
+    )
+    runaway = (
+        StateGraph(MessageState)
+        .add_node("loop", loop)
+        .set_entry_point("loop")
+        .add_conditional_edges("loop", lambda _state: "loop", ["loop", END])
+        .compile()
+    )
+    registry = GraphRegistry(
+        registry={
+            "slow": GraphConfig(
+                graph=slow,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+                execution_budget=ExecutionBudget(timeout=0.1),
+            ),
+            "unbounded": GraphConfig(
+                graph=slow,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+            ),
+            "runaway": GraphConfig(
+                graph=runaway,
+                description="DUMMY",
+                execution_budget=ExecutionBudget(recursion_limit=5),
+            ),
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+async def post(client: AsyncClient, model: str, **kwargs):
+    headers = kwargs.pop("headers", None)
+    return await client.post(
+        "/v1/chat/completions",
+        json={"model": model, "messages": MESSAGES, **kwargs},
+        headers=headers,
+    )
+
+
+def assert_budget_error(
+    response,
+    code: str,
+    *,
+    status_code: int = status.HTTP_400_BAD_REQUEST,
+    error_type: str = "invalid_request_error",
+) -> None:
+    assert response.status_code == status_code
+    error = response.json()["error"]
+    assert (error["type"], error["code"]) == (error_type, code)
+
+
+async def test_run_past_its_graph_deadline_is_a_gateway_timeout(
+    client: AsyncClient,
+) -> None:
+    assert_budget_error(
+        await post(client, "slow"),
+        "deadline_exceeded",
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        error_type="server_error",
+    )
+
+
+async def test_streamed_run_past_its_deadline_finishes_with_length(
+    openai_client: AsyncOpenAI,
+) -> None:
+    stream = await openai_client.chat.completions.create(
+        model="slow",
+        messages=MESSAGES,
+        stream=True,
+    )
+    chunks = [chunk async for chunk in stream]
+
+    assert "".join(chunk.choices[0].delta.content or "" for chunk in chunks) == ANSWER
+    assert chunks[-1].choices[0].finish_reason == "length"
+
+
+async def test_client_deadline_overrides_the_graph_default(
+    client: AsyncClient,
+) -> None:
+    response = await post(client, "unbounded", headers={"X-Request-Timeout": "0.1"})
+    assert_budget_error(response, "deadline_exceeded")
+
+    response = await post(client, "slow", metadata={"langgraph_timeout": "5"})
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_server_maximum_caps_the_client_deadline(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(budget_module, "settings", Settings(MAX_REQUEST_TIMEOUT=0.1))
+
+    response = await post(client, "unbounded", metadata={"langgraph_timeout": "60"})
+
+    assert_budget_error(
+        response,
+        "deadline_exceeded",
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        error_type="server_error",
+    )
+
+
+async def test_runaway_loop_stops_at_its_recursion_limit(
+    client: AsyncClient,
+) -> None:
+    assert_budget_error(
+        await post(client, "runaway"),
+        "recursion_limit_exceeded",
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        error_type="server_error",
+    )
+
+    stream = await post(client, "runaway", stream=True)
+    assert '"finish_reason":"length"' in stream.text.replace(" ", "")
+
+
+@pytest.mark.parametrize(
+    ("model", "kwargs", "code", "status_code", "error_type"),
+    [
+        pytest.param(
+            "slow",
+            {},
+            "deadline_exceeded",
+            status.HTTP_504_GATEWAY_TIMEOUT,
+            "server_error",
+            id="graph-deadline",
+        ),
+        pytest.param(
+            "runaway",
+            {},
+            "recursion_limit_exceeded",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "server_error",
+            id="graph-recursion-limit",
+        ),
+        pytest.param(
+            "unbounded",
+            {"headers": {"X-Request-Timeout": "0.1"}},
+            "deadline_exceeded",
+            status.HTTP_400_BAD_REQUEST,
+            "invalid_request_error",
+            id="client-deadline",
+        ),
+    ],
+)
+async def test_every_choice_past_its_budget_maps_like_one(  # ruff: ignore[too-many-arguments, too-many-positional-arguments]
+    client: AsyncClient,
+    model: str,
+    kwargs: dict[str, dict[str, str]],
+    code: str,
+    status_code: int,
+    error_type: str,
+) -> None:
+    response = await post(client, model, n=2, **kwargs)
+
+    assert_budget_error(response, code, status_code=status_code, error_type=error_type)
+
+
+async def test_client_recursion_limit_is_a_client_error(
+    client: AsyncClient,
+) -> None:
+    response = await post(
+        client,
+        "runaway",
+        metadata={"langgraph_recursion_limit": "3"},
+    )
+
+    assert_budget_error(response, "recursion_limit_exceeded")
+
+
+@pytest.mark.parametrize(
+    ("metadata", "headers", "param"),
+    [
+        ({"langgraph_timeout": "0"}, None, "metadata.langgraph_timeout"),
+        ({"langgraph_timeout": "nan"}, None, "metadata.langgraph_timeout"),
+        (
+            {"langgraph_recursion_limit": "-1"},
+            None,
+            "metadata.langgraph_recursion_limit",
+        ),
+        (None, {"X-Request-Timeout": "soon"}, None),
+    ],
+)
+async def test_invalid_budget_override_is_rejected(
+    client: AsyncClient,
+    metadata: dict[str, str] | None,
+    headers: dict[str, str] | None,
+    param: str | None,
+) -> None:
+    response = await post(client, "slow", metadata=metadata, headers=headers)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["error"]["param"] == param
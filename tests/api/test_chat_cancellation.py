@@ -250,7 +250,7 @@ async def test_immediate_stream_close_releases_prepared_run() -> None:
     )
     owner = _StreamOwner()
 
-    owner.start(source(), run)
+    owner.start(source(), [run], model="test")
     await owner.aclose()
 
     assert not source_started
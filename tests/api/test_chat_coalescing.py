@@ -0,0 +1,154 @@
+import pytest
+from anyio import sleep
+from openai import AsyncOpenAI, BadRequestError
+
+from langgraph_openai_serve.api.chat.utils.coalescing import (
+    STREAM_COALESCE_METADATA_KEY,
+    InvalidStreamCoalescingError,
+    coalesce_text_events,
+    requested_stream_coalescing,
+)
+from langgraph_openai_serve.graph.graph_registry import StreamCoalescing
+
+STATUS_EVENT = {"type": "custom", "ns": (), "data": {"type": "status"}}
+PAUSE = "pause"
+
+
+async def coalesced(events, coalescing=None):
+    async def source():
+        for event in events:
+            if event == PAUSE:
+                await sleep(0.05)
+            else:
+                yield event
+
+    return [
+        event
+        async for event in coalesce_text_events(
+            source(),
+            coalescing or StreamCoalescing(window=1),
+        )
+    ]
+
+
+async def test_first_delta_is_sent_and_ready_deltas_are_merged() -> None:
+    events = [(0, "h"), (0, "e"), (0, "l"), (0, "l"), (0, "o"), (0, None)]
+
+    assert await coalesced(events) == [(0, "h"), (0, "ello"), (0, None)]
+
+
+async def test_custom_events_flush_held_text_in_order() -> None:
+    events = [(0, "a"), (0, "b"), (0, STATUS_EVENT), (0, "c"), (0, "d"), (0, None)]
+
+    assert await coalesced(events) == [
+        (0, "a"),
+        (0, "b"),
+        (0, STATUS_EVENT),
+        (0, "cd"),
+        (0, None),
+    ]
+
+
+async def test_idle_source_flushes_held_text() -> None:
+    events = [(0, "a"), (0, "b"), (0, "c"), PAUSE, (0, "d"), (0, None)]
+
+    assert await coalesced(events) == [(0, "a"), (0, "bc"), (0, "d"), (0, None)]
+
+
+async def test_byte_budget_flushes_each_choice_separately() -> None:
+    events = [(0, "a"), (1, "x"), (0, "é"), (1, "y"), (0, "b"), (0, None), (1, None)]
+
+    assert await coalesced(events, StreamCoalescing(window=1, max_bytes=2)) == [
+        (0, "a"),
+        (1, "x"),
+        (0, "é"),
+        (1, "y"),
+        (0, "b"),
+        (0, None),
+        (1, None),
+    ]
+
+
+async def test_source_error_is_raised_after_held_text() -> None:
+    async def source():
+        yield 0, "a"
+        yield 0, "b"
+        msg = "graph failed"
+        raise RuntimeError(msg)
+
+    events = coalesce_text_events(source(), StreamCoalescing())
+
+    assert await anext(events) == (0, "a")
+    assert await anext(events) == (0, "b")
+    with pytest.raises(RuntimeError, match="graph failed"):
+        await anext(events)
+
+
+@pytest.mark.parametrize(
+    ("metadata", "default", "expected"),
+    [
+        (None, None, None),
+        (None, StreamCoalescing(), StreamCoalescing()),
+        ({STREAM_COALESCE_METADATA_KEY: "off"}, StreamCoalescing(), None),
+        (
+            {STREAM_COALESCE_METADATA_KEY: "20"},
+            None,
+            StreamCoalescing(window=0.02),
+        ),
+        (
+            {STREAM_COALESCE_METADATA_KEY: "20"},
+            StreamCoalescing(max_bytes=64),
+            StreamCoalescing(window=0.02, max_bytes=64),
+        ),
+    ],
+)
+def test_request_metadata_overrides_graph_coalescing(
+    metadata, default, expected
+) -> None:
+    assert requested_stream_coalescing(metadata, default) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "1001", "-5", "2.5", "on", "٣"])
+def test_invalid_request_coalescing_is_rejected(value: str) -> None:
+    with pytest.raises(InvalidStreamCoalescingError):
+        requested_stream_coalescing({STREAM_COALESCE_METADATA_KEY: value}, None)
+
+
+async def test_streaming_completion_coalesces_on_request(
+    openai_client: AsyncOpenAI,
+) -> None:
+    stream = await openai_client.chat.completions.create(
+        model="test",
+        messages=[{"role": "user", "content": "Hi"}],
+        stream=True,
+        metadata={STREAM_COALESCE_METADATA_KEY: "1000"},
+    )
+
+    chunks = [chunk async for chunk in stream]
+
+    content_deltas = [
+        chunk.choices[0].delta.content
+        for chunk in chunks
+        if chunk.choices[0].delta.content
+    ]
+    assert content_deltas[0] == "h"
+    assert "".join(content_deltas) == "hello"
+    assert len(content_deltas) < len("hello")
+    assert chunks[-1].choices[0].finish_reason == "stop"
+
+
+async def test_invalid_request_coalescing_is_a_bad_request(
+    openai_client: AsyncOpenAI,
+) -> None:
+    with pytest.raises(BadRequestError) as exc_info:
+        await openai_client.chat.completions.create(
+            model="test",
+            messages=[{"role": "user", "content": "Hi"}],
+            stream=True,
+            metadata={STREAM_COALESCE_METADATA_KEY: "soon"},
+        )
+
+    assert (
+        exc_info.value.response.json()["error"]["param"]
+        == f"metadata.{STREAM_COALESCE_METADATA_KEY}"
+    )
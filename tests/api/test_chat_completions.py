@@ -12,6 +12,8 @@ from langgraph_openai_serve.api.chat.schemas import (
     ChatCompletionStreamResponseDelta,
     Role,
 )
+from langgraph_openai_serve.graph import utils as graph_utils
+from langgraph_openai_serve.utils.message import MessagePrefixCache
 
 
 def test_chat_completion_schema_excludes_legacy_function_fields() -> None:
@@ -145,3 +147,84 @@ async def test_unknown_model_raises_openai_bad_request(
             "code": None,
         }
     }
+
+
+async def test_non_streaming_completion_returns_n_choices(
+    openai_client: AsyncOpenAI,
+) -> None:
+    response = await openai_client.chat.completions.create(
+        model="test",
+        messages=[{"role": "user", "content": "Hi"}],
+        n=3,
+    )
+
+    assert [choice.index for choice in response.choices] == [0, 1, 2]
+    assert {choice.message.content for choice in response.choices} == {"hello"}
+    usage = response.usage
+    assert usage is not None
+    assert usage.prompt_tokens == 1
+    assert usage.completion_tokens == len(response.choices)
+
+
+async def test_streaming_completion_interleaves_n_choices(
+    openai_client: AsyncOpenAI,
+) -> None:
+    stream = await openai_client.chat.completions.create(
+        model="test",
+        messages=[{"role": "user", "content": "Hi"}],
+        stream=True,
+        n=2,
+    )
+
+    chunks = [chunk async for chunk in stream]
+
+    content: dict[int, str] = {}
+    finish_reasons: dict[int, str | None] = {}
+    for chunk in chunks:
+        choice = chunk.choices[0]
+        content[choice.index] = content.get(choice.index, "") + (
+            choice.delta.content or ""
+        )
+        if choice.finish_reason is not None:
+            finish_reasons[choice.index] = choice.finish_reason
+    assert content == {0: "hello", 1: "hello"}
+    assert finish_reasons == {0: "stop", 1: "stop"}
+
+
+async def test_n_above_openai_limit_is_rejected(
+    openai_client: AsyncOpenAI,
+) -> None:
+    with pytest.raises(BadRequestError) as exc_info:
+        await openai_client.chat.completions.create(
+            model="test",
+            messages=[{"role": "user", "content": "Hi"}],
+            n=129,
+        )
+
+    assert exc_info.value.response.json()["error"]["param"] == "n"
+
+
+async def test_next_turn_reuses_cached_conversation_prefix(
+    openai_client: AsyncOpenAI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = MessagePrefixCache(max_bytes=1 << 20)
+    monkeypatch.setattr(graph_utils, "message_prefix_cache", cache)
+    messages = [{"role": "user", "content": "Hi"}]
+
+    first = await openai_client.chat.completions.create(
+        model="test",
+        messages=messages,
+    )
+    await openai_client.chat.completions.create(
+        model="test",
+        messages=[
+            *messages,
+            {"role": "assistant", "content": first.choices[0].message.content},
+            {"role": "user", "content": "Again"},
+        ],
+    )
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.reused_messages == len(messages)
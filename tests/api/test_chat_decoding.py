@@ -0,0 +1,193 @@
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette import status
+
+from langgraph_openai_serve import (
+    GraphRegistry,
+    LanggraphOpenaiServe,
+    openai_server as openai_server_module,
+)
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.api.chat.utils.decoding import (
+    decode_chat_completion_request,
+)
+from langgraph_openai_serve.core.settings import Settings
+
+BODY_LIMIT = 256
+REQUEST = {
+    "model": "test",
+    "messages": [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "Look it up é"},
+        {
+            "role": "assistant",
+            "tool_calls": [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "search", "arguments": "{}"},
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": "call_1", "content": "found"},
+    ],
+    "temperature": 0.5,
+    "metadata": {"tenant": "a"},
+}
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", "application/json; charset=utf-8", "application/x+json"],
+)
+def test_json_bodies_decode_like_python_validation(content_type: str) -> None:
+    decoded = decode_chat_completion_request(json.dumps(REQUEST).encode(), content_type)
+
+    assert decoded == ChatCompletionRequest.model_validate(REQUEST)
+
+
+@pytest.mark.parametrize(
+    ("content", "content_type", "message", "param"),
+    [
+        (b"", "application/json", "Field required", None),
+        (b"null", "application/json", "Field required", None),
+        (b"{bad", "application/json", "1: JSON decode error", "1"),
+        (
+            json.dumps(REQUEST).encode(),
+            "text/plain",
+            "Input should be a valid dictionary or object to extract fields from",
+            None,
+        ),
+        (
+            json.dumps({**REQUEST, "temperature": "hot"}).encode(),
+            "application/json",
+            (
+                "temperature: Input should be a valid number, "
+                "unable to parse string as a number"
+            ),
+            "temperature",
+        ),
+        (
+            json.dumps({"messages": [{"role": "bad"}], "functions": []}).encode(),
+            "application/json",
+            (
+                "functions: Value error, 'functions' is not supported; "
+                "use 'tools' instead."
+            ),
+            "functions",
+        ),
+    ],
+)
+async def test_rejected_bodies_keep_fastapi_errors(
+    client: AsyncClient,
+    content: bytes,
+    content_type: str,
+    message: str,
+    param: str | None,
+) -> None:
+    response = await client.post(
+        "/v1/chat/completions",
+        content=content,
+        headers={"content-type": content_type},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == {
+        "message": message,
+        "type": "invalid_request_error",
+        "param": param,
+        "code": None,
+    }
+
+
+def test_openapi_documents_the_request_body(graph_registry: GraphRegistry) -> None:
+    server = LanggraphOpenaiServe(graphs=graph_registry).bind_openai_api()
+
+    schema = server.openai_app.openapi()
+
+    request_body = schema["paths"]["/chat/completions"]["post"]["requestBody"]
+    body_schema = request_body["content"]["application/json"]["schema"]
+    message_ref = body_schema["properties"]["messages"]["items"]["$ref"]
+    resolved = schema
+    for part in message_ref.removeprefix("#/").split("/"):
+        resolved = resolved[part.replace("~1", "/")]
+    assert resolved["title"] == "ChatCompletionRequestMessage"
+    assert "function_call" not in json.dumps(body_schema)
+
+
+@pytest.fixture
+async def limited_client(
+    graph_registry: GraphRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[AsyncClient]:
+    monkeypatch.setattr(
+        openai_server_module,
+        "settings",
+        Settings(MAX_REQUEST_BODY_BYTES=BODY_LIMIT),
+    )
+    app = LanggraphOpenaiServe(graphs=graph_registry).bind_openai_api().app
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        yield client
+
+
+def assert_body_too_large(response) -> None:
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert response.headers["X-Request-ID"]
+    assert response.json()["error"] == {
+        "message": f"Request body exceeds the limit of {BODY_LIMIT} bytes.",
+        "type": "invalid_request_error",
+        "param": None,
+        "code": "request_body_too_large",
+    }
+
+
+def oversized_body() -> bytes:
+    return json.dumps(
+        {**REQUEST, "messages": [{"role": "user", "content": "x" * BODY_LIMIT}]}
+    ).encode()
+
+
+async def test_declared_oversized_body_is_rejected(
+    limited_client: AsyncClient,
+) -> None:
+    response = await limited_client.post(
+        "/v1/chat/completions",
+        content=oversized_body(),
+        headers={"content-type": "application/json"},
+    )
+
+    assert_body_too_large(response)
+
+
+async def test_streamed_oversized_body_is_rejected(
+    limited_client: AsyncClient,
+) -> None:
+    body = oversized_body()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 64):
+            yield body[start : start + 64]
+
+    response = await limited_client.post(
+        "/v1/chat/completions",
+        content=chunks(),
+        headers={"content-type": "application/json"},
+    )
+
+    assert_body_too_large(response)
+
+
+async def test_body_within_limit_is_served(limited_client: AsyncClient) -> None:
+    response = await limited_client.post(
+        "/v1/chat/completions",
+        json={"model": "test", "messages": [{"role": "user", "content": "Hi"}]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["choices"][0]["message"]["content"] == "hello"
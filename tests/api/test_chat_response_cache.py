@@ -0,0 +1,240 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph
+from openai import AsyncOpenAI, BadRequestError
+
+from langgraph_openai_serve import (
+    GraphConfig,
+    GraphFeature,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+    ResponseCachePolicy,
+    citation_event,
+    status_event,
+)
+from langgraph_openai_serve.api.chat.utils.caching import (
+    RESPONSE_CACHE_METADATA_KEY,
+    RESPONSE_CACHE_STATUS_HEADER,
+)
+from tests.graph.support.schemas import MessageState
+
+ANSWER = "Cached answer"
+MESSAGES = [{"role": "user", "content": "What is cached?"}]
+STREAM_EVENTS = {"langgraph_stream_events": "v1"}
+CHECKPOINT_SCOPE_HEADER = "x-test-checkpoint-scope"
+ANNOTATION = {
+    "type": "url_citation",
+    "url_citation": {
+        "start_index": 0,
+        "end_index": 5,
+        "title": "Source",
+        "url": "https://example.com",
+    },
+}
+
+
+@pytest.fixture
+def graph_calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def fastapi_app(graph_calls: list[str]) -> FastAPI:
+    model = FakeListChatModel(responses=[ANSWER])
+
+    async def generate(state: MessageState):
+        graph_calls.append(state["messages"][-1].content)
+        writer = get_stream_writer()
+        writer(status_event("Looking up"))
+        writer(citation_event(url="https://example.com", title="Source", span=(0, 6)))
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    graph = (
+        StateGraph(MessageState)
+        .add_node("generate", generate)
+        .set_entry_point("generate")
+        .set_finish_point("generate")
+        .compile()
+    )
+    registry = GraphRegistry(
+        registry={
+            "cached": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+                features={GraphFeature.CLIENT_EVENTS},
+                response_cache=ResponseCachePolicy(),
+            ),
+            "uncached": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+            ),
+        }
+    )
+    return (
+        LanggraphOpenaiServe(
+            graphs=registry,
+            checkpoint_scope=lambda request: request.headers.get(
+                CHECKPOINT_SCOPE_HEADER,
+                "default",
+            ),
+        )
+        .bind_openai_api()
+        .app
+    )
+
+
+async def complete(openai_client: AsyncOpenAI, **kwargs):
+    raw = await openai_client.chat.completions.with_raw_response.create(
+        model=kwargs.pop("model", "cached"),
+        messages=kwargs.pop("messages", MESSAGES),
+        **kwargs,
+    )
+    return raw.headers.get(RESPONSE_CACHE_STATUS_HEADER), raw.parse()
+
+
+async def test_repeated_completion_is_served_from_cache(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    first_status, first = await complete(openai_client)
+    second_status, second = await complete(openai_client)
+
+    assert (first_status, second_status) == ("miss", "hit")
+    assert graph_calls == ["What is cached?"]
+    assert second.choices[0].message == first.choices[0].message
+    assert second.choices[0].message.content == ANSWER
+    assert second.choices[0].message.annotations is not None
+    assert [a.model_dump() for a in second.choices[0].message.annotations] == [
+        ANNOTATION
+    ]
+    assert second.id != first.id
+
+
+async def stream_parts(openai_client: AsyncOpenAI):
+    status, stream = await complete(openai_client, stream=True, metadata=STREAM_EVENTS)
+    text = []
+    extensions = []
+    annotations = []
+    async for chunk in stream:
+        text.append(chunk.choices[0].delta.content or "")
+        extensions.append((chunk.model_extra or {}).get("langgraph_openai_serve"))
+        annotations += (chunk.choices[0].delta.model_extra or {}).get("annotations", [])
+        finish_reason = chunk.choices[0].finish_reason
+    client_events = [extension for extension in extensions if extension is not None]
+    return status, "".join(text), client_events, annotations, finish_reason
+
+
+async def test_streaming_hit_replays_text_events_and_annotations(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    miss = await stream_parts(openai_client)
+    hit = await stream_parts(openai_client)
+
+    assert (miss[0], hit[0]) == ("miss", "hit")
+    assert graph_calls == ["What is cached?"]
+    assert hit[1:] == miss[1:]
+    assert hit[1] == ANSWER
+    assert [extension["event"]["type"] for extension in hit[2]] == ["status"]
+    assert hit[3] == [ANNOTATION]
+    assert hit[4] == "stop"
+
+
+async def test_streaming_and_complete_responses_are_cached_separately(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    await complete(openai_client)
+    status, *_ = await stream_parts(openai_client)
+
+    assert status == "miss"
+    assert len(graph_calls) == len(["complete", "stream"])
+
+
+async def test_different_messages_miss(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    await complete(openai_client)
+    status, _ = await complete(
+        openai_client,
+        messages=[{"role": "user", "content": "Something else?"}],
+    )
+
+    assert status == "miss"
+    assert graph_calls == ["What is cached?", "Something else?"]
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        pytest.param(
+            {"extra_headers": {CHECKPOINT_SCOPE_HEADER: "tenant-a"}},
+            {"extra_headers": {CHECKPOINT_SCOPE_HEADER: "tenant-b"}},
+            id="scopes",
+        ),
+        pytest.param({"user": "user-a"}, {"user": "user-b"}, id="users"),
+    ],
+)
+async def test_responses_are_not_replayed_to_other_principals(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+    first: dict,
+    second: dict,
+) -> None:
+    first_status, _ = await complete(openai_client, **first)
+    second_status, _ = await complete(openai_client, **second)
+    repeated_status, _ = await complete(openai_client, **second)
+
+    assert (first_status, second_status, repeated_status) == ("miss", "miss", "hit")
+    assert graph_calls == ["What is cached?"] * 2
+
+
+async def test_bypass_neither_reads_nor_stores(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    bypass = {RESPONSE_CACHE_METADATA_KEY: "bypass"}
+
+    first_status, _ = await complete(openai_client, metadata=bypass)
+    second_status, _ = await complete(openai_client)
+    third_status, _ = await complete(openai_client, metadata=bypass)
+
+    assert (first_status, second_status, third_status) == ("bypass", "miss", "bypass")
+    assert len(graph_calls) == len(["bypass", "miss", "bypass"])
+
+
+async def test_several_choices_bypass_the_cache(
+    openai_client: AsyncOpenAI,
+    graph_calls: list[str],
+) -> None:
+    status, response = await complete(openai_client, n=2)
+
+    assert status == "bypass"
+    assert len(response.choices) == len(graph_calls)
+
+
+async def test_invalid_cache_directive_is_a_bad_request(
+    openai_client: AsyncOpenAI,
+) -> None:
+    with pytest.raises(BadRequestError) as exc_info:
+        await complete(openai_client, metadata={RESPONSE_CACHE_METADATA_KEY: "off"})
+
+    assert (
+        exc_info.value.response.json()["error"]["param"]
+        == f"metadata.{RESPONSE_CACHE_METADATA_KEY}"
+    )
+
+
+async def test_graphs_without_cache_report_no_status(client: AsyncClient) -> None:
+    response = await client.post(
+        "/v1/chat/completions",
+        json={"model": "uncached", "messages": MESSAGES},
+    )
+
+    assert RESPONSE_CACHE_STATUS_HEADER not in response.headers
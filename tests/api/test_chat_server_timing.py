@@ -0,0 +1,111 @@
+import json
+import logging
+
+import pytest
+from httpx import AsyncClient
+from openai import AsyncOpenAI
+
+from langgraph_openai_serve.graph.timing import RunPhase, RunTimings
+
+MESSAGES = [{"role": "user", "content": "Where did the time go?"}]
+TIMING_METADATA = {"langgraph_server_timing": "v1"}
+PREPARED_PHASES = {
+    RunPhase.RESOLVE_GRAPH,
+    RunPhase.BUILD_INPUT,
+    RunPhase.BUILD_CONTEXT,
+    RunPhase.EXECUTION,
+}
+
+
+def header_phases(header: str) -> dict[str, float]:
+    phases = {}
+    for metric in header.split(", "):
+        name, duration = metric.split(";dur=")
+        phases[name] = float(duration)
+    return phases
+
+
+def sse_payloads(body: str) -> list[dict]:
+    return [
+        json.loads(line.removeprefix("data: "))
+        for line in body.splitlines()
+        if line.startswith("data: {")
+    ]
+
+
+async def test_completion_reports_server_timing(openai_client: AsyncOpenAI) -> None:
+    response = await openai_client.chat.completions.with_raw_response.create(
+        model="test",
+        messages=MESSAGES,
+    )
+
+    phases = header_phases(response.headers["server-timing"])
+    assert set(phases) == {*PREPARED_PHASES, RunPhase.RENDERING}
+    assert all(duration >= 0 for duration in phases.values())
+
+
+async def test_stream_reports_timing_chunk_when_requested(client: AsyncClient) -> None:
+    response = await client.post(
+        "/v1/chat/completions",
+        json={
+            "model": "test",
+            "messages": MESSAGES,
+            "stream": True,
+            "metadata": TIMING_METADATA,
+        },
+    )
+
+    *_, timing_chunk = sse_payloads(response.text)
+    assert "server-timing" not in response.headers
+    assert timing_chunk["choices"] == []
+    assert set(timing_chunk["langgraph_openai_serve"]["server_timing"]) == (
+        PREPARED_PHASES
+    )
+
+
+async def test_stream_omits_timing_chunk_by_default(client: AsyncClient) -> None:
+    response = await client.post(
+        "/v1/chat/completions",
+        json={"model": "test", "messages": MESSAGES, "stream": True},
+    )
+
+    assert all(
+        "langgraph_openai_serve" not in payload
+        for payload in sse_payloads(response.text)
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+async def test_completion_log_record_carries_timings(
+    client: AsyncClient,
+    caplog: pytest.LogCaptureFixture,
+    stream: bool,
+) -> None:
+    caplog.set_level(logging.INFO, logger="langgraph_openai_serve")
+
+    response = await client.post(
+        "/v1/chat/completions",
+        json={"model": "test", "messages": MESSAGES, "stream": stream},
+    )
+
+    (record,) = [
+        record
+        for record in caplog.records
+        if record.getMessage() == "chat_completion.completed"
+    ]
+    assert record.request_id == response.headers["x-request-id"]
+    assert record.model == "test"
+    assert record.__dict__["timing.execution_ms"] >= 0
+
+
+def test_concurrent_runs_report_their_slowest_phase() -> None:
+    first, second = RunTimings(), RunTimings()
+    first.add(RunPhase.EXECUTION, 2.0)
+    first.add(RunPhase.EXECUTION, 1.0)
+    second.add(RunPhase.EXECUTION, 2.5)
+    second.add(RunPhase.RENDERING, 0.5)
+
+    assert RunTimings.slowest([first, second]).seconds() == {
+        RunPhase.EXECUTION: 3.0,
+        RunPhase.RENDERING: 0.5,
+    }
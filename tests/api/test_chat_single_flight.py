@@ -0,0 +1,187 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph
+from openai import AsyncOpenAI
+
+from langgraph_openai_serve import (
+    GraphConfig,
+    GraphFeature,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+    status_event,
+)
+from tests.graph.support.schemas import MessageState
+
+ANSWER = "Shared answer"
+MESSAGES = [{"role": "user", "content": "Popular question?"}]
+STREAM_EVENTS = {"langgraph_stream_events": "v1"}
+CHECKPOINT_SCOPE_HEADER = "x-test-checkpoint-scope"
+
+
+class Gate:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+
+@pytest.fixture
+def gate() -> Gate:
+    return Gate()
+
+
+@pytest.fixture
+def fastapi_app(gate: Gate) -> FastAPI:
+    model = FakeListChatModel(responses=[ANSWER])
+
+    async def generate(state: MessageState):
+        gate.calls.append(state["messages"][-1].content)
+        get_stream_writer()(status_event("Started"))
+        gate.started.set()
+        await gate.release.wait()
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    graph = (
+        StateGraph(MessageState)
+        .add_node("generate", generate)
+        .set_entry_point("generate")
+        .set_finish_point("generate")
+        .compile()
+    )
+    registry = GraphRegistry(
+        registry={
+            "shared": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                streamable_node_names=["generate"],
+                features={GraphFeature.CLIENT_EVENTS},
+                single_flight=True,
+            ),
+        }
+    )
+    return (
+        LanggraphOpenaiServe(
+            graphs=registry,
+            checkpoint_scope=lambda request: request.headers.get(
+                CHECKPOINT_SCOPE_HEADER,
+                "default",
+            ),
+        )
+        .bind_openai_api()
+        .app
+    )
+
+
+async def wait_until_started(gate: Gate) -> None:
+    await asyncio.wait_for(gate.started.wait(), timeout=2)
+
+
+async def test_concurrent_identical_requests_share_one_run(
+    openai_client: AsyncOpenAI,
+    gate: Gate,
+) -> None:
+    requests = [
+        asyncio.create_task(
+            openai_client.chat.completions.create(model="shared", messages=MESSAGES)
+        )
+        for _ in range(3)
+    ]
+    await wait_until_started(gate)
+    await asyncio.sleep(0.05)
+    gate.release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert gate.calls == ["Popular question?"]
+    assert [response.choices[0].message.content for response in responses] == [
+        ANSWER
+    ] * 3
+    assert len({response.id for response in responses}) == len(responses)
+
+
+async def test_different_requests_run_separately(
+    openai_client: AsyncOpenAI,
+    gate: Gate,
+) -> None:
+    gate.release.set()
+    await asyncio.gather(
+        openai_client.chat.completions.create(model="shared", messages=MESSAGES),
+        openai_client.chat.completions.create(
+            model="shared",
+            messages=[{"role": "user", "content": "Rare question?"}],
+        ),
+    )
+
+    assert sorted(gate.calls) == ["Popular question?", "Rare question?"]
+
+
+@pytest.mark.parametrize(
+    "request_options",
+    [
+        pytest.param(
+            [
+                {"extra_headers": {CHECKPOINT_SCOPE_HEADER: "tenant-a"}},
+                {"extra_headers": {CHECKPOINT_SCOPE_HEADER: "tenant-b"}},
+            ],
+            id="scopes",
+        ),
+        pytest.param([{"user": "user-a"}, {"user": "user-b"}], id="users"),
+    ],
+)
+async def test_identical_requests_of_different_principals_run_separately(
+    openai_client: AsyncOpenAI,
+    gate: Gate,
+    request_options: list[dict],
+) -> None:
+    requests = [
+        asyncio.create_task(
+            openai_client.chat.completions.create(
+                model="shared",
+                messages=MESSAGES,
+                **options,
+            )
+        )
+        for options in request_options
+    ]
+    await wait_until_started(gate)
+    await asyncio.sleep(0.05)
+    gate.release.set()
+    await asyncio.gather(*requests)
+
+    assert gate.calls == ["Popular question?"] * 2
+
+
+async def stream_text(openai_client: AsyncOpenAI) -> tuple[str, list[str]]:
+    stream = await openai_client.chat.completions.create(
+        model="shared",
+        messages=MESSAGES,
+        stream=True,
+        metadata=STREAM_EVENTS,
+    )
+    text = []
+    events = []
+    async for chunk in stream:
+        extension = (chunk.model_extra or {}).get("langgraph_openai_serve")
+        if extension is not None:
+            events.append(extension["event"]["type"])
+        text.append(chunk.choices[0].delta.content or "")
+    return "".join(text), events
+
+
+async def test_streaming_follower_receives_the_stream_from_the_start(
+    openai_client: AsyncOpenAI,
+    gate: Gate,
+) -> None:
+    leader = asyncio.create_task(stream_text(openai_client))
+    await wait_until_started(gate)
+    await asyncio.sleep(0.05)
+    follower = asyncio.create_task(stream_text(openai_client))
+    await asyncio.sleep(0.05)
+    gate.release.set()
+
+    assert await leader == (ANSWER, ["status"])
+    assert await follower == (ANSWER, ["status"])
+    assert gate.calls == ["Popular question?"]
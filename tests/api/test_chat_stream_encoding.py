@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from langgraph_openai_serve.api.chat.schemas import (
+    ChatCompletionStreamResponse,
+    ChatCompletionStreamResponseChoice,
+    ChatCompletionStreamResponseDelta,
+    Role,
+)
+from langgraph_openai_serve.api.chat.utils.responses import (
+    ChatCompletionStreamResponseBuilder,
+)
+
+MODELS = ["test", "modèle/ü 模型", 'quote"model']
+CONTENTS = [
+    "",
+    "hello",
+    " token",
+    "é中文🎉",
+    '"quoted" \\ backslash /slash',
+    "\n\t\r\b\f",
+    "\x00\x1f\x7f\x80",
+    "\u2028\u2029</script>",
+]
+EXTENSIONS = [
+    {"type": "status", "data": {"message": "Searching é"}, "namespace": []},
+    {"type": "progress", "data": {"ratio": 0.5, "done": False, "note": None}},
+]
+
+
+def validated_chunk(
+    builder: ChatCompletionStreamResponseBuilder,
+    delta: ChatCompletionStreamResponseDelta,
+    *,
+    index: int = 0,
+    finish_reason: str | None = None,
+    extension: dict[str, object] | None = None,
+) -> str:
+    """Encode a chunk the way the builder did before its templates existed."""
+    data = ChatCompletionStreamResponse(
+        id=builder.response_id,
+        created=builder.created,
+        model=builder.model,
+        choices=[
+            ChatCompletionStreamResponseChoice(
+                index=index,
+                delta=delta,
+                finish_reason=finish_reason,
+            )
+        ],
+    ).model_dump(mode="json", exclude_none=True)
+    if extension is not None:
+        data["choices"][0]["delta"] = {}
+        data["langgraph_openai_serve"] = extension
+    return f"data: {json.dumps(data)}\n\n"
+
+
+@pytest.mark.parametrize("model", MODELS)
+@pytest.mark.parametrize("index", [0, 7])
+def test_role_chunk_matches_validated_encoding(model: str, index: int) -> None:
+    builder = ChatCompletionStreamResponseBuilder(model)
+
+    assert builder.role(index) == validated_chunk(
+        builder,
+        ChatCompletionStreamResponseDelta(role=Role.ASSISTANT),
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("model", MODELS)
+@pytest.mark.parametrize("content", CONTENTS)
+def test_text_chunk_matches_validated_encoding(model: str, content: str) -> None:
+    builder = ChatCompletionStreamResponseBuilder(model)
+
+    assert builder.text(content, 3) == validated_chunk(
+        builder,
+        ChatCompletionStreamResponseDelta(content=content),
+        index=3,
+    )
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_client_event_chunk_matches_validated_encoding(
+    extension: dict[str, object],
+) -> None:
+    builder = ChatCompletionStreamResponseBuilder("test")
+
+    assert builder.client_event(extension, 1) == validated_chunk(
+        builder,
+        ChatCompletionStreamResponseDelta(),
+        index=1,
+        extension=extension,
+    )
+
+
+@pytest.mark.parametrize("finish_reason", ["stop", "tool_calls", "length"])
+def test_finish_chunk_matches_validated_encoding(finish_reason: str) -> None:
+    builder = ChatCompletionStreamResponseBuilder("test")
+
+    assert builder.finish(finish_reason, index=2) == validated_chunk(
+        builder,
+        ChatCompletionStreamResponseDelta(),
+        index=2,
+        finish_reason=finish_reason,
+    )
@@ -0,0 +1,152 @@
+from itertools import repeat
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+from langgraph.graph import StateGraph
+from openai import AsyncOpenAI
+
+from langgraph_openai_serve import GraphConfig, GraphRegistry, LanggraphOpenaiServe
+from tests.graph.support.message import make_message_graph
+from tests.graph.support.schemas import MessageState
+
+ANSWER = "Metered answer"
+ESTIMATED_ANSWER = "two words"
+MESSAGES = [{"role": "user", "content": "How much did this cost?"}]
+INPUT_TOKENS = 7
+OUTPUT_TOKENS = 3
+USAGE = {
+    "input_tokens": INPUT_TOKENS,
+    "output_tokens": OUTPUT_TOKENS,
+    "total_tokens": INPUT_TOKENS + OUTPUT_TOKENS,
+}
+
+
+class MeteredChatModel(GenericFakeChatModel):
+    """Report usage like provider models do, in its result or last chunk."""
+
+    async def _astream(self, *args: Any, **kwargs: Any):
+        async for chunk in super()._astream(*args, **kwargs):
+            yield chunk
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content="", usage_metadata=USAGE)
+        )
+
+
+def make_metered_graph() -> Any:
+    model = MeteredChatModel(messages=repeat(AIMessage(ANSWER, usage_metadata=USAGE)))
+
+    async def plan(state: MessageState):
+        await model.ainvoke(state["messages"])
+        return {}
+
+    async def generate(state: MessageState):
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    return (
+        StateGraph(MessageState)
+        .add_node("plan", plan)
+        .add_node("generate", generate)
+        .set_entry_point("plan")
+        .add_edge("plan", "generate")
+        .set_finish_point("generate")
+        .compile()
+    )
+
+
+@pytest.fixture
+def fastapi_app() -> FastAPI:
+    registry = GraphRegistry(
+        registry={
+            "metered": GraphConfig(
+                graph=make_metered_graph(),
+                description="DUMMY",
+                streamable_node_names=["generate"],
+            ),
+            "unmetered": GraphConfig(
+                graph=make_message_graph(ESTIMATED_ANSWER),
+                description="DUMMY",
+                streamable_node_names=["generate"],
+            ),
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+async def stream_chunks(
+    openai_client: AsyncOpenAI,
+    model: str,
+    **kwargs: Any,
+) -> list[Any]:
+    stream = await openai_client.chat.completions.create(
+        model=model,
+        messages=MESSAGES,
+        stream=True,
+        **kwargs,
+    )
+    return [chunk async for chunk in stream]
+
+
+async def test_usage_sums_every_model_call_of_the_run(
+    openai_client: AsyncOpenAI,
+) -> None:
+    response = await openai_client.chat.completions.create(
+        model="metered",
+        messages=MESSAGES,
+        n=2,
+    )
+
+    usage = response.usage
+    assert usage is not None
+    # Two choices, each planning and then answering.
+    assert (usage.prompt_tokens, usage.completion_tokens) == (
+        4 * INPUT_TOKENS,
+        4 * OUTPUT_TOKENS,
+    )
+    assert usage.total_tokens == usage.prompt_tokens + usage.completion_tokens
+
+
+async def test_stream_reports_usage_when_requested(
+    openai_client: AsyncOpenAI,
+) -> None:
+    chunks = await stream_chunks(
+        openai_client,
+        "metered",
+        stream_options={"include_usage": True},
+    )
+
+    *content_chunks, usage_chunk = chunks
+    text = "".join(chunk.choices[0].delta.content or "" for chunk in content_chunks)
+    assert text == ANSWER
+    assert content_chunks[-1].choices[0].finish_reason == "stop"
+    assert usage_chunk.choices == []
+    assert usage_chunk.usage is not None
+    assert (usage_chunk.usage.prompt_tokens, usage_chunk.usage.completion_tokens) == (
+        2 * INPUT_TOKENS,
+        2 * OUTPUT_TOKENS,
+    )
+
+
+async def test_stream_omits_usage_by_default(openai_client: AsyncOpenAI) -> None:
+    chunks = await stream_chunks(openai_client, "metered")
+
+    assert all(chunk.usage is None for chunk in chunks)
+    assert chunks[-1].choices[0].finish_reason == "stop"
+
+
+async def test_unreported_usage_is_estimated(openai_client: AsyncOpenAI) -> None:
+    chunks = await stream_chunks(
+        openai_client,
+        "unmetered",
+        stream_options={"include_usage": True},
+    )
+
+    usage = chunks[-1].usage
+    assert usage is not None
+    assert (usage.prompt_tokens, usage.completion_tokens) == (
+        len(MESSAGES[0]["content"].split()),
+        len(ESTIMATED_ANSWER.split()),
+    )
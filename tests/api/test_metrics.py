@@ -0,0 +1,160 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from openai import AsyncOpenAI
+from prometheus_client import REGISTRY
+from starlette import status
+
+from langgraph_openai_serve import (
+    GraphConfig,
+    GraphRegistry,
+    LanggraphOpenaiServe,
+    openai_server as openai_server_module,
+)
+from langgraph_openai_serve.api.chat.utils.streaming import (
+    _StreamOwner,  # ruff: ignore[import-private-name]
+)
+from langgraph_openai_serve.core import metrics as metrics_module
+from langgraph_openai_serve.core.settings import Settings
+from tests.graph.support.message import make_message_graph
+
+ANSWER = "Counted answer in several words"
+MESSAGES = [{"role": "user", "content": "Are you being watched?"}]
+MODEL = "metered-model"
+OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    enabled = Settings(ENABLE_METRICS=True)
+    monkeypatch.setattr(metrics_module, "settings", enabled)
+    monkeypatch.setattr(openai_server_module, "settings", enabled)
+
+
+@pytest.fixture
+def fastapi_app(metrics_enabled: None) -> FastAPI:
+    registry = GraphRegistry(
+        registry={
+            MODEL: GraphConfig(
+                graph=make_message_graph(ANSWER),
+                description="DUMMY",
+                streamable_node_names=["generate"],
+            )
+        }
+    )
+    return LanggraphOpenaiServe(graphs=registry).bind_openai_api().app
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, {"model": MODEL, **labels}) or 0.0
+
+
+def request_count(status_code: int, *, stream: bool, model: str = MODEL) -> float:
+    labels = {
+        "model": model,
+        "stream": str(stream).lower(),
+        "status_code": str(status_code),
+    }
+    return (
+        REGISTRY.get_sample_value("lgos_chat_completion_requests_total", labels) or 0.0
+    )
+
+
+async def test_completion_is_counted_and_timed(openai_client: AsyncOpenAI) -> None:
+    requests = request_count(status.HTTP_200_OK, stream=False)
+    runs = sample("lgos_graph_run_duration_seconds_count")
+
+    await openai_client.chat.completions.create(model=MODEL, messages=MESSAGES)
+
+    assert request_count(status.HTTP_200_OK, stream=False) == requests + 1
+    assert sample("lgos_graph_run_duration_seconds_count") == runs + 1
+    assert sample("lgos_graph_runs_in_flight") == 0
+
+
+async def test_stream_records_token_latencies(openai_client: AsyncOpenAI) -> None:
+    first_tokens = sample("lgos_time_to_first_token_seconds_count")
+    gaps = sample("lgos_inter_token_latency_seconds_count")
+    chunks = sample("lgos_stream_chunks_sum")
+
+    stream = await openai_client.chat.completions.create(
+        model=MODEL,
+        messages=MESSAGES,
+        stream=True,
+    )
+    text_chunks = [
+        chunk
+        async for chunk in stream
+        if chunk.choices and chunk.choices[0].delta.content
+    ]
+
+    assert sample("lgos_time_to_first_token_seconds_count") == first_tokens + 1
+    assert sample("lgos_inter_token_latency_seconds_count") == (
+        gaps + len(text_chunks) - 1
+    )
+    assert sample("lgos_stream_chunks_sum") == chunks + len(text_chunks)
+    assert request_count(status.HTTP_200_OK, stream=True) >= 1
+
+
+async def test_unknown_models_share_one_label(client: AsyncClient) -> None:
+    rejected = request_count(
+        status.HTTP_400_BAD_REQUEST,
+        stream=False,
+        model="unknown",
+    )
+
+    response = await client.post(
+        "/v1/chat/completions",
+        json={"model": "no-such-graph", "messages": MESSAGES},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert (
+        request_count(status.HTTP_400_BAD_REQUEST, stream=False, model="unknown")
+        == rejected + 1
+    )
+
+
+async def test_abandoned_stream_is_counted_as_cancelled(
+    metrics_enabled: None,
+) -> None:
+    started = asyncio.Event()
+
+    async def source() -> AsyncGenerator[str, None]:
+        started.set()
+        await asyncio.Event().wait()
+        yield "unreachable"
+
+    cancelled = sample("lgos_stream_cancellations_total")
+    owner = _StreamOwner()
+    owner.start(source(), [], model=MODEL)
+    await started.wait()
+
+    await owner.aclose()
+
+    assert sample("lgos_stream_cancellations_total") == cancelled + 1
+    assert sample("lgos_graph_runs_in_flight") == 0
+
+
+async def test_metrics_endpoint_negotiates_openmetrics(
+    client: AsyncClient,
+    openai_client: AsyncOpenAI,
+) -> None:
+    await openai_client.chat.completions.create(model=MODEL, messages=MESSAGES)
+
+    response = await client.get("/metrics", headers={"Accept": OPENMETRICS})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    assert "lgos_chat_completion_requests_total{" in response.text
+    assert response.text.endswith("# EOF\n")
+
+
+async def test_metrics_endpoint_is_not_mounted_by_default(
+    graph_registry: GraphRegistry,
+) -> None:
+    app = LanggraphOpenaiServe(graphs=graph_registry).bind_openai_api().app
+
+    assert all(getattr(route, "path", None) != "/metrics" for route in app.routes)
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient, Response
@@ -5,7 +8,10 @@ from pydantic import ValidationError
 from starlette import status
 
 from langgraph_openai_serve import (
+    GraphCachePolicy,
+    GraphConfig,
     GraphRegistry,
+    GraphWarmup,
     LanggraphOpenaiServe,
     openai_server,
 )
@@ -158,3 +164,103 @@ def test_openai_api_prefix_settings_normalizes_trailing_slash() -> None:
 def test_openai_api_prefix_settings_rejects_invalid_value(prefix: str) -> None:
     with pytest.raises(ValidationError):
         Settings(OPENAI_API_PREFIX=prefix)
+
+
+class RecordingHooks:
+    def __init__(self, events: list[str], model: str) -> None:
+        self.events = events
+        self.model = model
+
+    async def startup(self) -> None:
+        self.events.append(f"start:{self.model}")
+
+    async def shutdown(self) -> None:
+        self.events.append(f"stop:{self.model}")
+
+
+@pytest.mark.parametrize(
+    "warmup",
+    [
+        pytest.param(None, id="hooks-only"),
+        pytest.param(GraphWarmup(), id="sequential"),
+        pytest.param(GraphWarmup(parallel=True, timeout=5), id="parallel"),
+    ],
+)
+async def test_host_lifespan_runs_graph_hooks_and_warmup(
+    message_graph,
+    warmup: GraphWarmup | None,
+) -> None:
+    events: list[str] = []
+    resolved: list[str] = []
+
+    def factory():
+        resolved.append("graph")
+        return message_graph
+
+    @asynccontextmanager
+    async def host_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        events.append("host:start")
+        try:
+            yield
+        finally:
+            events.append("host:stop")
+
+    hooks = RecordingHooks(events, "test")
+    graph_registry = GraphRegistry(
+        registry={
+            "test": GraphConfig(
+                graph=factory,
+                description="DUMMY",
+                graph_cache=GraphCachePolicy(),
+                on_startup=hooks.startup,
+                on_shutdown=hooks.shutdown,
+            )
+        }
+    )
+    server = LanggraphOpenaiServe(
+        graphs=graph_registry,
+        app=FastAPI(lifespan=host_lifespan),
+        warmup=warmup,
+    )
+
+    async with server.app.router.lifespan_context(server.app):
+        assert events == ["host:start", "start:test"]
+        assert resolved == ([] if warmup is None else ["graph"])
+        assert set(server.warmup_timings) == {"test"}
+
+    assert events == ["host:start", "start:test", "stop:test", "host:stop"]
+
+
+async def test_failed_graph_startup_stops_already_started_graphs(
+    message_graph,
+) -> None:
+    events: list[str] = []
+    started = RecordingHooks(events, "started")
+
+    async def fail() -> None:
+        msg = "index unavailable"
+        raise RuntimeError(msg)
+
+    graph_registry = GraphRegistry(
+        registry={
+            "started": GraphConfig(
+                graph=message_graph,
+                description="DUMMY",
+                on_startup=started.startup,
+                on_shutdown=started.shutdown,
+            ),
+            "failing": GraphConfig(
+                graph=message_graph,
+                description="DUMMY",
+                on_startup=fail,
+                on_shutdown=RecordingHooks(events, "failing").shutdown,
+            ),
+        }
+    )
+    server = LanggraphOpenaiServe(graphs=graph_registry)
+
+    with pytest.raises(RuntimeError, match="index unavailable"):
+        async with server.app.router.lifespan_context(server.app):
+            pass
+
+    assert events == ["start:started", "stop:started"]
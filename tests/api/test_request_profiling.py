@@ -0,0 +1,143 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from langgraph_openai_serve import (
+    LanggraphOpenaiServe,
+    openai_server as openai_server_module,
+)
+from langgraph_openai_serve.core.profiling import RequestProfiler
+from langgraph_openai_serve.core.settings import Settings
+from langgraph_openai_serve.graph.graph_registry import GraphRegistry
+
+ADMIN_TOKEN = "profiler-admin-token"
+ADMIN_HEADERS = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+COMPLETION = {"model": "test", "messages": [{"role": "user", "content": "Slow?"}]}
+
+
+def written_profiles(directory: Path) -> list[Path]:
+    return sorted(directory.iterdir())
+
+
+@pytest.fixture
+def profile_threshold() -> float:
+    return 60.0
+
+
+@pytest.fixture
+def fastapi_app(
+    graph_registry: GraphRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    profile_threshold: float,
+) -> FastAPI:
+    monkeypatch.setattr(
+        openai_server_module,
+        "settings",
+        Settings(
+            PROFILE_DIR=tmp_path,
+            PROFILE_SAMPLE_RATE=1,
+            PROFILE_THRESHOLD=profile_threshold,
+            PROFILE_ADMIN_TOKEN=ADMIN_TOKEN,
+        ),
+    )
+    return LanggraphOpenaiServe(graphs=graph_registry).bind_openai_api().app
+
+
+@pytest.mark.parametrize("profile_threshold", [1e-9])
+async def test_slow_request_writes_tagged_profile(
+    client: AsyncClient,
+    tmp_path: Path,
+) -> None:
+    response = await client.post("/v1/chat/completions", json=COMPLETION)
+
+    (profile,) = written_profiles(tmp_path)
+    assert profile.suffix == ".collapsed"
+    assert profile.stem.endswith(f"-{response.headers['x-request-id']}-test")
+
+
+@pytest.mark.parametrize("profile_threshold", [1e-9])
+async def test_requests_without_model_are_not_profiled(
+    client: AsyncClient,
+    tmp_path: Path,
+) -> None:
+    await client.get("/v1/models")
+
+    assert not written_profiles(tmp_path)
+
+
+async def test_fast_request_profile_is_discarded(
+    client: AsyncClient,
+    tmp_path: Path,
+) -> None:
+    await client.post("/v1/chat/completions", json=COMPLETION)
+
+    assert not written_profiles(tmp_path)
+
+
+async def test_armed_model_profiles_next_requests(
+    client: AsyncClient,
+    tmp_path: Path,
+) -> None:
+    armed = await client.post(
+        "/admin/profiler/arm",
+        json={"model": "test", "requests": 1},
+        headers=ADMIN_HEADERS,
+    )
+
+    await client.post("/v1/chat/completions", json=COMPLETION)
+    await client.post("/v1/chat/completions", json=COMPLETION)
+
+    assert armed.json() == {"model": "test", "requests": 1}
+    assert len(written_profiles(tmp_path)) == 1
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong-token"}],
+)
+async def test_arming_requires_admin_token(
+    client: AsyncClient,
+    headers: dict[str, str],
+) -> None:
+    response = await client.post(
+        "/admin/profiler/arm",
+        json={"model": "test"},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_arming_unknown_model_is_rejected(client: AsyncClient) -> None:
+    response = await client.post(
+        "/admin/profiler/arm",
+        json={"model": "missing"},
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_profiler_samples_the_request_thread(tmp_path: Path) -> None:
+    profiler = RequestProfiler(tmp_path, sample_rate=1, threshold=60, interval=0.001)
+    samples = []
+
+    def request() -> None:
+        profile = profiler.start()
+        assert profile is not None
+        time.sleep(0.05)
+        profiler.finish(profile, model="test")
+        samples.extend(profile.samples)
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    thread.join()
+
+    assert samples
+    assert all("test_request_profiling:" in stack for stack in samples)
@@ -0,0 +1,54 @@
+from langgraph.types import Interrupt
+
+from langgraph_openai_serve.graph.interrupt import LangGraphInterruptBatch
+from langgraph_openai_serve.graph.interrupt.cache import (
+    PendingInterruptCache,
+    PendingInterruptCacheStats,
+)
+
+
+def _batch(state_token: str) -> LangGraphInterruptBatch:
+    return LangGraphInterruptBatch(
+        run_id="run-1",
+        state_token=state_token,
+        interrupts=(Interrupt(value={"question": "Approve?"}, id="interrupt-1"),),
+    )
+
+
+def test_cache_evicts_the_least_recently_used_thread() -> None:
+    cache = PendingInterruptCache(max_entries=2)
+    cache.put("thread-1", _batch("token-1"))
+    cache.put("thread-2", _batch("token-2"))
+    assert cache.get("thread-1") == _batch("token-1")
+
+    cache.put("thread-3", _batch("token-3"))
+
+    assert cache.get("thread-2") is None
+    assert cache.get("thread-3") == _batch("token-3")
+    assert cache.stats() == PendingInterruptCacheStats(
+        hits=2,
+        misses=1,
+        evictions=1,
+        entries=2,
+    )
+
+
+def test_cache_replaces_and_discards_a_thread_batch() -> None:
+    cache = PendingInterruptCache(max_entries=2)
+    cache.put("thread-1", _batch("token-1"))
+    cache.put("thread-1", _batch("token-2"))
+    assert cache.get("thread-1") == _batch("token-2")
+
+    cache.discard("thread-1")
+    cache.discard("thread-unknown")
+
+    assert cache.get("thread-1") is None
+    assert cache.stats().entries == 0
+
+
+def test_zero_entries_disable_the_cache() -> None:
+    cache = PendingInterruptCache(max_entries=0)
+    cache.put("thread-1", _batch("token-1"))
+
+    assert cache.get("thread-1") is None
+    assert cache.stats() == PendingInterruptCacheStats(0, 0, 0, 0)
@@ -1,9 +1,12 @@
+import anyio
 import pytest
 from anyio import fail_after
 
 from langgraph_openai_serve.graph.interrupt import (
     InMemoryRunCoordinator,
     RunBusyError,
+    RunLeaseLostError,
+    RunLeaseWatch,
 )
 
 
@@ -35,3 +38,33 @@ async def test_in_memory_coordinator_releases_after_failure() -> None:
 
     async with coordinator("thread-1"):
         pass
+
+
+async def test_lost_lease_cancels_guarded_work() -> None:
+    watch = RunLeaseWatch("thread-1")
+
+    async def lose_soon() -> None:
+        await anyio.sleep(0.01)
+        watch.lose()
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(lose_soon)
+        with (
+            fail_after(1),
+            pytest.raises(RunLeaseLostError) as exc_info,
+            watch.guard(),
+        ):
+            await anyio.sleep_forever()
+
+    assert exc_info.value.key == "thread-1"
+    with pytest.raises(RunLeaseLostError), watch.guard():
+        pass
+
+
+async def test_held_lease_leaves_guarded_work_alone() -> None:
+    watch = RunLeaseWatch("thread-1")
+
+    with watch.guard():
+        await anyio.lowlevel.checkpoint()
+
+    assert not watch.lost
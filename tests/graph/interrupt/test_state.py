@@ -0,0 +1,135 @@
+from typing import Any
+
+import pytest
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+from langgraph_openai_serve.graph.interrupt import (
+    CheckpointHeads,
+    state as interrupt_state,
+)
+from tests.graph.support.interrupt import make_parallel_nested_interrupt_graph
+
+THREAD_ID = "thread-1"
+NESTED_INTERRUPTS = 2
+
+
+async def _interrupted_graph() -> tuple[Any, InMemorySaver]:
+    checkpointer = InMemorySaver()
+    graph = make_parallel_nested_interrupt_graph(checkpointer)
+    await graph.ainvoke({}, _config())
+    return graph, checkpointer
+
+
+def _config(thread_id: str = THREAD_ID) -> dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+async def _scan_heads(checkpointer: BaseCheckpointSaver) -> CheckpointHeads:
+    tuples = {}
+    async for checkpoint_tuple in checkpointer.alist(_config()):
+        namespace = checkpoint_tuple.config["configurable"]["checkpoint_ns"]
+        current = tuples.get(namespace)
+        if current is None or (
+            checkpoint_tuple.config["configurable"]["checkpoint_id"]
+            > current.config["configurable"]["checkpoint_id"]
+        ):
+            tuples[namespace] = checkpoint_tuple
+    return CheckpointHeads(thread_id=THREAD_ID, tuples=tuples)
+
+
+async def test_prefetched_heads_build_the_same_snapshot_without_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    graph, checkpointer = await _interrupted_graph()
+    expected = await graph.aget_state(_config(), subgraphs=True)
+    heads = await _scan_heads(checkpointer)
+    reads: list[dict[str, Any]] = []
+    read_tuple = checkpointer.aget_tuple
+
+    async def record_read(config: dict[str, Any]) -> Any:
+        reads.append(config)
+        return await read_tuple(config)
+
+    monkeypatch.setattr(checkpointer, "aget_tuple", record_read)
+
+    snapshot = await interrupt_state.aget_interrupt_state(graph, _config(), heads)
+
+    assert reads == []
+    assert len(snapshot.interrupts) == NESTED_INTERRUPTS
+    assert snapshot.interrupts == expected.interrupts
+    assert snapshot.config == expected.config
+    assert snapshot.values == expected.values
+    assert snapshot.tasks == expected.tasks
+
+
+async def test_prefetched_heads_produce_the_scanned_state_token() -> None:
+    graph, checkpointer = await _interrupted_graph()
+
+    heads = await _scan_heads(checkpointer)
+
+    assert interrupt_state.heads_state_token(heads) == (
+        await interrupt_state.checkpoint_state_token(graph, _config())
+    )
+    assert (
+        interrupt_state.heads_state_token(CheckpointHeads(THREAD_ID, tuples={})) is None
+    )
+
+
+async def test_heads_of_another_thread_are_not_used() -> None:
+    graph, checkpointer = await _interrupted_graph()
+    heads = await _scan_heads(checkpointer)
+    await graph.ainvoke({}, _config("thread-2"))
+
+    snapshot = await interrupt_state.aget_interrupt_state(
+        graph,
+        _config("thread-2"),
+        heads,
+    )
+
+    assert snapshot.config["configurable"]["thread_id"] == "thread-2"
+    assert len(snapshot.interrupts) == NESTED_INTERRUPTS
+
+
+class HeadReadingSaver(InMemorySaver):
+    """In-memory saver that answers head reads with prepared heads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.heads: CheckpointHeads | None = None
+        self.head_reads = 0
+
+    async def aget_checkpoint_heads(self, thread_id: str) -> CheckpointHeads | None:
+        self.head_reads += 1
+        return self.heads if thread_id == THREAD_ID else None
+
+
+async def test_state_token_uses_a_checkpoint_head_reader(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checkpointer = HeadReadingSaver()
+    graph = make_parallel_nested_interrupt_graph(checkpointer)
+    await graph.ainvoke({}, _config())
+    checkpointer.heads = await _scan_heads(checkpointer)
+
+    def fail_scan(*_args: object, **_kwargs: object) -> None:
+        msg = "a head reader must not be scanned"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(checkpointer, "alist", fail_scan)
+
+    token = await interrupt_state.checkpoint_state_token(graph, _config())
+
+    assert token == interrupt_state.heads_state_token(checkpointer.heads)
+    assert checkpointer.head_reads == 1
+
+
+async def test_state_token_scans_when_the_head_reader_declines() -> None:
+    checkpointer = HeadReadingSaver()
+    graph = make_parallel_nested_interrupt_graph(checkpointer)
+    await graph.ainvoke({}, _config())
+
+    token = await interrupt_state.checkpoint_state_token(graph, _config())
+
+    assert checkpointer.head_reads == 1
+    assert token == interrupt_state.heads_state_token(await _scan_heads(checkpointer))
@@ -31,6 +31,7 @@ from langgraph_openai_serve.graph.graph_registry import (
     GraphConfig,
     GraphConfigurationError,
     GraphRegistry,
+    InvokeMode,
 )
 from langgraph_openai_serve.graph.interrupt import (
     InMemoryRunCoordinator,
@@ -221,9 +222,11 @@ async def test_thread_id_reaches_runnable_config(
     assert seen_thread_ids == [checkpoint_key("threaded", RUN_ID)]
 
 
+@pytest.mark.parametrize("invoke_mode", list(InvokeMode))
 async def test_interrupt_result_is_returned_before_output_rendering(
     make_request,
     sqlite_checkpointer: AsyncSqliteSaver,
+    invoke_mode: InvokeMode,
 ) -> None:
     async def output_to_text(output):
         msg = "interrupt output should not be rendered"
@@ -237,6 +240,7 @@ async def test_interrupt_result_is_returned_before_output_rendering(
                 output_to_text=output_to_text,
                 features={GraphFeature.INTERRUPTS},
                 run_coordinator=InMemoryRunCoordinator(),
+                invoke_mode=invoke_mode,
             )
         }
     )
@@ -1,7 +1,10 @@
 import operator
+from dataclasses import dataclass
 
 import pytest
 from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.config import get_stream_writer
+from langgraph.graph import StateGraph
 from langgraph.types import CustomStreamPart
 
 from langgraph_openai_serve.core.logging import (
@@ -16,6 +19,7 @@ from langgraph_openai_serve.graph.graph_registry import (
     GraphConfig,
     GraphNotFoundError,
     GraphRegistry,
+    InvokeMode,
 )
 from langgraph_openai_serve.graph.interrupt import InMemoryRunCoordinator
 from langgraph_openai_serve.graph.runner import (
@@ -28,6 +32,12 @@ from langgraph_openai_serve.graph.utils import (
 )
 from tests.graph.support.interrupt import make_interrupt_graph
 from tests.graph.support.message import make_message_graph
+from tests.graph.support.schemas import (
+    PydanticAnswerOutput,
+    PydanticQuestionInput,
+    PydanticQuestionState,
+    QuestionState,
+)
 
 
 class RecordingCallback(BaseCallbackHandler):
@@ -310,3 +320,145 @@ async def test_invoke_run_collects_generic_custom_events() -> None:
     assert invocation.custom_events == (
         CustomStreamPart(type="custom", ns=(), data=payload),
     )
+
+
+@pytest.mark.parametrize("invoke_mode", list(InvokeMode))
+async def test_invoke_modes_collect_root_output_and_subgraph_events(
+    make_request,
+    invoke_mode: InvokeMode,
+) -> None:
+    def search(state: QuestionState):
+        get_stream_writer()({"type": "status", "data": {"step": "search"}})
+        return {"answer": state["question"].upper()}
+
+    subgraph = (
+        StateGraph(QuestionState)
+        .add_node("search", search)
+        .set_entry_point("search")
+        .set_finish_point("search")
+        .compile()
+    )
+
+    def answer(state: PydanticQuestionState):
+        get_stream_writer()({"type": "status", "data": {"step": "answer"}})
+        return {"answer": f"{state.answer}!"}
+
+    graph = (
+        StateGraph(
+            PydanticQuestionState,
+            input_schema=PydanticQuestionInput,
+            output_schema=PydanticAnswerOutput,
+        )
+        .add_node("subgraph", subgraph)
+        .add_node("answer", answer)
+        .set_entry_point("subgraph")
+        .add_edge("subgraph", "answer")
+        .set_finish_point("answer")
+        .compile()
+    )
+    graph_registry = GraphRegistry(
+        registry={
+            "nested": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                request_to_input=lambda request, messages: {
+                    "question": messages[-1].content
+                },
+                output_to_text=lambda output: output.answer,
+                invoke_mode=invoke_mode,
+            )
+        },
+    )
+    chat_request = make_request("nested")
+
+    invocation = await run_langgraph(
+        "nested",
+        chat_request.messages,
+        graph_registry,
+        chat_request,
+    )
+
+    assert invocation.output == "QUESTION!"
+    assert [event["data"] for event in invocation.custom_events] == [
+        {"type": "status", "data": {"step": "search"}},
+        {"type": "status", "data": {"step": "answer"}},
+    ]
+    assert invocation.custom_events[0]["ns"]
+    assert invocation.custom_events[1]["ns"] == ()
+
+
+@dataclass
+class DataclassAnswerState:
+    question: str = ""
+    answer: str = ""
+
+
+@pytest.mark.parametrize("invoke_mode", list(InvokeMode))
+@pytest.mark.parametrize(
+    ("state_schema", "output_type"),
+    [(DataclassAnswerState, DataclassAnswerState), (QuestionState, dict)],
+)
+async def test_invoke_modes_build_the_same_output_type(
+    make_request,
+    invoke_mode: InvokeMode,
+    state_schema: type,
+    output_type: type,
+) -> None:
+    graph = (
+        StateGraph(state_schema)
+        .add_node("answer", lambda _state: {"answer": "yes"})
+        .set_entry_point("answer")
+        .set_finish_point("answer")
+        .compile()
+    )
+    outputs = []
+
+    def output_to_text(output) -> str:
+        outputs.append(output)
+        return "yes"
+
+    graph_registry = GraphRegistry(
+        registry={
+            "typed": GraphConfig(
+                graph=graph,
+                description="DUMMY",
+                request_to_input=lambda request, messages: {"question": "why"},
+                output_to_text=output_to_text,
+                invoke_mode=invoke_mode,
+            )
+        },
+    )
+    chat_request = make_request("typed")
+
+    await run_langgraph("typed", chat_request.messages, graph_registry, chat_request)
+
+    (output,) = outputs
+    assert type(output) is output_type
+
+
+async def test_final_invoke_mode_keeps_runtime_callbacks(make_request) -> None:
+    recording_callback = RecordingCallback()
+    runtime_callbacks = [recording_callback]
+    graph_config = GraphConfig(
+        graph=make_message_graph("hello"),
+        description="DUMMY",
+        runtime_callbacks=runtime_callbacks,
+        invoke_mode=InvokeMode.FINAL,
+    )
+    graph_registry = GraphRegistry(registry={"messages": graph_config})
+    chat_request = make_request("messages")
+
+    invocation = await run_langgraph(
+        "messages",
+        chat_request.messages,
+        graph_registry,
+        chat_request,
+    )
+
+    assert invocation.output == "hello"
+    assert recording_callback.starts == 1
+    assert [
+        metadata["lgos.model"] for metadata in recording_callback.root_metadata
+    ] == ["messages"]
+    assert graph_config.runtime_callbacks == [recording_callback]
+    assert runtime_callbacks == [recording_callback]
@@ -0,0 +1,233 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from langgraph_openai_serve import AdmissionPolicy, FairnessKey
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequest
+from langgraph_openai_serve.graph import admission as admission_module
+from langgraph_openai_serve.graph.admission import (
+    AdmissionControl,
+    AdmissionTicket,
+    GraphOverloadedError,
+)
+from langgraph_openai_serve.graph.utils import admission_key
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def make_control(**policy: Any) -> AdmissionControl:
+    return AdmissionControl(
+        AdmissionPolicy(
+            **{"max_concurrent": 1, "max_queue": 8, "queue_timeout": 5, **policy}
+        )
+    )
+
+
+class Recorder:
+    def __init__(self, control: AdmissionControl) -> None:
+        self.control = control
+        self.admitted: list[str] = []
+        self.tasks: list[asyncio.Task[None]] = []
+
+    def queue(self, key: str, *, interactive: bool = False) -> None:
+        async def admit() -> None:
+            ticket = await self.control.admit(key, interactive=interactive)
+            self.admitted.append(key)
+            ticket.release()
+
+        self.tasks.append(asyncio.create_task(admit()))
+
+    async def drain(self, running: AdmissionTicket) -> list[str]:
+        await settle()
+        running.release()
+        await asyncio.gather(*self.tasks)
+        return self.admitted
+
+
+async def test_queued_requests_are_admitted_in_arrival_order() -> None:
+    control = make_control()
+    running = await control.admit()
+    admitted = []
+
+    async def wait(name: str) -> None:
+        ticket = await control.admit()
+        admitted.append(name)
+        ticket.release()
+
+    waiters = [asyncio.create_task(wait(name)) for name in ("first", "second")]
+    await settle()
+    stats = control.stats()
+    assert (stats.running, stats.queued) == (1, 2)
+    assert stats.oldest_wait > 0
+
+    running.release()
+    await asyncio.gather(*waiters)
+
+    assert admitted == ["first", "second"]
+    stats = control.stats()
+    assert (stats.running, stats.queued, stats.admitted) == (0, 0, 3)
+    assert stats.average_wait > 0
+
+
+async def test_full_queue_rejects_with_retry_after() -> None:
+    control = make_control(max_queue=0)
+    await control.admit()
+
+    with pytest.raises(GraphOverloadedError) as exc_info:
+        await control.admit()
+
+    assert exc_info.value.retry_after == 1
+    assert control.stats().keys.keys() == {""}
+    assert control.stats().rejected == 1
+
+
+async def test_retry_after_follows_how_long_slots_are_held(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = 100.0
+    monkeypatch.setattr(admission_module.time, "monotonic", lambda: now)
+    control = make_control(max_queue=0)
+    ticket = await control.admit()
+    now = 104.0
+    ticket.release()
+    await control.admit()
+
+    with pytest.raises(GraphOverloadedError) as exc_info:
+        await control.admit()
+
+    assert exc_info.value.retry_after == int(now - 100.0)
+
+
+async def test_queue_timeout_rejects_and_leaves_the_queue() -> None:
+    control = make_control(queue_timeout=0.01)
+    await control.admit()
+
+    with pytest.raises(GraphOverloadedError, match="timed out"):
+        await control.admit()
+
+    stats = control.stats()
+    assert (stats.queued, stats.timed_out) == (0, 1)
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    control = make_control()
+    running = await control.admit()
+    waiter = asyncio.create_task(control.admit())
+    await settle()
+
+    waiter.cancel()
+    await settle()
+    assert control.stats().queued == 0
+
+    running.release()
+    assert control.stats().running == 0
+
+
+async def test_slot_is_freed_by_the_last_holder() -> None:
+    control = make_control()
+    ticket = await control.admit(holders=2)
+
+    ticket.release()
+    assert control.stats().running == 1
+    ticket.release()
+    ticket.release()
+
+    assert control.stats().running == 0
+
+
+async def test_weighted_keys_share_capacity_by_weight() -> None:
+    control = make_control(fairness=FairnessKey.USER, weights={"gold": 3})
+    running = await control.admit("gold")
+    recorder = Recorder(control)
+    for key in ["gold"] * 4 + ["free"] * 4:
+        recorder.queue(key)
+
+    admitted = await recorder.drain(running)
+
+    assert admitted == ["gold"] * 3 + ["free", "gold"] + ["free"] * 3
+
+
+async def test_light_key_is_not_starved_by_a_heavy_backlog() -> None:
+    control = make_control(fairness=FairnessKey.USER)
+    running = await control.admit("heavy")
+    recorder = Recorder(control)
+    for key in ["heavy"] * 5 + ["light"]:
+        recorder.queue(key)
+
+    admitted = await recorder.drain(running)
+
+    assert admitted.index("light") == 1
+
+
+async def test_key_cap_leaves_capacity_to_other_keys() -> None:
+    control = make_control(
+        max_concurrent=2,
+        fairness=FairnessKey.SCOPE,
+        max_concurrent_per_key=1,
+    )
+    running = await control.admit("a")
+    waiting = asyncio.create_task(control.admit("a"))
+    await settle()
+
+    other = await control.admit("b")
+
+    stats = control.stats()
+    assert (stats.keys["a"].running, stats.keys["a"].queued) == (1, 1)
+    assert stats.keys["b"].running == 1
+    running.release()
+    (await waiting).release()
+    other.release()
+    assert control.stats().keys == {}
+
+
+async def test_streaming_requests_are_admitted_first() -> None:
+    control = make_control(prioritize_streaming=True)
+    running = await control.admit()
+    recorder = Recorder(control)
+    recorder.queue("batch")
+    recorder.queue("interactive", interactive=True)
+
+    assert await recorder.drain(running) == ["interactive", "batch"]
+
+
+def test_per_key_settings_require_fairness() -> None:
+    with pytest.raises(ValueError, match="require fairness"):
+        AdmissionPolicy(max_concurrent=1, max_concurrent_per_key=1)
+
+
+@pytest.mark.parametrize(
+    ("fairness", "expected"),
+    [
+        (None, ""),
+        (FairnessKey.SCOPE, "tenant"),
+        (FairnessKey.USER, "alice"),
+        (FairnessKey.SESSION, "chat-1"),
+    ],
+)
+def test_admission_key_follows_fairness(
+    fairness: FairnessKey | None,
+    expected: str,
+) -> None:
+    request = ChatCompletionRequest(
+        model="test",
+        messages=[{"role": "user", "content": "Hi"}],
+        user="alice",
+        metadata={"session_id": "chat-1"},
+    )
+    policy = AdmissionPolicy(max_concurrent=1, fairness=fairness)
+
+    assert admission_key(policy, request, "tenant") == expected
+
+
+def test_missing_client_keys_fall_back_to_the_scope() -> None:
+    request = ChatCompletionRequest(
+        model="test",
+        messages=[{"role": "user", "content": "Hi"}],
+    )
+    policy = AdmissionPolicy(max_concurrent=1, fairness=FairnessKey.SESSION)
+
+    assert admission_key(policy, request, "tenant") == "tenant"
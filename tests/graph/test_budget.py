@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from langgraph_openai_serve import ExecutionBudget
+from langgraph_openai_serve.core.settings import Settings
+from langgraph_openai_serve.graph import budget as budget_module
+from langgraph_openai_serve.graph.budget import (
+    RunBudget,
+    RunBudgetExceededError,
+    start_run_budget,
+)
+
+RECURSION_LIMIT = 10
+MAX_RECURSION_LIMIT = 20
+
+
+async def test_requested_values_replace_the_graph_defaults() -> None:
+    policy = ExecutionBudget(timeout=30, recursion_limit=50)
+    started = asyncio.get_running_loop().time()
+
+    budget = start_run_budget(policy, timeout=5, recursion_limit=RECURSION_LIMIT)
+
+    assert budget.deadline is not None
+    assert started + 5 <= budget.deadline < started + 30
+    assert budget.recursion_limit == RECURSION_LIMIT
+
+
+async def test_server_maximums_cap_and_default_every_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        budget_module,
+        "settings",
+        Settings(MAX_REQUEST_TIMEOUT=1, MAX_RECURSION_LIMIT=MAX_RECURSION_LIMIT),
+    )
+    started = asyncio.get_running_loop().time()
+
+    capped = start_run_budget(ExecutionBudget(timeout=30), recursion_limit=100)
+    defaulted = start_run_budget(None)
+
+    for budget in (capped, defaulted):
+        assert budget.deadline is not None
+        assert budget.deadline <= started + 2
+        assert budget.recursion_limit == MAX_RECURSION_LIMIT
+
+
+async def test_only_enforced_requested_limits_count_as_requested(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        budget_module,
+        "settings",
+        Settings(MAX_REQUEST_TIMEOUT=10, MAX_RECURSION_LIMIT=MAX_RECURSION_LIMIT),
+    )
+    policy = ExecutionBudget(timeout=5, recursion_limit=RECURSION_LIMIT)
+
+    requested = start_run_budget(policy, timeout=1, recursion_limit=RECURSION_LIMIT)
+    capped = start_run_budget(policy, timeout=60, recursion_limit=100)
+    defaulted = start_run_budget(policy)
+
+    assert (requested.deadline_requested, requested.recursion_limit_requested) == (
+        True,
+        True,
+    )
+    assert (capped.deadline_requested, capped.recursion_limit_requested) == (
+        False,
+        False,
+    )
+    assert (defaulted.deadline_requested, defaulted.recursion_limit_requested) == (
+        False,
+        False,
+    )
+
+
+async def test_unbounded_budget_sets_no_limits() -> None:
+    assert start_run_budget(None) == RunBudget()
+
+
+async def test_bound_stream_stops_at_the_deadline() -> None:
+    async def events():
+        yield "first"
+        await asyncio.sleep(10)
+        yield "never"
+
+    budget = RunBudget(deadline=asyncio.get_running_loop().time() + 0.05)
+    stream = budget.bound(events())
+
+    assert await anext(stream) == "first"
+    with pytest.raises(RunBudgetExceededError) as exc_info:
+        await anext(stream)
+    assert exc_info.value.code == "deadline_exceeded"
+
+
+async def test_timeouts_raised_by_graph_code_are_not_budget_errors() -> None:
+    budget = RunBudget(deadline=asyncio.get_running_loop().time() + 10)
+
+    with pytest.raises(TimeoutError):
+        async with budget.enforce():
+            raise TimeoutError
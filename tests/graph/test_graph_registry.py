@@ -0,0 +1,170 @@
+import pytest
+from anyio import create_task_group, fail_after
+from pydantic import ValidationError
+
+from langgraph_openai_serve import GraphCachePolicy, GraphConfig, ResponseCachePolicy
+from langgraph_openai_serve.graph import graph_registry, response_cache
+from langgraph_openai_serve.graph.features import GraphFeature
+from langgraph_openai_serve.graph.graph_registry import GraphConfigurationError
+from tests.graph.support.message import make_message_graph
+
+
+class RecordingFactory:
+    def __init__(self) -> None:
+        self.built = []
+
+    async def __call__(self):
+        graph = make_message_graph()
+        self.built.append(graph)
+        return graph
+
+
+async def test_uncached_factory_builds_a_graph_per_resolution() -> None:
+    factory = RecordingFactory()
+    config = GraphConfig(graph=factory, description="DUMMY")
+
+    first = await config.resolve_graph()
+    second = await config.resolve_graph()
+
+    assert factory.built == [first, second]
+
+
+async def test_cached_factory_is_single_flight_for_concurrent_resolutions() -> None:
+    factory = RecordingFactory()
+    config = GraphConfig(
+        graph=factory,
+        description="DUMMY",
+        graph_cache=GraphCachePolicy(),
+    )
+    graphs = []
+
+    async def resolve() -> None:
+        graphs.append(await config.resolve_graph())
+
+    with fail_after(2):
+        async with create_task_group() as task_group:
+            for _ in range(10):
+                task_group.start_soon(resolve)
+
+    assert len(factory.built) == 1
+    assert all(graph is factory.built[0] for graph in graphs)
+
+    config.invalidate_graph()
+    rebuilt = await config.resolve_graph()
+
+    assert factory.built == [graphs[0], rebuilt]
+
+
+async def test_cached_graph_expires_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = 100.0
+    monkeypatch.setattr(graph_registry.time, "monotonic", lambda: now)
+    factory = RecordingFactory()
+    config = GraphConfig(
+        graph=factory,
+        description="DUMMY",
+        graph_cache=GraphCachePolicy(ttl=10),
+    )
+
+    first = await config.resolve_graph()
+    now = 109.0
+    assert await config.resolve_graph() is first
+    now = 110.0
+    rebuilt = await config.resolve_graph()
+
+    assert factory.built == [first, rebuilt]
+
+
+async def test_invalid_cached_graph_is_not_reused() -> None:
+    factory = RecordingFactory()
+    config = GraphConfig(
+        graph=factory,
+        description="DUMMY",
+        features={GraphFeature.INTERRUPTS},
+        graph_cache=GraphCachePolicy(),
+    )
+
+    for attempt in range(1, 3):
+        with pytest.raises(GraphConfigurationError, match="checkpointer"):
+            await config.resolve_graph()
+        assert len(factory.built) == attempt
+
+
+async def test_configuration_change_revalidates_a_validated_graph() -> None:
+    config = GraphConfig(graph=make_message_graph(), description="DUMMY")
+    await config.resolve_graph()
+
+    config.features = {GraphFeature.INTERRUPTS}
+
+    with pytest.raises(GraphConfigurationError, match="checkpointer"):
+        await config.resolve_graph()
+
+
+def test_response_cache_rejects_interrupt_graphs() -> None:
+    with pytest.raises(ValidationError, match="interrupt-enabled"):
+        GraphConfig(
+            graph=make_message_graph(),
+            description="DUMMY",
+            features={GraphFeature.INTERRUPTS},
+            response_cache=ResponseCachePolicy(),
+        )
+
+
+def test_response_store_evicts_least_recently_used_entry() -> None:
+    config = GraphConfig(
+        graph=make_message_graph(),
+        description="DUMMY",
+        response_cache=ResponseCachePolicy(max_entries=2),
+    )
+    store = config.response_store
+    assert store is not None
+
+    store.put(b"a", ("first",))
+    store.put(b"b", ("second",))
+    assert store.get(b"a") == ("first",)
+    store.put(b"c", ("third",))
+
+    assert store.get(b"b") is None
+    assert store.get(b"c") == ("third",)
+    stats = store.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 1, 1, 2)
+
+
+def test_response_store_entries_expire_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = 100.0
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now)
+    store = response_cache.ResponseCache(max_entries=8, ttl=10)
+
+    store.put(b"key", ("answer",))
+    now = 109.0
+    assert store.get(b"key") == ("answer",)
+    now = 110.0
+
+    assert store.get(b"key") is None
+    assert store.stats().entries == 0
+
+
+def test_response_store_keeps_its_own_copy_of_events() -> None:
+    store = response_cache.ResponseCache(max_entries=8)
+    event = {"type": "status", "data": {"message": "Looking up"}}
+
+    store.put(b"key", ("answer", event))
+    event["data"]["message"] = "changed"
+
+    assert store.get(b"key") == (
+        "answer",
+        {"type": "status", "data": {"message": "Looking up"}},
+    )
+
+
+def test_single_flight_rejects_interrupt_graphs() -> None:
+    with pytest.raises(ValidationError, match="interrupt-enabled"):
+        GraphConfig(
+            graph=make_message_graph(),
+            description="DUMMY",
+            features={GraphFeature.INTERRUPTS},
+            single_flight=True,
+        )
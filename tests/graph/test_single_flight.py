@@ -0,0 +1,208 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from langgraph_openai_serve.graph.single_flight import SingleFlight
+
+KEY = b"key"
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_calls_share_one_execution() -> None:
+    flights = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def work() -> str:
+        calls.append(KEY)
+        await release.wait()
+        return "answer"
+
+    waiters = [asyncio.create_task(flights.call(KEY, work)) for _ in range(3)]
+    await settle()
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["answer"] * 3
+    assert calls == [KEY]
+    stats = flights.stats()
+    assert (stats.leaders, stats.followers, stats.in_flight) == (1, 2, 0)
+
+
+async def test_finished_call_frees_its_key() -> None:
+    flights = SingleFlight()
+    calls = []
+
+    async def work() -> int:
+        calls.append(KEY)
+        return len(calls)
+
+    assert await flights.call(KEY, work) == 1
+    assert await flights.call(KEY, work) == len(["first", "second"])
+
+
+async def test_cancelled_leader_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "answer"
+
+    leader = asyncio.create_task(flights.call(KEY, work))
+    await settle()
+    follower = asyncio.create_task(flights.call(KEY, work))
+    await settle()
+    leader.cancel()
+    await settle()
+    release.set()
+
+    assert await follower == "answer"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_execution_is_cancelled_when_every_caller_leaves() -> None:
+    flights = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "unreachable"
+
+    waiters = [asyncio.create_task(flights.call(KEY, work)) for _ in range(2)]
+    await settle()
+    for waiter in waiters:
+        waiter.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await settle()
+    assert flights.stats().in_flight == 0
+
+
+async def test_call_failures_reach_every_caller() -> None:
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        msg = "graph failed"
+        raise RuntimeError(msg)
+
+    waiters = [asyncio.create_task(flights.call(KEY, work)) for _ in range(2)]
+    await settle()
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert [str(result) for result in results] == ["graph failed"] * 2
+
+
+class Source:
+    def __init__(self) -> None:
+        self.started = 0
+        self.events: asyncio.Queue[str | None] = asyncio.Queue()
+        self.closed = asyncio.Event()
+
+    async def start(self) -> AsyncGenerator[str, None]:
+        self.started += 1
+        return self.stream()
+
+    async def stream(self) -> AsyncGenerator[str, None]:
+        try:
+            while (event := await self.events.get()) is not None:
+                yield event
+        finally:
+            self.closed.set()
+
+
+async def collect(events: AsyncGenerator[str, None]) -> list[str]:
+    return [event async for event in events]
+
+
+async def test_late_subscriber_replays_stream_from_the_start() -> None:
+    flights = SingleFlight()
+    source = Source()
+
+    leader = asyncio.create_task(collect(await flights.stream(KEY, source.start)))
+    source.events.put_nowait("a")
+    source.events.put_nowait("b")
+    await settle()
+    follower = asyncio.create_task(collect(await flights.stream(KEY, source.start)))
+    source.events.put_nowait("c")
+    source.events.put_nowait(None)
+
+    assert await leader == ["a", "b", "c"]
+    assert await follower == ["a", "b", "c"]
+    assert source.started == 1
+
+
+async def test_closed_leader_subscription_does_not_stop_followers() -> None:
+    flights = SingleFlight()
+    source = Source()
+    leader = await flights.stream(KEY, source.start)
+    follower = await flights.stream(KEY, source.start)
+
+    source.events.put_nowait("a")
+    assert await anext(leader) == "a"
+    await leader.aclose()
+    source.events.put_nowait("b")
+    source.events.put_nowait(None)
+
+    assert await collect(follower) == ["a", "b"]
+
+
+async def test_stream_is_closed_when_every_subscriber_leaves() -> None:
+    flights = SingleFlight()
+    source = Source()
+    subscriptions = [await flights.stream(KEY, source.start) for _ in range(2)]
+    source.events.put_nowait("a")
+
+    for subscription in subscriptions:
+        assert await anext(subscription) == "a"
+        await subscription.aclose()
+
+    await asyncio.wait_for(source.closed.wait(), timeout=1)
+
+
+async def test_stream_start_failure_reaches_every_caller() -> None:
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def start() -> AsyncGenerator[str, None]:
+        await release.wait()
+        msg = "preparation failed"
+        raise ValueError(msg)
+
+    callers = [asyncio.create_task(flights.stream(KEY, start)) for _ in range(2)]
+    await settle()
+    release.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert [str(result) for result in results] == ["preparation failed"] * 2
+    assert flights.stats().in_flight == 0
+
+
+async def test_stream_failure_reaches_subscribers_after_its_events() -> None:
+    flights = SingleFlight()
+
+    async def failing() -> AsyncGenerator[str, None]:
+        yield "a"
+        msg = "stream failed"
+        raise RuntimeError(msg)
+
+    async def start() -> AsyncGenerator[str, None]:
+        return failing()
+
+    subscription = await flights.stream(KEY, start)
+
+    assert await anext(subscription) == "a"
+    with pytest.raises(RuntimeError, match="stream failed"):
+        await anext(subscription)
@@ -0,0 +1,72 @@
+import pytest
+import tiktoken
+
+from langgraph_openai_serve.api.chat.schemas import ChatCompletionRequestMessage
+from langgraph_openai_serve.core.settings import Settings
+from langgraph_openai_serve.graph import usage as usage_module
+from langgraph_openai_serve.graph.usage import TokenUsage, count_tokens, estimate_usage
+
+BYTE_TOKENIZER = "test-bytes"
+
+
+@pytest.fixture
+def byte_tokenizer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Count one token per byte without downloading an encoding."""
+    encoding = tiktoken.Encoding(
+        name=BYTE_TOKENIZER,
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([value]): value for value in range(256)},
+        special_tokens={},
+    )
+    monkeypatch.setattr(tiktoken, "get_encoding", {BYTE_TOKENIZER: encoding}.get)
+
+
+def test_usage_adds_up_across_model_calls() -> None:
+    usage = TokenUsage(prompt_tokens=5, completion_tokens=2) + TokenUsage(
+        prompt_tokens=1,
+        completion_tokens=1,
+    )
+
+    assert usage.as_dict() == {
+        "prompt_tokens": 6,
+        "completion_tokens": 3,
+        "total_tokens": 9,
+    }
+
+
+def test_estimate_counts_every_message_and_the_output() -> None:
+    messages = [
+        ChatCompletionRequestMessage(role="system", content="Be brief."),
+        ChatCompletionRequestMessage(role="user", content="Say hello"),
+        ChatCompletionRequestMessage(role="assistant"),
+    ]
+
+    assert estimate_usage("Hello there friend", messages) == TokenUsage(4, 3)
+    assert estimate_usage(None, messages) == TokenUsage(4, 0)
+
+
+def test_message_token_counts_are_memoized() -> None:
+    text = "a message sent again with every later turn"
+    count_tokens(text)
+    hits = count_tokens.cache_info().hits
+
+    count_tokens(text)
+
+    assert count_tokens.cache_info().hits == hits + 1
+
+
+def test_estimate_counts_with_the_configured_tokenizer(
+    byte_tokenizer: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    messages = [ChatCompletionRequestMessage(role="user", content="Say hello")]
+    assert estimate_usage("Hi", messages) == TokenUsage(2, 1)
+
+    monkeypatch.setattr(
+        usage_module,
+        "settings",
+        Settings(USAGE_TOKENIZER=BYTE_TOKENIZER),
+    )
+
+    assert estimate_usage("Hi", messages) == TokenUsage(9, 2)
+    assert count_tokens("Say hello") == len(["Say", "hello"])
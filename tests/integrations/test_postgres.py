@@ -1,14 +1,35 @@
 from asyncio import CancelledError
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from operator import itemgetter
+from typing import Any, Self
 from unittest.mock import ANY, AsyncMock, Mock, call
 
+import anyio
+import anyio.lowlevel
 import pytest
 from anyio import fail_after
-
-from langgraph_openai_serve.graph.interrupt import RunBusyError
+from langgraph.checkpoint.base import RESUME, CheckpointTuple, empty_checkpoint
+from langgraph.graph import StateGraph
+
+from langgraph_openai_serve.graph.interrupt import (
+    CheckpointHeadReader,
+    CheckpointHeads,
+    ResumeHead,
+    ResumeHeadReader,
+    RunBusyError,
+    RunLeaseLostError,
+)
+from langgraph_openai_serve.graph.interrupt.state import (
+    checkpoint_state_token,
+    heads_state_token,
+)
 from langgraph_openai_serve.integrations import postgres
 
 THREAD_1_LOCK_KEY = 5407239785987761849
 THREAD_NEGATIVE_LOCK_KEY = -7821029440514528571
+CONCURRENT_LEASES = 1000
+LOCK_CONNECTIONS = 2
 
 
 def _coordinator_for(
@@ -99,6 +120,245 @@ async def test_coordinator_rejects_an_occupied_database_lock() -> None:
     connection.close.assert_not_awaited()
 
 
+def _heads_coordinator_for(
+    *cursors: Mock,
+) -> tuple[postgres.PostgresRunCoordinator, Mock, Mock]:
+    connection = Mock(
+        execute=AsyncMock(side_effect=cursors),
+        pipeline=Mock(return_value=AsyncMock()),
+        close=AsyncMock(),
+    )
+    connection_context = AsyncMock()
+    connection_context.__aenter__.return_value = connection
+    pool = Mock(connection=Mock(return_value=connection_context))
+    checkpointer = Mock(
+        SELECT_SQL="SELECT checkpoint ",
+        _load_checkpoint_tuple=AsyncMock(side_effect=itemgetter("tuple")),
+    )
+    coordinator = postgres.PostgresRunCoordinator(
+        pool,
+        max_concurrent_leases=1,
+        checkpointer=checkpointer,
+    )
+    return coordinator, connection, checkpointer
+
+
+def _head_row(namespace: str, version: int = 4) -> dict[str, Any]:
+    return {
+        "checkpoint_ns": namespace,
+        "checkpoint": {"v": version},
+        "parent_checkpoint_id": "parent",
+        "tuple": f"tuple:{namespace}",
+    }
+
+
+async def test_coordinator_pipelines_lock_with_checkpoint_heads() -> None:
+    lock_key = postgres._advisory_lock_key("thread-1")
+    coordinator, connection, _ = _heads_coordinator_for(
+        Mock(fetchone=AsyncMock(return_value={"acquired": True})),
+        Mock(fetchall=AsyncMock(return_value=[_head_row(""), _head_row("sub")])),
+        Mock(fetchone=AsyncMock(return_value={"released": True})),
+    )
+
+    async with coordinator("thread-1") as heads:
+        assert heads == CheckpointHeads(
+            thread_id="thread-1",
+            tuples={"": "tuple:", "sub": "tuple:sub"},
+        )
+
+    connection.pipeline.assert_called_once_with()
+    assert connection.execute.await_args_list == [
+        call(postgres._TRY_ADVISORY_LOCK_SQL, (lock_key,)),
+        call(
+            "SELECT checkpoint " + postgres._CHECKPOINT_HEADS_WHERE_SQL,
+            {"thread_id": "thread-1"},
+            binary=True,
+        ),
+        call(postgres._UNLOCK_ADVISORY_LOCK_SQL, (lock_key,)),
+    ]
+
+
+async def test_coordinator_discards_heads_read_with_an_occupied_lock() -> None:
+    coordinator, connection, checkpointer = _heads_coordinator_for(
+        Mock(fetchone=AsyncMock(return_value={"acquired": False})),
+        Mock(fetchall=AsyncMock(return_value=[_head_row("")])),
+    )
+
+    with pytest.raises(RunBusyError):
+        async with coordinator("thread-1"):
+            pass
+
+    checkpointer._load_checkpoint_tuple.assert_not_awaited()
+    connection.close.assert_not_awaited()
+
+
+async def test_coordinator_leaves_legacy_checkpoints_to_the_saver() -> None:
+    coordinator, _, checkpointer = _heads_coordinator_for(
+        Mock(fetchone=AsyncMock(return_value={"acquired": True})),
+        Mock(fetchall=AsyncMock(return_value=[_head_row("", version=3)])),
+        Mock(fetchone=AsyncMock(return_value={"released": True})),
+    )
+
+    async with coordinator("thread-1") as heads:
+        assert heads is None
+
+    checkpointer._load_checkpoint_tuple.assert_not_awaited()
+
+
+async def test_coordinator_leaves_unknown_saver_releases_to_the_saver(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(postgres, "_checkpoint_postgres_major_version", lambda: 4)
+    coordinator, _, checkpointer = _heads_coordinator_for(
+        Mock(fetchone=AsyncMock(return_value={"acquired": True})),
+        Mock(fetchall=AsyncMock(return_value=[_head_row("")])),
+        Mock(fetchone=AsyncMock(return_value={"released": True})),
+    )
+
+    async with coordinator("thread-1") as heads:
+        assert heads is None
+
+    checkpointer._load_checkpoint_tuple.assert_not_awaited()
+
+
+def _saver_with_rows(
+    monkeypatch: pytest.MonkeyPatch,
+    rows: list[dict[str, Any]],
+) -> tuple[postgres.PostgresCheckpointSaver, Mock]:
+    cursor = Mock(execute=AsyncMock(), fetchall=AsyncMock(return_value=rows))
+
+    @asynccontextmanager
+    async def open_cursor() -> AsyncIterator[Mock]:
+        yield cursor
+
+    saver = postgres.PostgresCheckpointSaver(Mock())
+    monkeypatch.setattr(saver, "_cursor", open_cursor)
+    monkeypatch.setattr(saver, "_load_checkpoint_tuple", AsyncMock())
+    return saver, cursor
+
+
+def _resume_row(
+    saver: postgres.PostgresCheckpointSaver,
+    namespace: str,
+    task_id: str | None = None,
+    value: object = None,
+) -> dict[str, Any]:
+    value_type, blob = (
+        saver.serde.dumps_typed(value) if task_id is not None else (None, None)
+    )
+    return {
+        "checkpoint_ns": namespace,
+        "checkpoint_id": f"checkpoint:{namespace}",
+        "task_id": task_id,
+        "type": value_type,
+        "blob": blob,
+    }
+
+
+async def test_checkpoint_saver_reads_only_resume_writes_for_state_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    saver, cursor = _saver_with_rows(monkeypatch, [])
+    rows = [
+        _resume_row(saver, "", "task-b", "yes"),
+        _resume_row(saver, "", "task-a", ["yes", "no"]),
+        _resume_row(saver, "sub"),
+    ]
+    cursor.fetchall.return_value = rows
+
+    resume_heads = await saver.aget_resume_heads("thread-1")
+
+    assert isinstance(saver, ResumeHeadReader)
+    assert resume_heads == {
+        "": ResumeHead("checkpoint:", (("task-a", 2), ("task-b", 1))),
+        "sub": ResumeHead("checkpoint:sub", ()),
+    }
+    cursor.execute.assert_awaited_once_with(
+        postgres._RESUME_HEADS_SQL,
+        {"thread_id": "thread-1", "channel": RESUME},
+    )
+    saver._load_checkpoint_tuple.assert_not_awaited()
+
+
+async def test_resume_heads_give_the_same_state_token_as_head_tuples(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    saver, cursor = _saver_with_rows(monkeypatch, [])
+    cursor.fetchall.return_value = [
+        _resume_row(saver, "", "task-a", ["yes", "no"]),
+        _resume_row(saver, "sub"),
+    ]
+    graph = (
+        StateGraph(dict)
+        .add_node("noop", lambda _state: {})
+        .set_entry_point("noop")
+        .set_finish_point("noop")
+        .compile(checkpointer=saver)
+    )
+    heads = CheckpointHeads(
+        thread_id="thread-1",
+        tuples={
+            namespace: CheckpointTuple(
+                config={
+                    "configurable": {
+                        "thread_id": "thread-1",
+                        "checkpoint_ns": namespace,
+                        "checkpoint_id": f"checkpoint:{namespace}",
+                    }
+                },
+                checkpoint=empty_checkpoint(),
+                metadata={},
+                pending_writes=writes,
+            )
+            for namespace, writes in (
+                ("", [("task-a", RESUME, ["yes", "no"]), ("task-a", "x", 1)]),
+                ("sub", []),
+            )
+        },
+    )
+
+    token = await checkpoint_state_token(
+        graph, {"configurable": {"thread_id": "thread-1"}}
+    )
+
+    assert token is not None
+    assert token == heads_state_token(heads)
+
+
+async def test_checkpoint_saver_reads_every_namespace_head_in_one_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = Mock(
+        execute=AsyncMock(),
+        fetchall=AsyncMock(return_value=[_head_row(""), _head_row("sub")]),
+    )
+
+    @asynccontextmanager
+    async def open_cursor() -> AsyncIterator[Mock]:
+        yield cursor
+
+    saver = postgres.PostgresCheckpointSaver(Mock())
+    monkeypatch.setattr(saver, "_cursor", open_cursor)
+    monkeypatch.setattr(
+        saver,
+        "_load_checkpoint_tuple",
+        AsyncMock(side_effect=itemgetter("tuple")),
+    )
+
+    heads = await saver.aget_checkpoint_heads("thread-1")
+
+    assert isinstance(saver, CheckpointHeadReader)
+    assert heads == CheckpointHeads(
+        thread_id="thread-1",
+        tuples={"": "tuple:", "sub": "tuple:sub"},
+    )
+    cursor.execute.assert_awaited_once_with(
+        saver.SELECT_SQL + postgres._CHECKPOINT_HEADS_WHERE_SQL,
+        {"thread_id": "thread-1"},
+        binary=True,
+    )
+
+
 @pytest.mark.parametrize(
     ("failure_stage", "failure"),
     [
@@ -225,3 +485,416 @@ def test_advisory_lock_key_is_stable_signed_bigint() -> None:
     assert lock_key == THREAD_1_LOCK_KEY
     assert -(2**63) <= lock_key < 2**63
     assert postgres._advisory_lock_key("thread-negative") == THREAD_NEGATIVE_LOCK_KEY
+
+
+class FakeLockServer:
+    """Session advisory locks shared by fake PostgreSQL connections."""
+
+    def __init__(self) -> None:
+        self.owners: dict[int, FakeLockConnection] = {}
+        self.connections: list[FakeLockConnection] = []
+        self.statements = 0
+
+    async def connect(self, _conninfo: str, **_kwargs: object) -> "FakeLockConnection":
+        connection = FakeLockConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class FakeLockConnection:
+    def __init__(self, server: FakeLockServer) -> None:
+        self.server = server
+        self.closed = False
+        self.fail_next: BaseException | None = None
+        self.hang = False
+
+    async def execute(self, query: str, parameters: tuple[int, ...]) -> Mock:
+        if self.closed:
+            msg = "connection is closed"
+            raise RuntimeError(msg)
+        if self.fail_next is not None:
+            failure, self.fail_next = self.fail_next, None
+            raise failure
+        if self.hang:
+            # A half-open connection: the server never answers.
+            await anyio.sleep_forever()
+        self.server.statements += 1
+        owners = self.server.owners
+        if query == postgres._TRY_ADVISORY_LOCK_SQL:
+            (lock_key,) = parameters
+            acquired = owners.setdefault(lock_key, self) is self
+            row = {"acquired": acquired}
+        elif query == postgres._UNLOCK_ADVISORY_LOCK_SQL:
+            (lock_key,) = parameters
+            released = owners.get(lock_key) is self
+            if released:
+                del owners[lock_key]
+            row = {"released": released}
+        else:
+            row = {"alive": 1}
+        return Mock(fetchone=AsyncMock(return_value=row))
+
+    async def close(self) -> None:
+        self.closed = True
+        for lock_key, owner in list(self.server.owners.items()):
+            if owner is self:
+                del self.server.owners[lock_key]
+
+
+@pytest.fixture
+def lock_server(monkeypatch: pytest.MonkeyPatch) -> FakeLockServer:
+    server = FakeLockServer()
+    monkeypatch.setattr(postgres.AsyncConnection, "connect", server.connect)
+    return server
+
+
+async def test_multiplexed_leases_share_dedicated_sessions(
+    lock_server: FakeLockServer,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator(
+        "postgresql://", lock_connections=LOCK_CONNECTIONS
+    )
+    entered = 0
+
+    async def lease(index: int) -> None:
+        nonlocal entered
+        async with coordinator(f"thread-{index}"):
+            entered += 1
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as task_group:
+        for index in range(CONCURRENT_LEASES):
+            task_group.start_soon(lease, index)
+
+    assert entered == CONCURRENT_LEASES
+    assert len(lock_server.connections) == LOCK_CONNECTIONS
+    assert lock_server.owners == {}
+    assert coordinator.held_leases == 0
+    await coordinator.aclose()
+    assert all(connection.closed for connection in lock_server.connections)
+
+
+async def test_multiplexed_lease_rejects_a_key_held_in_process(
+    lock_server: FakeLockServer,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator("postgresql://")
+
+    async with coordinator("thread-1"):
+        statements = lock_server.statements
+        with pytest.raises(RunBusyError):
+            async with coordinator("thread-1"):
+                pass
+        assert lock_server.statements == statements
+
+    async with coordinator("thread-1"):
+        pass
+    await coordinator.aclose()
+
+
+async def test_multiplexed_lease_rejects_a_key_held_by_another_process(
+    lock_server: FakeLockServer,
+) -> None:
+    first = postgres.MultiplexedPostgresRunCoordinator("postgresql://")
+    second = postgres.MultiplexedPostgresRunCoordinator("postgresql://")
+
+    async with first("thread-1"):
+        with pytest.raises(RunBusyError) as exc_info:
+            async with second("thread-1"):
+                pass
+
+    assert exc_info.value.key == "thread-1"
+    assert second.held_leases == 0
+    await first.aclose()
+    await second.aclose()
+
+
+async def test_multiplexed_health_check_detects_a_dead_session(
+    lock_server: FakeLockServer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator(
+        "postgresql://", lock_connections=1
+    )
+
+    async with coordinator("thread-1"):
+        (connection,) = lock_server.connections
+        connection.fail_next = OSError("server closed the connection")
+        await coordinator.check_sessions()
+
+        assert connection.closed
+        assert coordinator.held_leases == 0
+        assert "postgres.graph_run_leases_lost" in caplog.messages
+        async with coordinator("thread-2"):
+            pass
+
+    assert [connection.closed for connection in lock_server.connections] == [
+        True,
+        False,
+    ]
+    assert lock_server.owners == {}
+    await coordinator.aclose()
+
+
+async def test_multiplexed_health_check_times_out_a_hanging_session(
+    lock_server: FakeLockServer,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator(
+        "postgresql://", lock_connections=1, statement_timeout=0.05
+    )
+
+    async with coordinator("thread-1"):
+        (connection,) = lock_server.connections
+        watch = coordinator.lease_watch("thread-1")
+        assert watch is not None
+        connection.hang = True
+        with fail_after(1):
+            await coordinator.check_sessions()
+            async with coordinator("thread-2"):
+                pass
+
+        assert connection.closed
+        assert watch.lost
+        assert coordinator.held_leases == 0
+
+    assert coordinator.lease_watch("thread-1") is None
+    assert lock_server.owners == {}
+    await coordinator.aclose()
+
+
+async def test_multiplexed_lease_loss_cancels_the_leased_run(
+    lock_server: FakeLockServer,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator(
+        "postgresql://", lock_connections=1, statement_timeout=0.05
+    )
+
+    async with coordinator("thread-1"):
+        watch = coordinator.lease_watch("thread-1")
+        assert watch is not None
+
+        async def lose_session() -> None:
+            await anyio.sleep(0.01)
+            lock_server.connections[0].hang = True
+            await coordinator.check_sessions()
+
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(lose_session)
+            with fail_after(1), pytest.raises(RunLeaseLostError), watch.guard():
+                await anyio.sleep_forever()
+
+    await coordinator.aclose()
+
+
+async def test_multiplexed_acquisition_is_not_interrupted_by_cancellation(
+    lock_server: FakeLockServer,
+) -> None:
+    coordinator = postgres.MultiplexedPostgresRunCoordinator("postgresql://")
+
+    with anyio.CancelScope() as scope:
+        scope.cancel()
+        async with coordinator("thread-1"):
+            await anyio.lowlevel.checkpoint()
+
+    assert lock_server.owners == {}
+    assert coordinator.held_leases == 0
+    await coordinator.aclose()
+
+
+@pytest.mark.parametrize(
+    ("value", "match"),
+    [
+        pytest.param({"lock_connections": 0}, "lock_connections", id="connections"),
+        pytest.param({"health_check_interval": 0}, "health_check", id="interval"),
+    ],
+)
+def test_multiplexed_coordinator_rejects_invalid_settings(
+    value: dict[str, float],
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        postgres.MultiplexedPostgresRunCoordinator("postgresql://", **value)
+
+
+@pytest.mark.parametrize(
+    ("runs", "checkpoint_connections", "expected"),
+    [
+        pytest.param(1, None, (2, 1, 0), id="minimum"),
+        pytest.param(50, None, (13, 50, 0), id="derived"),
+        pytest.param(50, 4, (4, 50, 0), id="override"),
+        pytest.param(64, None, (16, 64, 0), id="largest-pool"),
+        pytest.param(CONCURRENT_LEASES, None, (250, 0, 2), id="multiplexed"),
+    ],
+)
+def test_pool_sizes_follow_worker_concurrency(
+    runs: int,
+    checkpoint_connections: int | None,
+    expected: tuple[int, int, int],
+) -> None:
+    sizes = postgres.PostgresPoolSizes.for_concurrency(
+        runs,
+        checkpoint_connections=checkpoint_connections,
+    )
+
+    assert (sizes.checkpoint, sizes.coordination, sizes.lock) == expected
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        pytest.param({"lock_connections": 4}, (0, 4), id="explicit-lock"),
+        pytest.param({"max_pooled_leases": 8}, (0, 2), id="lower-cap"),
+        pytest.param({"max_pooled_leases": 16}, (16, 0), id="within-cap"),
+    ],
+)
+def test_pool_sizes_multiplex_leases_above_the_pooled_cap(
+    options: dict[str, int],
+    expected: tuple[int, int],
+) -> None:
+    sizes = postgres.PostgresPoolSizes.for_concurrency(16, **options)
+
+    assert (sizes.coordination, sizes.lock) == expected
+
+
+@pytest.mark.parametrize(
+    ("runs", "options", "match"),
+    [
+        pytest.param(0, {}, "max_concurrent_runs", id="runs"),
+        pytest.param(
+            4, {"checkpoint_connections": 0}, "checkpoint_connections", id="checkpoint"
+        ),
+        pytest.param(4, {"lock_connections": 0}, "lock_connections", id="lock"),
+        pytest.param(4, {"max_pooled_leases": 0}, "max_pooled_leases", id="cap"),
+    ],
+)
+def test_pool_sizes_reject_invalid_settings(
+    runs: int,
+    options: dict[str, int],
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        postgres.PostgresPoolSizes.for_concurrency(runs, **options)
+
+
+def test_pool_stats_report_usage_waits_and_timeouts() -> None:
+    pool = Mock(max_size=8)
+    pool.get_stats.return_value = {
+        "pool_max": 8,
+        "pool_size": 5,
+        "pool_available": 2,
+        "requests_waiting": 1,
+        "requests_num": 40,
+        "requests_wait_ms": 1500,
+        "requests_errors": 3,
+    }
+
+    assert postgres.PostgresPoolStats.from_pool(pool) == postgres.PostgresPoolStats(
+        size=5,
+        max_size=8,
+        in_use=3,
+        waiting=1,
+        requests=40,
+        wait_seconds=1.5,
+        checkout_timeouts=3,
+        connections_lost=0,
+    )
+
+
+class FakePool:
+    """Connection pool that records its settings and never connects."""
+
+    close_returns = False
+
+    def __init__(self, **settings: object) -> None:
+        self.settings = settings
+        self.max_size = settings["max_size"]
+        self.closed = False
+        self.waited = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+    async def wait(self, timeout: float) -> None:  # ruff: ignore[async-function-with-timeout]
+        self.waited = timeout > 0
+
+    def get_stats(self) -> dict[str, int]:
+        return {"pool_max": self.max_size, "pool_size": 1, "pool_available": 1}
+
+
+@pytest.fixture
+def fake_pools(monkeypatch: pytest.MonkeyPatch) -> list[FakePool]:
+    pools: list[FakePool] = []
+
+    def create_pool(**settings: object) -> FakePool:
+        pools.append(FakePool(**settings))
+        return pools[-1]
+
+    monkeypatch.setattr(postgres, "AsyncConnectionPool", create_pool)
+    return pools
+
+
+async def test_runtime_splits_checkpoint_and_coordination_pools(
+    fake_pools: list[FakePool],
+) -> None:
+    async with postgres.postgres_runtime(
+        "postgresql://", max_concurrent_runs=8
+    ) as runtime:
+        checkpoint_pool, coordination_pool = fake_pools
+        assert isinstance(runtime.checkpointer, postgres.PostgresCheckpointSaver)
+        assert runtime.checkpointer.conn is checkpoint_pool
+        assert runtime.coordination_pool is coordination_pool
+        assert isinstance(runtime.run_coordinator, postgres.PostgresRunCoordinator)
+        assert [pool.max_size for pool in fake_pools] == [2, 8]
+        assert all(pool.waited for pool in fake_pools)
+        assert all(
+            pool.settings["kwargs"]
+            == {
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": postgres.dict_row,
+            }
+            for pool in fake_pools
+        )
+        assert set(runtime.pool_stats()) == {"checkpoint", "coordination"}
+
+    assert all(pool.closed for pool in fake_pools)
+
+
+async def test_runtime_multiplexes_leases_without_coordination_pool(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_pools: list[FakePool],
+) -> None:
+    aclose = AsyncMock()
+    monkeypatch.setattr(postgres.MultiplexedPostgresRunCoordinator, "aclose", aclose)
+
+    async with postgres.postgres_runtime(
+        "postgresql://", max_concurrent_runs=100, lock_connections=LOCK_CONNECTIONS
+    ) as runtime:
+        assert isinstance(
+            runtime.run_coordinator, postgres.MultiplexedPostgresRunCoordinator
+        )
+        assert runtime.coordination_pool is None
+        assert [pool.max_size for pool in fake_pools] == [25]
+        assert set(runtime.pool_stats()) == {"checkpoint"}
+
+    aclose.assert_awaited_once()
+
+
+async def test_runtime_multiplexes_leases_above_the_pooled_cap(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_pools: list[FakePool],
+) -> None:
+    monkeypatch.setattr(
+        postgres.MultiplexedPostgresRunCoordinator, "aclose", AsyncMock()
+    )
+
+    async with postgres.postgres_runtime(
+        "postgresql://", max_concurrent_runs=CONCURRENT_LEASES
+    ) as runtime:
+        assert isinstance(
+            runtime.run_coordinator, postgres.MultiplexedPostgresRunCoordinator
+        )
+        assert runtime.coordination_pool is None
+        assert [pool.max_size for pool in fake_pools] == [250]
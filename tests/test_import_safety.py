@@ -1,16 +1,19 @@
 """
-Regression coverage for package import configuration sources.
+Regression coverage for package import configuration sources and import cost.
 
-This test uses an isolated subprocess to ensure that merely importing the
+These tests use isolated subprocesses to ensure that merely importing the
 package does not accidentally load a `.env` file from the consumer's current
 working directory (e.g., if `env_file=".env"` is ever accidentally re-added
-to the package's SettingsConfigDict).
+to the package's SettingsConfigDict), and that importing graph configuration
+or event helpers does not load the server's web stack.
 """
 
+import json
 import os
 import subprocess  # ruff: ignore[suspicious-subprocess-import]
 import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -23,9 +26,28 @@ SETTINGS_ENVIRONMENT_VARIABLES = (
     "LANGFUSE_PUBLIC_KEY",
     "LANGFUSE_SECRET_KEY",
 )
-
-
-def _import_settings(
+SERVER_STACK_PACKAGES = (
+    "fastapi",
+    "starlette",
+    "openai",
+    "langgraph",
+    "langchain_core",
+    "pydantic",
+)
+# Budgets leave headroom over the measured cost, so they catch a newly eager
+# import of a heavy dependency rather than ordinary dependency upgrades.
+PACKAGE_IMPORT_MODULE_BUDGET = 30
+PACKAGE_IMPORT_SECONDS_BUDGET = 0.25
+EVENT_HELPERS_MODULE_BUDGET = 400
+GRAPH_CONFIG_MODULE_BUDGET = 1300
+# Heavier imports are budgeted in CPU time, which parallel test workers inflate
+# far less than wall time.
+EVENT_HELPERS_CPU_SECONDS_BUDGET = 0.75
+GRAPH_CONFIG_CPU_SECONDS_BUDGET = 2.5
+
+
+def _run_python(
+    code: str,
     working_directory: Path,
     extra_env: dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
@@ -40,17 +62,8 @@ def _import_settings(
     environment["PYTHONPATH"] = os.pathsep.join(
         part for part in (source_directory, existing_pythonpath) if part
     )
-    return subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            (
-                "from langgraph_openai_serve.core.settings import settings; "
-                "print(settings.OPENAI_API_PREFIX, "
-                "settings.OPENAI_API_DOCS_ENABLED, "
-                "settings.ENABLE_LANGFUSE)"
-            ),
-        ],
+    return subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [sys.executable, "-c", code],
         cwd=working_directory,
         env=environment,
         capture_output=True,
@@ -59,6 +72,53 @@ def _import_settings(
     )
 
 
+def _import_settings(
+    working_directory: Path,
+    extra_env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    return _run_python(
+        (
+            "from langgraph_openai_serve.core.settings import settings; "
+            "print(settings.OPENAI_API_PREFIX, "
+            "settings.OPENAI_API_DOCS_ENABLED, "
+            "settings.ENABLE_LANGFUSE)"
+        ),
+        working_directory,
+        extra_env,
+    )
+
+
+def _measure_import(statement: str, tmp_path: Path) -> dict[str, Any]:
+    result = _run_python(
+        (
+            "import json, sys, time\n"
+            "before = set(sys.modules)\n"
+            "started = time.perf_counter()\n"
+            "cpu_started = time.process_time()\n"
+            f"{statement}\n"
+            "seconds = time.perf_counter() - started\n"
+            "cpu_seconds = time.process_time() - cpu_started\n"
+            "loaded = sorted(set(sys.modules) - before)\n"
+            "print(json.dumps(\n"
+            "    {'seconds': seconds, 'cpu_seconds': cpu_seconds, 'modules': loaded}\n"
+            "))"
+        ),
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def _loaded_packages(modules: list[str]) -> set[str]:
+    return {
+        package
+        for package in SERVER_STACK_PACKAGES
+        if any(
+            module == package or module.startswith(f"{package}.") for module in modules
+        )
+    }
+
+
 def test_package_import_ignores_working_directory_dotenv(tmp_path: Path) -> None:
     (tmp_path / ".env").write_text(
         "LGOS_OPENAI_API_PREFIX=not-a-path\nLGOS_OPENAI_API_DOCS_ENABLED=not-a-boolean\nLGOS_ENABLE_LANGFUSE=true\nLANGFUSE_BASE_URL=not-a-url",
@@ -121,3 +181,44 @@ def test_langfuse_credentials_cannot_be_blank(
         match="LANGFUSE_SECRET_KEY",
     ):
         settings_module.Settings(ENABLE_LANGFUSE=True)
+
+
+def test_package_import_loads_no_dependencies(tmp_path: Path) -> None:
+    loaded = _measure_import("import langgraph_openai_serve", tmp_path)
+
+    assert _loaded_packages(loaded["modules"]) == set()
+    assert len(loaded["modules"]) <= PACKAGE_IMPORT_MODULE_BUDGET
+    assert loaded["seconds"] <= PACKAGE_IMPORT_SECONDS_BUDGET
+
+
+def test_event_helpers_do_not_load_server_stack(tmp_path: Path) -> None:
+    loaded = _measure_import(
+        "from langgraph_openai_serve import ClientSettings, client_event, status_event",
+        tmp_path,
+    )
+
+    assert _loaded_packages(loaded["modules"]) == {"pydantic"}
+    assert len(loaded["modules"]) <= EVENT_HELPERS_MODULE_BUDGET
+    assert loaded["cpu_seconds"] <= EVENT_HELPERS_CPU_SECONDS_BUDGET
+
+
+def test_graph_config_does_not_load_web_stack(tmp_path: Path) -> None:
+    loaded = _measure_import("from langgraph_openai_serve import GraphConfig", tmp_path)
+
+    assert _loaded_packages(loaded["modules"]).isdisjoint(
+        {"fastapi", "starlette", "openai"}
+    )
+    assert "langchain_core.output_parsers" not in loaded["modules"]
+    assert len(loaded["modules"]) <= GRAPH_CONFIG_MODULE_BUDGET
+    assert loaded["cpu_seconds"] <= GRAPH_CONFIG_CPU_SECONDS_BUDGET
+
+
+def test_lazy_exports_resolve_on_access() -> None:
+    import langgraph_openai_serve
+    from langgraph_openai_serve.openai_server import LanggraphOpenaiServe
+
+    assert langgraph_openai_serve.LanggraphOpenaiServe is LanggraphOpenaiServe
+    assert isinstance(langgraph_openai_serve.__version__, str)
+    assert set(langgraph_openai_serve.__all__) <= set(dir(langgraph_openai_serve))
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = langgraph_openai_serve.missing
@@ -0,0 +1,15 @@
+from langgraph_openai_serve.utils.fake_llm import stream_fake_chat_response
+
+
+async def test_fake_response_reports_each_streamed_chunk() -> None:
+    streamed: list[int] = []
+
+    response = await stream_fake_chat_response(
+        "one two three",
+        "prompt",
+        chunk_delay=0.001,
+        on_chunk=streamed.append,
+    )
+
+    assert response == "one two three"
+    assert streamed == [0, 1, 2, 3, 4]
@@ -14,6 +14,7 @@ from langgraph_openai_serve.api.chat.schemas import (
 )
 from langgraph_openai_serve.utils.message import (
     InvalidChatMessageError,
+    MessagePrefixCache,
     convert_to_lc_messages,
 )
 
@@ -207,3 +208,90 @@ def test_tool_message_requires_tool_call_id():
 
 def test_empty_messages_produce_an_empty_list():
     assert convert_to_lc_messages([]) == []
+
+
+def conversation(turns: int) -> list[ChatCompletionRequestMessage]:
+    messages = [ChatCompletionRequestMessage(role=Role.SYSTEM, content="Be brief.")]
+    for turn in range(turns):
+        call_id = f"call_{turn}"
+        messages += [
+            ChatCompletionRequestMessage(role=Role.USER, content=f"Question {turn}"),
+            ChatCompletionRequestMessage(
+                role=Role.ASSISTANT,
+                tool_calls=[
+                    RequestToolCall(
+                        id=call_id,
+                        function=ToolCallFunction(
+                            name="search",
+                            arguments=f'{{"page":{turn}}}',
+                        ),
+                    )
+                ],
+            ),
+            ChatCompletionRequestMessage(
+                role=Role.TOOL,
+                content=f"Result {turn}",
+                tool_call_id=call_id,
+            ),
+        ]
+    return messages
+
+
+def test_prefix_cache_converts_only_appended_messages():
+    cache = MessagePrefixCache(max_bytes=1 << 20)
+    first_turn = conversation(1)
+    second_turn = conversation(2)
+
+    assert cache.convert(first_turn) == convert_to_lc_messages(first_turn)
+    assert cache.convert(second_turn) == convert_to_lc_messages(second_turn)
+    assert cache.convert(second_turn) == convert_to_lc_messages(second_turn)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.reused_messages == len(first_turn) + len(second_turn)
+    assert stats.converted_messages == len(second_turn)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_prefix_cache_returns_copies():
+    cache = MessagePrefixCache(max_bytes=1 << 20)
+    messages = conversation(1)
+    expected = convert_to_lc_messages(messages)
+
+    for result in (cache.convert(messages), cache.convert(messages)):
+        result[0].content = "Be verbose."
+        result[2].additional_kwargs["tool_calls"][0]["id"] = "changed"
+        result[2].tool_calls[0]["args"]["page"] = -1
+        result.append(HumanMessage(content="appended"))
+
+    assert cache.convert(messages) == expected
+
+
+def test_prefix_cache_evicts_least_recent_entries_by_size():
+    first = conversation(1)
+    second = [
+        ChatCompletionRequestMessage(role=Role.USER, content="Another conversation")
+    ]
+    sizes = [
+        sum(len(message.model_dump_json()) for message in messages)
+        for messages in (first, second)
+    ]
+    cache = MessagePrefixCache(max_bytes=sum(sizes) - 1)
+
+    cache.convert(first)
+    cache.convert(second)
+    cache.convert(second)
+    cache.convert(first)
+
+    stats = cache.stats()
+    assert stats.size_bytes == sizes[0]
+    assert (stats.evictions, stats.hits, stats.misses) == (2, 1, 3)
+
+
+def test_disabled_prefix_cache_only_converts():
+    cache = MessagePrefixCache(max_bytes=0)
+    messages = conversation(1)
+
+    assert cache.convert(messages) == convert_to_lc_messages(messages)
+    assert cache.stats().entries == 0
+    assert cache.stats().hit_rate == 0